@@ -0,0 +1,86 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.data import Data
+from hazelcast.serialization.input import _ObjectDataInput
+from hazelcast.serialization.output import _ObjectDataOutput
+from hazelcast.six.moves import range, cPickle
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ARRAY_SIZE = 10000
+ITERATIONS = 200
+
+
+def per_item(out_or_inp, method):
+    # Writes or reads the array one item at a time, as it was done before the bulk paths
+    if isinstance(out_or_inp, _ObjectDataOutput):
+        return lambda val: out_or_inp._write_array_fnc(val, getattr(out_or_inp, method))
+    return lambda: out_or_inp._read_array_fnc(getattr(out_or_inp, method))
+
+
+def bench_array(write_array, read_array, write_item, read_item, value):
+    results = []
+    for bulk in (False, True):
+        out = _ObjectDataOutput(ARRAY_SIZE * 8 + 4, None)
+
+        def write():
+            out.set_position(0)
+            if bulk:
+                getattr(out, write_array)(value)
+            else:
+                per_item(out, write_item)(value)
+
+        write()
+        inp = _ObjectDataInput(out.to_byte_array(), 0)
+
+        def read():
+            inp.set_position(0)
+            if bulk:
+                return getattr(inp, read_array)()
+            return per_item(inp, read_item)()
+
+        results.append(min(timeit.repeat(write, number=ITERATIONS, repeat=3)) / ITERATIONS)
+        results.append(min(timeit.repeat(read, number=ITERATIONS, repeat=3)) / ITERATIONS)
+    return results
+
+
+def bench_numpy():
+    # Compares with the binary pickle, as NumPy arrays cannot be pickled as text
+    config = _Config()
+    config.pickle_protocol = cPickle.HIGHEST_PROTOCOL
+    service = SerializationServiceV1(config)
+    array = numpy.arange(ARRAY_SIZE, dtype=numpy.float64)
+    results = []
+    for serializer in (service._registry._python_serializer, service._registry.serializer_for(array)):
+        data = Data(service._write_with_output(serializer, array, 0))
+        to_data = lambda: service._write_with_output(serializer, array, 0)
+        to_object = lambda: service.to_object(data)
+        results.append(min(timeit.repeat(to_data, number=ITERATIONS, repeat=3)) / ITERATIONS)
+        results.append(min(timeit.repeat(to_object, number=ITERATIONS, repeat=3)) / ITERATIONS)
+    return results
+
+
+if __name__ == '__main__':
+    six.print_("Serializing %d element arrays (microseconds per array)" % ARRAY_SIZE)
+    six.print_("%-10s %14s %14s %14s %14s" % ("type", "write before", "read before", "write after", "read after"))
+    doubles = [float(i) for i in range(ARRAY_SIZE)]
+    longs = list(range(ARRAY_SIZE))
+    for name, args in [("double", ("write_double_array", "read_double_array", "write_double", "read_double", doubles)),
+                       ("long", ("write_long_array", "read_long_array", "write_long", "read_long", longs)),
+                       ("int", ("write_int_array", "read_int_array", "write_int", "read_int", longs))]:
+        six.print_("%-10s %14.1f %14.1f %14.1f %14.1f" % ((name,) + tuple(r * 1e6 for r in bench_array(*args))))
+
+    if numpy is not None:
+        six.print_("%-10s %14.1f %14.1f %14.1f %14.1f" % (("ndarray",) + tuple(r * 1e6 for r in bench_numpy())))
+    else:
+        six.print_("NumPy is not installed, skipping ndarray")
@@ -0,0 +1,57 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.core import HazelcastJsonValue
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.data import Data, DATA_OFFSET
+from hazelcast.serialization.input import _ObjectDataInput
+
+VALUE_SIZES = [100, 10000, 1000000]
+NUMBER = 200
+
+
+class _CopyingInput(_ObjectDataInput):
+    """Reads strings and byte arrays the way it was done before the views."""
+
+    def read_utf(self):
+        length = self.read_int()
+        result = bytearray(length)
+        if length > 0:
+            self.read_into(result, 0, length)
+        return result.decode("utf-8")
+
+    def read_byte_array(self):
+        length = self.read_int()
+        result = bytearray(length)
+        if length > 0:
+            self.read_into(result, 0, length)
+        return result
+
+
+def bench(service, input_class, data):
+    service._create_data_input = lambda d: input_class(d.to_bytes(), DATA_OFFSET, service, service._is_big_endian)
+    return min(timeit.repeat(lambda: service.to_object(data), number=NUMBER, repeat=5)) / NUMBER
+
+
+def received(data):
+    # Data received from the members is a view into the frame it was received in
+    return Data(memoryview(bytearray(data.to_bytes())))
+
+
+if __name__ == '__main__':
+    service = SerializationServiceV1(_Config())
+    six.print_("to_object on Data received from the members (microseconds per call)")
+    six.print_("%-10s %10s %12s %12s" % ("type", "size", "before", "after"))
+    for size in VALUE_SIZES:
+        for name, obj in [("bytearray", bytearray(size)),
+                          ("str", "x" * size),
+                          ("json", HazelcastJsonValue("\"%s\"" % ("x" * (size - 2))))]:
+            data = received(service.to_data(obj))
+            before = bench(service, _CopyingInput, data)
+            after = bench(service, _ObjectDataInput, data)
+            six.print_("%-10s %10d %12.1f %12.1f" % (name, size, before * 1e6, after * 1e6))
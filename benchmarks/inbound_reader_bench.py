@@ -0,0 +1,203 @@
+import io
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.connection import _Reader, _frame_header
+from hazelcast.protocol.builtin import DataCodec, EntryListCodec
+from hazelcast.protocol.client_message import create_initial_buffer, Frame, InboundMessage, REQUEST_HEADER_SIZE, \
+    SIZE_OF_FRAME_LENGTH_AND_FLAGS
+from hazelcast.serialization.data import Data
+from hazelcast.six.moves import range
+
+RECV_SIZE = 128000
+MESSAGE_COUNT = 20
+ENTRY_COUNTS = [10, 1000]
+VALUE_SIZES = [100, 10000]
+SMALL_MESSAGE_COUNT = 5000
+SMALL_VALUE_SIZE = 16
+
+
+class _BytesIOReader(object):
+    """The reader that was used before the receive buffer, with copy accounting."""
+
+    def __init__(self, builder):
+        self._buf = io.BytesIO()
+        self._builder = builder
+        self._bytes_read = 0
+        self._bytes_written = 0
+        self._frame_size = 0
+        self._frame_flags = 0
+        self._message = None
+        self.bytes_copied = 0
+
+    def receive(self, chunk):
+        # recv() returns a new bytes object, which is then copied into the stream
+        data = bytes(chunk)
+        self._buf.seek(self._bytes_written)
+        self._buf.write(data)
+        self._bytes_written += len(data)
+        self.bytes_copied += len(data)
+
+    def process(self):
+        message = self._read_message()
+        while message:
+            self._builder.on_message(message)
+            message = self._read_message()
+
+    def _read_message(self):
+        while True:
+            if self._read_frame():
+                if self._message.end_frame.is_final_frame():
+                    msg = self._message
+                    self._reset()
+                    return msg
+            else:
+                return None
+
+    def _read_frame(self):
+        n = self._bytes_written - self._bytes_read
+        if n < SIZE_OF_FRAME_LENGTH_AND_FLAGS:
+            return False
+        if self._frame_size == 0:
+            self._buf.seek(self._bytes_read)
+            header_data = self._buf.read(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
+            self.bytes_copied += SIZE_OF_FRAME_LENGTH_AND_FLAGS
+            self._frame_size, self._frame_flags = _frame_header.unpack_from(header_data, 0)
+            self._bytes_read += SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        if n < self._frame_size:
+            return False
+        self._buf.seek(self._bytes_read)
+        size = self._frame_size - SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        data = self._buf.read(size)
+        self.bytes_copied += size
+        self._bytes_read += size
+        self._frame_size = 0
+        frame = Frame(data, self._frame_flags)
+        if not self._message:
+            self._message = InboundMessage(frame)
+        else:
+            self._message.add_frame(frame)
+        return True
+
+    def _reset(self):
+        if self._bytes_written == self._bytes_read:
+            self._buf.seek(0)
+            self._buf.truncate()
+            self._bytes_written = 0
+            self._bytes_read = 0
+        self._message = None
+
+
+class _CountingReader(_Reader):
+    def __init__(self, builder):
+        super(_CountingReader, self).__init__(builder)
+        self.bytes_copied = 0
+        self.bytes_allocated = len(self._buf)
+
+    def receive(self, chunk):
+        # Like the reactor, recv_into() writes directly into the receive
+        # buffer, asking for the receive buffer size on each call
+        view = memoryview(chunk)
+        while len(view):
+            buf = self.get_buffer(RECV_SIZE)
+            n = min(len(buf), len(view))
+            buf[:n] = view[:n]
+            self.buffer_updated(n)
+            view = view[n:]
+
+    def _make_room(self, size):
+        self.bytes_copied += self.length
+        buf = self._buf
+        super(_CountingReader, self)._make_room(size)
+        if buf is not self._buf:
+            self.bytes_allocated += len(self._buf)
+
+
+class _Decoder(object):
+    def __init__(self):
+        self.entry_count = 0
+
+    def on_message(self, message):
+        message.next_frame()  # initial frame
+        self.entry_count += len(EntryListCodec.decode(message, DataCodec.decode, DataCodec.decode))
+
+
+def create_stream(entry_count, value_size):
+    buf = create_initial_buffer(REQUEST_HEADER_SIZE, 0, False)
+    entries = [(Data(bytearray(16)), Data(bytearray(value_size))) for _ in range(entry_count)]
+    EntryListCodec.encode(buf, entries, DataCodec.encode, DataCodec.encode, True)
+    return bytes(buf) * MESSAGE_COUNT
+
+
+def run(reader_class, stream):
+    decoder = _Decoder()
+    reader = reader_class(decoder)
+    view = memoryview(stream)
+    for i in range(0, len(stream), RECV_SIZE):
+        reader.receive(view[i:i + RECV_SIZE])
+        reader.process()
+    return reader, decoder
+
+
+class _Retainer(object):
+    def __init__(self):
+        self.messages = []
+
+    def on_message(self, message):
+        self.messages.append(message)
+
+
+def run_small(stream, message_size):
+    # Each small message arrives in its own recv() call, and all of
+    # them are retained, like the values kept in the lazy lists
+    retainer = _Retainer()
+    reader = _CountingReader(retainer)
+    view = memoryview(stream)
+    for i in range(0, len(stream), message_size):
+        reader.receive(view[i:i + message_size])
+        reader.process()
+    assert len(retainer.messages) == SMALL_MESSAGE_COUNT
+    return reader
+
+
+def bench_small():
+    buf = create_initial_buffer(REQUEST_HEADER_SIZE, 0, False)
+    DataCodec.encode(buf, Data(bytearray(SMALL_VALUE_SIZE)), True)
+    stream = bytes(buf) * SMALL_MESSAGE_COUNT
+    reader = run_small(stream, len(buf))
+    elapsed = min(timeit.repeat(lambda: run_small(stream, len(buf)), number=1, repeat=5))
+    return reader.bytes_allocated, elapsed
+
+
+def bench(reader_class, entry_count, value_size):
+    stream = create_stream(entry_count, value_size)
+    reader, decoder = run(reader_class, stream)
+    assert decoder.entry_count == entry_count * MESSAGE_COUNT
+    elapsed = min(timeit.repeat(lambda: run(reader_class, stream), number=1, repeat=5))
+    return reader.bytes_copied // MESSAGE_COUNT, elapsed / MESSAGE_COUNT
+
+
+if __name__ == '__main__':
+    six.print_("Receiving and decoding entry list responses, %d byte recv() calls" % RECV_SIZE)
+    six.print_("%8s %8s %12s | %14s %14s | %12s %12s" % ("entries", "value", "message",
+                                                        "copied before", "copied after",
+                                                        "us before", "us after"))
+    for entry_count in ENTRY_COUNTS:
+        for value_size in VALUE_SIZES:
+            message_size = len(create_stream(entry_count, value_size)) // MESSAGE_COUNT
+            copied_before, elapsed_before = bench(_BytesIOReader, entry_count, value_size)
+            copied_after, elapsed_after = bench(_CountingReader, entry_count, value_size)
+            six.print_("%8d %8d %12d | %14d %14d | %12.1f %12.1f"
+                       % (entry_count, value_size, message_size, copied_before, copied_after,
+                          elapsed_before * 1e6, elapsed_after * 1e6))
+
+    allocated, elapsed = bench_small()
+    six.print_()
+    six.print_("Receiving and retaining %d messages of %d byte values, one recv() call per message"
+               % (SMALL_MESSAGE_COUNT, SMALL_VALUE_SIZE))
+    six.print_("%16s %12s" % ("allocated bytes", "ms"))
+    six.print_("%16d %12.1f" % (allocated, elapsed * 1e3))
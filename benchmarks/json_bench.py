@@ -0,0 +1,81 @@
+import json
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.core import HazelcastJsonValue, OrjsonCodec, orjson
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.serializer import HazelcastJsonValueSerializer
+from hazelcast.six.moves import range
+
+NUMBER = 200
+ACCESS_COUNT = 5
+
+
+def document(record_count):
+    record = {"id": 123456, "name": "John Doe", "email": "john.doe@example.com", "active": True,
+              "score": 98.5, "tags": ["a", "b", "c"], "address": {"city": "Istanbul", "zip": "34000"}}
+    if record_count == 1:
+        return record
+    return {"records": [dict(record, id=i) for i in range(record_count)]}
+
+
+DOCUMENTS = [("small", document(1)), ("medium", document(20)), ("large", document(1000))]
+
+
+class _TextJsonValue(object):
+    """HazelcastJsonValue as it was before, which parses the string on every access."""
+
+    def __init__(self, json_string):
+        self._json_string = json_string
+
+    def to_string(self):
+        return self._json_string
+
+    def loads(self):
+        return json.loads(self._json_string)
+
+
+class _TextJsonValueSerializer(HazelcastJsonValueSerializer):
+    def read(self, inp):
+        return _TextJsonValue(inp.read_utf())
+
+    def write(self, out, obj):
+        out.write_utf(obj.to_string())
+
+
+def pass_through(service, serializer, data):
+    # Reads a value received from the cluster and writes it back, as in a get and put
+    value = serializer.read(service._create_data_input(data))
+    serializer.write(service._create_data_output(), value)
+
+
+def access(service, serializer, data):
+    # Reads a value and accesses its fields a few times
+    value = serializer.read(service._create_data_input(data))
+    for _ in range(ACCESS_COUNT):
+        value.loads()
+
+
+def bench(fn, service, serializer, data):
+    return min(timeit.repeat(lambda: fn(service, serializer, data), number=NUMBER, repeat=5)) / NUMBER
+
+
+if __name__ == '__main__':
+    service = SerializationServiceV1(_Config())
+    serializers = [("before", _TextJsonValueSerializer()), ("after", HazelcastJsonValueSerializer())]
+    if orjson is not None:
+        serializers.append(("orjson", HazelcastJsonValueSerializer(OrjsonCodec())))
+
+    for title, fn in [("Pass through", pass_through), ("Read and %d accesses" % ACCESS_COUNT, access)]:
+        six.print_("%s (microseconds per value)" % title)
+        six.print_("%-8s %10s" % ("document", "bytes") + "".join("%12s" % name for name, _ in serializers))
+        for name, doc in DOCUMENTS:
+            data = service.to_data(HazelcastJsonValue(doc))
+            latencies = [bench(fn, service, serializer, data) * 1e6 for _, serializer in serializers]
+            six.print_("%-8s %10d" % (name, data.total_size()) + "".join("%12.1f" % l for l in latencies))
+        six.print_()
@@ -0,0 +1,49 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config, InMemoryFormat, EvictionPolicy
+from hazelcast.near_cache import NearCache
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.six.moves import range
+
+CACHE_SIZES = [1000, 10000, 100000, 500000]
+INSERT_COUNT = 10000
+POLICIES = [
+    ("LRU", EvictionPolicy.LRU),
+    ("LFU", EvictionPolicy.LFU),
+    ("RANDOM", EvictionPolicy.RANDOM),
+]
+
+
+def fill(policy, size):
+    service = SerializationServiceV1(_Config())
+    near_cache = NearCache("default", service, InMemoryFormat.OBJECT, None, None, True, policy, size)
+    for i in range(size):
+        near_cache[i] = i
+    return near_cache
+
+
+def bench(policy, size):
+    near_cache = fill(policy, size)
+    keys = iter(range(size, size + INSERT_COUNT))
+
+    def insert():
+        key = next(keys)
+        near_cache[key] = key
+
+    # Every insert happens on a full near cache, so each one triggers an eviction
+    elapsed = timeit.timeit(insert, number=INSERT_COUNT)
+    assert near_cache.get_statistics()["evictions"] == INSERT_COUNT
+    return elapsed / INSERT_COUNT
+
+
+if __name__ == '__main__':
+    six.print_("Insert latency into a full near cache (microseconds per insert)")
+    six.print_("%-8s" % "size" + "".join("%12s" % name for name, _ in POLICIES))
+    for size in CACHE_SIZES:
+        latencies = [bench(policy, size) * 1e6 for _, policy in POLICIES]
+        six.print_("%-8d" % size + "".join("%12.2f" % latency for latency in latencies))
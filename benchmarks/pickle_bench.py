@@ -0,0 +1,45 @@
+import array
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.six.moves import cPickle, range
+
+ITERATIONS = 200
+VALUES = [
+    ("small dict", {"name": "value", "count": 12345}),
+    ("float tuple", tuple(float(i) for i in range(10000))),
+    ("float array", array.array("d", range(100000))),
+    ("bytearray", {"payload": bytearray(1000000)}),
+]
+PROTOCOLS = [p for p in (0, 2, 4, 5) if p <= cPickle.HIGHEST_PROTOCOL]
+
+
+def bench(protocol, value):
+    config = _Config()
+    config.pickle_protocol = protocol
+    service = SerializationServiceV1(config)
+    try:
+        data = service.to_data(value)
+    except Exception:
+        return None, None, None
+    to_data = min(timeit.repeat(lambda: service.to_data(value), number=ITERATIONS, repeat=3)) / ITERATIONS
+    to_object = min(timeit.repeat(lambda: service.to_object(data), number=ITERATIONS, repeat=3)) / ITERATIONS
+    return data.total_size(), to_data, to_object
+
+
+if __name__ == '__main__':
+    six.print_("Pickled values per protocol: size in bytes, to_data and to_object latency in microseconds")
+    six.print_("%-12s %9s %12s %12s %12s" % ("value", "protocol", "size", "to_data", "to_object"))
+    for name, value in VALUES:
+        for protocol in PROTOCOLS:
+            size, to_data, to_object = bench(protocol, value)
+            if size is None:
+                six.print_("%-12s %9d %12s" % (name, protocol, "fails"))
+            else:
+                six.print_("%-12s %9d %12d %12.1f %12.1f" % (name, protocol, size, to_data * 1e6, to_object * 1e6))
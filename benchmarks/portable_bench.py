@@ -0,0 +1,107 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1, INT_SIZE_IN_BYTES
+from hazelcast.serialization.api import Portable
+from hazelcast.serialization.portable import serializer
+from hazelcast.serialization.portable.reader import DefaultPortableReader
+from hazelcast.serialization.portable.writer import DefaultPortableWriter
+from hazelcast.six.moves import range
+
+FACTORY_ID = 1
+FIELD_COUNTS = [5, 20, 50]
+NUMBER = 2000
+
+
+def portable_class(class_id, field_count):
+    """Creates a Portable class with fields of the commonly used types."""
+    kinds = [("int", 42), ("long", 1 << 40), ("double", 1.5), ("boolean", True), ("utf", "value")]
+    fields = [("field_%d" % i,) + kinds[i % len(kinds)] for i in range(field_count)]
+
+    class _Portable(Portable):
+        def write_portable(self, writer):
+            for name, kind, value in fields:
+                getattr(writer, "write_" + kind)(name, value)
+
+        def read_portable(self, reader):
+            for name, kind, _ in fields:
+                setattr(self, name, getattr(reader, "read_" + kind)(name))
+
+        def get_factory_id(self):
+            return FACTORY_ID
+
+        def get_class_id(self):
+            return class_id
+
+    return _Portable
+
+
+class _LookupPortableWriter(DefaultPortableWriter):
+    """Writes the fields the way it was done before the plans."""
+
+    def __init__(self, portable_serializer, out, class_definition, plan=None):
+        self._raw = False
+        self._portable_serializer = portable_serializer
+        self._out = out
+        self._class_def = class_definition
+        self._writen_fields = set()
+        self._begin_pos = out.position()
+        for _ in range(4):
+            out.write_byte(0)
+        out.write_int(class_definition.get_field_count())
+        self._offset = out.position()
+        for _ in range((class_definition.get_field_count() + 1) * INT_SIZE_IN_BYTES):
+            out.write_byte(0)
+
+    def _write_fixed_size(self, field_name, field_type, value, write_value):
+        self._set_position(field_name, field_type)
+        write_value(value)
+
+    def _set_position(self, field_name, field_type):
+        fd = self._class_def.get_field(field_name)
+        self._writen_fields.add(field_name)
+        self._out.write_int(self._out.position(), self._offset + fd.index * INT_SIZE_IN_BYTES)
+        self._out.write_short(len(field_name))
+        self._out.write_from(field_name.encode("utf-8"))
+        self._out.write_byte(field_type)
+        return fd
+
+
+class _LookupPortableReader(DefaultPortableReader):
+    """Reads the fields the way it was done before the plans."""
+
+    def _read_position(self, field_name, field_type):
+        return self._read_position_by_field_def(self._class_def.get_field(field_name))
+
+
+def bench(portable, writer_class, reader_class):
+    serializer.DefaultPortableWriter = writer_class
+    serializer.DefaultPortableReader = reader_class
+    try:
+        config = _Config()
+        config.portable_factories = {FACTORY_ID: {portable.get_class_id(): portable.__class__}}
+        service = SerializationServiceV1(config)
+        data = service.to_data(portable)
+        write = min(timeit.repeat(lambda: service.to_data(portable), number=NUMBER, repeat=5)) / NUMBER
+        read = min(timeit.repeat(lambda: service.to_object(data), number=NUMBER, repeat=5)) / NUMBER
+        return data, write, read
+    finally:
+        serializer.DefaultPortableWriter = DefaultPortableWriter
+        serializer.DefaultPortableReader = DefaultPortableReader
+
+
+if __name__ == '__main__':
+    six.print_("Portable serialization (microseconds per object)")
+    six.print_("%8s | %12s %12s | %12s %12s" % ("fields", "write before", "write after", "read before", "read after"))
+    for field_count in FIELD_COUNTS:
+        portable = portable_class(field_count, field_count)()
+        data_before, write_before, read_before = bench(portable, _LookupPortableWriter, _LookupPortableReader)
+        data_after, write_after, read_after = bench(portable, DefaultPortableWriter, DefaultPortableReader)
+        assert data_before == data_after
+        six.print_("%8d | %12.1f %12.1f | %12.1f %12.1f"
+                   % (field_count, write_before * 1e6, write_after * 1e6, read_before * 1e6, read_after * 1e6))
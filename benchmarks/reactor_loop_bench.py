@@ -0,0 +1,59 @@
+import asyncore
+import socket
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.reactor import _WakeableLoop, _SelectorLoop, _SelectorMap
+from hazelcast.six.moves import range
+
+CONNECTION_COUNTS = [1, 10, 100, 500, 1000]
+ITERATIONS = 2000
+LOOPS = [
+    ("asyncore", lambda: _WakeableLoop({})),
+    ("selectors", lambda: _SelectorLoop(_SelectorMap())),
+]
+
+
+class _Dispatcher(asyncore.dispatcher):
+    """Stands for an idle connection, with nothing to write."""
+
+    def writable(self):
+        return False
+
+    def handle_read(self):
+        self.recv(4096)
+
+
+def bench(create_loop, connection_count):
+    loop = create_loop()
+    sockets = []
+    try:
+        for _ in range(connection_count):
+            local, remote = socket.socketpair()
+            sockets.append(remote)
+            _Dispatcher(local, map=loop._map)
+
+        # On each iteration, one of the connections receives a message
+        active = sockets[0]
+
+        def iteration():
+            active.send(b"x")
+            loop.run_loop()
+
+        return timeit.timeit(iteration, number=ITERATIONS) / ITERATIONS
+    finally:
+        loop.shutdown()
+        for s in sockets:
+            s.close()
+
+
+if __name__ == '__main__':
+    six.print_("Loop iteration latency with one active connection (microseconds per iteration)")
+    six.print_("%-12s" % "connections" + "".join("%12s" % name for name, _ in LOOPS))
+    for count in CONNECTION_COUNTS:
+        latencies = [bench(create_loop, count) * 1e6 for _, create_loop in LOOPS]
+        six.print_("%-12d" % count + "".join("%12.1f" % latency for latency in latencies))
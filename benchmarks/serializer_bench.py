@@ -0,0 +1,71 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.api import IdentifiedDataSerializable
+
+ITERATIONS = 50000
+
+
+class _Identified(IdentifiedDataSerializable):
+    def __init__(self, value=0):
+        self.value = value
+
+    def write_data(self, object_data_output):
+        object_data_output.write_int(self.value)
+
+    def read_data(self, object_data_input):
+        self.value = object_data_input.read_int()
+
+    def get_factory_id(self):
+        return 1
+
+    def get_class_id(self):
+        return 1
+
+
+VALUES = [
+    ("str", "key-12345"),
+    ("int", 12345),
+    ("bytes", b"key-12345"),
+    ("bytearray", bytearray(b"key-12345")),
+    ("float", 1.5),
+    ("list", [1, 2, 3]),
+    ("identified", _Identified(12345)),
+    ("pickled dict", {"key": 12345}),
+]
+
+
+class _NoCache(dict):
+    """Serializer cache that never stores anything, to resolve serializers as before."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def create_service(optimized):
+    config = _Config()
+    config.data_serializable_factories = {1: {1: _Identified}}
+    service = SerializationServiceV1(config)
+    if not optimized:
+        service._registry._serializer_cache = _NoCache()
+        service._fast_writers = {}
+    return service
+
+
+def bench(optimized, value):
+    service = create_service(optimized)
+    elapsed = min(timeit.repeat(lambda: service.to_data(value), number=ITERATIONS, repeat=5))
+    return ITERATIONS / elapsed
+
+
+if __name__ == '__main__':
+    six.print_("to_data throughput (objects per second)")
+    six.print_("%-14s %14s %14s" % ("type", "uncached", "cached"))
+    for name, value in VALUES:
+        six.print_("%-14s %14d %14d" % (name, bench(False, value), bench(True, value)))
@@ -0,0 +1,65 @@
+import sys
+import timeit
+from heapq import heappush, heappop
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.reactor import _TimerWheel, Timer
+from hazelcast.six.moves import range
+
+PENDING_COUNTS = [1000, 10000, 100000]
+TIMER_COUNT = 10000
+DELAY = 120  # Like the invocation timeout, most of the timers are canceled long before they expire
+
+
+class _HeapTimers(object):
+    """The timer heap that was used before the timer wheel.
+
+    Canceled timers stay in the heap until their end time.
+    """
+
+    def __init__(self):
+        self._timers = []
+
+    def add(self, timer):
+        heappush(self._timers, (timer.end, timer))
+
+    def remove(self, timer):
+        timer.canceled = True
+
+    def expire(self, now):
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            heappop(timers)
+
+    def __len__(self):
+        return len(self._timers)
+
+
+def bench(timers, pending_count):
+    for i in range(pending_count):
+        timers.add(Timer(DELAY + i * 1e-3, None))
+
+    def add_and_cancel():
+        added = [Timer(DELAY + i * 1e-3, None) for i in range(TIMER_COUNT)]
+        for timer in added:
+            timers.add(timer)
+        timers.expire(1)
+        for timer in added:
+            timers.remove(timer)
+        timers.expire(2)
+
+    elapsed = min(timeit.repeat(add_and_cancel, number=1, repeat=5))
+    return elapsed / TIMER_COUNT, len(timers)
+
+
+if __name__ == '__main__':
+    six.print_("Adding and canceling %d timers (microseconds per timer, timers left behind)" % TIMER_COUNT)
+    six.print_("%-10s %12s %12s %12s %12s" % ("pending", "heap", "heap left", "wheel", "wheel left"))
+    for count in PENDING_COUNTS:
+        heap_latency, heap_left = bench(_HeapTimers(), count)
+        wheel_latency, wheel_left = bench(_TimerWheel(0), count)
+        six.print_("%-10d %12.2f %12d %12.2f %12d"
+                   % (count, heap_latency * 1e6, heap_left, wheel_latency * 1e6, wheel_left))
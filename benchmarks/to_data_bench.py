@@ -0,0 +1,39 @@
+import sys
+import timeit
+from os.path import dirname
+
+sys.path.append(dirname(dirname(__file__)))
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.output import _ObjectDataOutput
+
+VALUE_SIZES = [10, 1000, 10000, 100000]
+ITERATIONS = 20000
+
+
+class _UnpooledSerializationService(SerializationServiceV1):
+    """Allocates a new output for each serialization, as it was done before the pool."""
+
+    def __init__(self, config):
+        super(_UnpooledSerializationService, self).__init__(config)
+        self._output_pool.take = lambda: _ObjectDataOutput(self._output_buffer_size, self, self._is_big_endian)
+        self._output_pool.to_byte_array = lambda out: out.to_byte_array()
+        self._output_pool.give = lambda out: None
+
+
+def bench(service_class, value_size):
+    service = service_class(_Config())
+    value = value_size * "x"
+    iterations = ITERATIONS * 10 // max(value_size // 100, 10)
+    return timeit.timeit(lambda: service.to_data(value), number=iterations) / iterations
+
+
+if __name__ == '__main__':
+    six.print_("to_data latency for string values (microseconds per call)")
+    six.print_("%-8s %12s %12s" % ("size", "unpooled", "pooled"))
+    for size in VALUE_SIZES:
+        unpooled = bench(_UnpooledSerializationService, size) * 1e6
+        pooled = bench(SerializationServiceV1, size) * 1e6
+        six.print_("%-8d %12.2f %12.2f" % (size, unpooled, pooled))
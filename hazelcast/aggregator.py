@@ -0,0 +1,441 @@
+from hazelcast.serialization.api import IdentifiedDataSerializable
+from hazelcast.six.moves import range
+
+AGGREGATOR_FACTORY_ID = -29
+
+_CANONICALIZING_SET_CLASS_ID = 19
+
+
+class Aggregator(object):
+    """Aggregators allow computing a value of some function (e.g sum or max)
+    over the stored map entries. The computation is performed in a fully
+    distributed manner, so no data other than the computed value is
+    transferred to the client, making the computation fast.
+
+    **Attribute Paths**
+
+    The aggregators that accept an attribute path aggregate the values
+    fetched by the given path from the map values. The same attribute path
+    syntax as the predicates is supported, which is explained in the
+    :class:`hazelcast.predicate.Predicate` documentation. When no attribute
+    path is given, the map values themselves are aggregated.
+
+    The entries that do not have the attribute, or have ``None`` as the
+    value of the attribute are skipped by the numeric aggregators.
+    """
+    pass
+
+
+class _AbstractAggregator(IdentifiedDataSerializable, Aggregator):
+    def __init__(self, attribute_path=None):
+        self.attribute_path = attribute_path
+
+    def write_data(self, output):
+        raise NotImplementedError("write_data")
+
+    def read_data(self, object_data_input):
+        pass
+
+    def get_factory_id(self):
+        return AGGREGATOR_FACTORY_ID
+
+    def get_class_id(self):
+        return self.CLASS_ID
+
+    def __repr__(self):
+        return "%s(attribute_path=%s)" % (self.__class__.__name__[1:], self.attribute_path)
+
+
+# The fields written after the attribute path hold the intermediate results
+# on the members. They are always sent as the initial values.
+
+
+class _CountAggregator(_AbstractAggregator):
+    CLASS_ID = 4
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+
+
+class _DistinctValuesAggregator(_AbstractAggregator):
+    CLASS_ID = 5
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_int(0)
+
+
+class _DoubleAverageAggregator(_AbstractAggregator):
+    CLASS_ID = 6
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_double(0)
+        output.write_long(0)
+
+
+class _DoubleSumAggregator(_AbstractAggregator):
+    CLASS_ID = 7
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_double(0)
+
+
+class _FixedPointSumAggregator(_AbstractAggregator):
+    CLASS_ID = 8
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+
+
+class _FloatingPointSumAggregator(_AbstractAggregator):
+    CLASS_ID = 9
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_double(0)
+
+
+class _IntegerAverageAggregator(_AbstractAggregator):
+    CLASS_ID = 10
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+        output.write_long(0)
+
+
+class _IntegerSumAggregator(_AbstractAggregator):
+    CLASS_ID = 11
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+
+
+class _LongAverageAggregator(_AbstractAggregator):
+    CLASS_ID = 12
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+        output.write_long(0)
+
+
+class _LongSumAggregator(_AbstractAggregator):
+    CLASS_ID = 13
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_long(0)
+
+
+class _MaxAggregator(_AbstractAggregator):
+    CLASS_ID = 14
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_object(None)
+
+
+class _MinAggregator(_AbstractAggregator):
+    CLASS_ID = 15
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_object(None)
+
+
+class _NumberAverageAggregator(_AbstractAggregator):
+    CLASS_ID = 16
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+        output.write_double(0)
+        output.write_long(0)
+
+
+class _CanonicalizingHashSet(IdentifiedDataSerializable, set):
+    """The set of distinct values returned from the members."""
+
+    def write_data(self, output):
+        output.write_int(len(self))
+        for value in self:
+            output.write_object(value)
+
+    def read_data(self, object_data_input):
+        count = object_data_input.read_int()
+        for _ in range(count):
+            self.add(object_data_input.read_object())
+
+    def get_factory_id(self):
+        return AGGREGATOR_FACTORY_ID
+
+    def get_class_id(self):
+        return _CANONICALIZING_SET_CLASS_ID
+
+
+AGGREGATOR_FACTORY = {
+    _CANONICALIZING_SET_CLASS_ID: _CanonicalizingHashSet,
+}
+
+
+def count(attribute_path=None):
+    """Creates an aggregator that counts the input values.
+
+    Accepts ``None`` input values and ``None`` extracted values.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **count** aggregator instance, that returns
+        the count of the values as an ``int``.
+    """
+    return _CountAggregator(attribute_path)
+
+
+def distinct(attribute_path=None):
+    """Creates an aggregator that calculates the distinct set of input values.
+
+    Accepts ``None`` input values and ``None`` extracted values.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **distinct** aggregator instance, that returns
+        the distinct values as a ``set``.
+    """
+    return _DistinctValuesAggregator(attribute_path)
+
+
+def double_avg(attribute_path=None):
+    """Creates an aggregator that calculates the average of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``double`` (primitive or boxed) in Java or of a
+    type that can be converted to that. That means, one should be able to
+    use this aggregator with ``float`` values sent from the Python client
+    unless they are out of range for ``double`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **double_avg** aggregator instance, that
+        returns the average as a ``float``.
+    """
+    return _DoubleAverageAggregator(attribute_path)
+
+
+def double_sum(attribute_path=None):
+    """Creates an aggregator that calculates the sum of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``double`` (primitive or boxed) in Java or of a
+    type that can be converted to that. That means, one should be able to
+    use this aggregator with ``float`` values sent from the Python client
+    unless they are out of range for ``double`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **double_sum** aggregator instance, that
+        returns the sum as a ``float``.
+    """
+    return _DoubleSumAggregator(attribute_path)
+
+
+def fixed_point_sum(attribute_path=None):
+    """Creates an aggregator that calculates the sum of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Accepts generic number input values. That means, one should be able to
+    use this aggregator with ``float`` or ``int`` values sent from the Python
+    client unless they are out of range for ``long`` type in Java. The values
+    are converted to ``long`` before being added, so the fractional parts of
+    the ``float`` values are discarded.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **fixed_point_sum** aggregator instance, that
+        returns the sum as an ``int``.
+    """
+    return _FixedPointSumAggregator(attribute_path)
+
+
+def floating_point_sum(attribute_path=None):
+    """Creates an aggregator that calculates the sum of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Accepts generic number input values. That means, one should be able to
+    use this aggregator with ``float`` or ``int`` values sent from the Python
+    client unless they are out of range for ``double`` type in Java. The
+    values are converted to ``double`` before being added.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **floating_point_sum** aggregator instance,
+        that returns the sum as a ``float``.
+    """
+    return _FloatingPointSumAggregator(attribute_path)
+
+
+def int_avg(attribute_path=None):
+    """Creates an aggregator that calculates the average of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``int`` (primitive or boxed) in Java or of a type
+    that can be converted to that. That means, one should be able to use
+    this aggregator with ``int`` values sent from the Python client unless
+    they are out of range for ``int`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **int_avg** aggregator instance, that returns
+        the average as a ``float``.
+    """
+    return _IntegerAverageAggregator(attribute_path)
+
+
+def int_sum(attribute_path=None):
+    """Creates an aggregator that calculates the sum of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``int`` (primitive or boxed) in Java or of a type
+    that can be converted to that. That means, one should be able to use
+    this aggregator with ``int`` values sent from the Python client unless
+    they are out of range for ``int`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **int_sum** aggregator instance, that returns
+        the sum as an ``int``.
+    """
+    return _IntegerSumAggregator(attribute_path)
+
+
+def long_avg(attribute_path=None):
+    """Creates an aggregator that calculates the average of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``long`` (primitive or boxed) in Java or of a type
+    that can be converted to that. That means, one should be able to use
+    this aggregator with ``int`` values sent from the Python client unless
+    they are out of range for ``long`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **long_avg** aggregator instance, that returns
+        the average as a ``float``.
+    """
+    return _LongAverageAggregator(attribute_path)
+
+
+def long_sum(attribute_path=None):
+    """Creates an aggregator that calculates the sum of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should be of type ``long`` (primitive or boxed) in Java or of a type
+    that can be converted to that. That means, one should be able to use
+    this aggregator with ``int`` values sent from the Python client unless
+    they are out of range for ``long`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **long_sum** aggregator instance, that returns
+        the sum as an ``int``.
+    """
+    return _LongSumAggregator(attribute_path)
+
+
+def number_avg(attribute_path=None):
+    """Creates an aggregator that calculates the average of the input values.
+
+    Does NOT accept ``None`` input values or ``None`` extracted values.
+
+    Accepts generic number input values. That means, one should be able to
+    use this aggregator with ``float`` or ``int`` values sent from the Python
+    client unless they are out of range for ``double`` type in Java.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **number_avg** aggregator instance, that
+        returns the average as a ``float``.
+    """
+    return _NumberAverageAggregator(attribute_path)
+
+
+def max_(attribute_path=None):
+    """Creates an aggregator that calculates the max of the input values.
+
+    Accepts ``None`` input values and ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should implement the ``Comparable`` interface in Java. That means,
+    one should be able to use this aggregator with most of the primitive
+    values sent from the Python client, as Java implements this interface
+    for the equivalents of types like ``int``, ``str``, and ``float``.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **max** aggregator instance, that returns
+        the maximum value.
+    """
+    return _MaxAggregator(attribute_path)
+
+
+def min_(attribute_path=None):
+    """Creates an aggregator that calculates the min of the input values.
+
+    Accepts ``None`` input values and ``None`` extracted values.
+
+    Since the server-side implementation is in Java, values stored in the
+    map should implement the ``Comparable`` interface in Java. That means,
+    one should be able to use this aggregator with most of the primitive
+    values sent from the Python client, as Java implements this interface
+    for the equivalents of types like ``int``, ``str``, and ``float``.
+
+    Args:
+        attribute_path (str): Extracts values from this path, if given.
+
+    Returns:
+        Aggregator: The created **min** aggregator instance, that returns
+        the minimum value.
+    """
+    return _MinAggregator(attribute_path)
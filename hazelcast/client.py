@@ -18,7 +18,7 @@ from hazelcast.proxy import ProxyManager, MAP_SERVICE, QUEUE_SERVICE, LIST_SERVI
     TOPIC_SERVICE, RELIABLE_TOPIC_SERVICE, \
     EXECUTOR_SERVICE, PN_COUNTER_SERVICE, FLAKE_ID_GENERATOR_SERVICE
 from hazelcast.near_cache import NearCacheManager
-from hazelcast.reactor import AsyncoreReactor
+from hazelcast.reactor import AsyncoreReactor, AsyncioReactor
 from hazelcast.serialization import SerializationServiceV1
 from hazelcast.statistics import Statistics
 from hazelcast.transaction import TWO_PHASE, TransactionManager
@@ -189,6 +189,22 @@ class HazelcastClient(object):
                     SomeClass: SomeClassSerializer
                 })
 
+        pickle_protocol (int): Pickle protocol used for the objects that are
+            serialized with ``pickle`` because no other serializer is found
+            for them. When set to ``0``, objects are pickled as text, which is
+            the format understood by the older clients. Other protocols write
+            the pickle as raw bytes, which is more compact and faster. With
+            protocol ``5``, large buffers such as ``bytearray`` or NumPy arrays
+            are written out-of-band, without being copied into the pickle.
+            Clients reading such objects must be at least of this version.
+            By default, set to ``0``.
+        json_codec (hazelcast.core.JsonCodec): Codec that parses the
+            :class:`hazelcast.core.HazelcastJsonValue` objects received from
+            the cluster, when their ``loads`` method is called. The values are
+            kept as the received bytes until then, and are parsed only once.
+            :class:`hazelcast.core.OrjsonCodec` can be used for faster
+            parsing, if the ``orjson`` library is installed. By default, the
+            ``json`` module of the standard library is used.
         near_caches (dict[str, dict[str, any]]): Dictionary of near cache
             names and the corresponding near cache configurations as a dictionary.
             The near cache configurations contains the following options.
@@ -210,12 +226,41 @@ class HazelcastClient(object):
               By default, set to ``EvictionPolicy.LRU``.
             - **eviction_max_size** (int): Defines maximum number of entries kept in
               the memory before eviction kicks in. By default, set to ``10000``.
-            - **eviction_sampling_count** (int): Number of random entries that are
-              evaluated to see if some of them are already expired. By default,
-              set to ``8``.
+            - **eviction_sampling_count** (int): Maximum number of entries, starting
+              from the next eviction candidate, that are evaluated to see if some
+              of them are already expired. By default, set to ``8``.
             - **eviction_sampling_pool_size** (int): Size of the pool for eviction
-              candidates. The pool is kept sorted according to the eviction policy.
-              By default, set to ``16``.
+              candidates. Eviction candidates are now tracked in constant time
+              according to the eviction policy, so this option has no effect
+              and is kept for backward compatibility. By default, set to ``16``.
+
+        value_compression (dict[str, dict[str, any]]): Dictionary of map names
+            and the corresponding value compression configurations as a
+            dictionary. Values of these maps whose serialized size is at least
+            the threshold are compressed before they are sent to the cluster,
+            and decompressed transparently when they are read. Compressed
+            values are opaque to the members, so they cannot be queried or
+            indexed. The value compression configurations contains the
+            following options. When an option is missing from the
+            configuration, it will be set to its default value.
+
+            - **threshold** (int): Minimum serialized size of the values, in
+              bytes, to compress. By default, set to ``16384``.
+            - **codec** (hazelcast.serialization.api.CompressionCodec): Codec
+              that compresses the values. By default, values are compressed with
+              :class:`hazelcast.serialization.compression.ZlibCodec`.
+
+        key_caches (dict[str, dict[str, any]]): Dictionary of map names and
+            the corresponding key cache configurations as a dictionary. For
+            these maps, the serialized forms of ``str``, ``bytes`` and ``int``
+            keys, and of tuples of them, are cached, so that hot keys are not
+            serialized and hashed on each call. The key cache configurations
+            contains the following options. When an option is missing from the
+            configuration, it will be set to its default value.
+
+            - **max_size** (int): Maximum number of keys kept in the cache.
+              When the cache is full, the oldest key is evicted. By default,
+              set to ``10000``.
 
         load_balancer (hazelcast.util.LoadBalancer): Load balancer implementation
             for the client
@@ -260,10 +305,12 @@ class HazelcastClient(object):
 
             Time passed since invocation started is compared with this property.
             If the time is already passed, then the exception is delegated to the user.
-            If not, the invocation is retried. Note that, if invocation gets no exception
-            and it is a long running one, then it will not get any exception, no matter
-            how small this timeout is set. Time unit is in seconds. By default,
-            set to ``120.0``.
+            If not, the invocation is retried. Also, if no response is received within
+            this time, the invocation fails with ``OperationTimeoutError``. Operations
+            that might block on the member side, like locks, are not timed out. Some
+            proxy methods, like ``Map.get``, accept a ``timeout`` argument that
+            overrides this property for a single call. Time unit is in seconds.
+            By default, set to ``120.0``.
 
         invocation_retry_pause (float): Pause time between each retry cycle of an
             invocation in seconds. By default, set to ``1.0``.
@@ -290,6 +337,57 @@ class HazelcastClient(object):
             :class:`hazelcast.errors.IndeterminateOperationStateError`. However,
             even if the invocation fails, there will not be any rollback on other
             successful replicas. By default, set to ``False`` (do not fail).
+        event_loop (asyncio.AbstractEventLoop): When set, the client runs all the
+            network I/O and timers on the given asyncio event loop instead of
+            a dedicated reactor thread. The loop must be run by the caller.
+            Futures returned by the client can be awaited by the coroutines
+            running on this loop without any thread hops. As the
+            client blocks while connecting to the cluster, it should be
+            created and shut down outside of the event loop thread, such as
+            with ``loop.run_in_executor``. Not available on Python 2. By default,
+            set to ``None``.
+        reactor_loop (int): Event loop implementation used by the reactor thread.
+            ``ReactorLoop.SELECTORS`` uses epoll or kqueue, if available, and
+            scales better when the client is connected to many members. It
+            requires Python 3.4+, the ``ReactorLoop.ASYNCORE`` loop is used
+            otherwise. Has no effect if ``event_loop`` is set. By default, set
+            to ``ReactorLoop.ASYNCORE``.
+        io_thread_count (int): Number of threads that read from and write to
+            the connections. When set to more than ``1``, each connection is
+            handled by one of these threads, and the timers run on a separate
+            thread. Responses from different members are then received and
+            decoded in parallel, and listeners may be called concurrently
+            from multiple threads. Has no effect if ``event_loop`` is set. By
+            default, set to ``1``, where a single thread handles all the
+            connections and timers.
+        max_concurrent_invocations (int): Maximum number of invocations that
+            can be in flight at the same time. Invocations over this limit are
+            handled according to ``backpressure_policy``. Urgent invocations
+            of the client, like heartbeats, and the invocations made from the
+            reactor threads, like in future callbacks, are never held back.
+            The invocations that may wait on the members for an unbounded
+            time, like queue takes and polls, ringbuffer and event journal
+            reads, lock, semaphore and latch acquisitions, executor tasks and
+            transaction commits, are not counted against this limit.
+            If ``event_loop`` is set, the invocations made from the event loop
+            thread cannot wait for room, so they fail with
+            :class:`hazelcast.errors.HazelcastOverloadError` over this limit,
+            regardless of the ``backpressure_policy``. By default, set to
+            ``-1``, which means there is no limit.
+        max_queued_write_bytes (int): Maximum number of bytes that can wait
+            in the write queue of a connection. Invocations that are sent to
+            a connection over this limit are handled according to
+            ``backpressure_policy``, except that the invocations made from the
+            ``event_loop`` thread fail as described above. By default, set to
+            ``-1``, which means there is no limit.
+        backpressure_policy (int): The way the invocations over
+            ``max_concurrent_invocations`` or ``max_queued_write_bytes`` are
+            handled. See the :class:`hazelcast.config.BackpressurePolicy` for
+            possible values. By default, set to ``BackpressurePolicy.BLOCK``.
+        backpressure_timeout (float): Maximum time in seconds to wait for room
+            when the ``backpressure_policy`` is
+            ``BackpressurePolicy.WAIT_WITH_TIMEOUT``. By default, set to
+            ``10.0``.
     """
 
     _CLIENT_ID = AtomicInteger()
@@ -300,7 +398,7 @@ class HazelcastClient(object):
         self._context = _ClientContext()
         client_id = HazelcastClient._CLIENT_ID.get_and_increment()
         self.name = self._create_client_name(client_id)
-        self._reactor = AsyncoreReactor()
+        self._reactor = self._create_reactor(config)
         self._serialization_service = SerializationServiceV1(config)
         self._near_cache_manager = NearCacheManager(self, self._serialization_service)
         self._internal_lifecycle_service = _InternalLifecycleService(self)
@@ -583,6 +681,30 @@ class HazelcastClient(object):
 
         return self._proxy_manager.get_distributed_objects()
 
+    def get_in_flight_invocation_count(self):
+        """Returns the number of invocations that are in flight, which are invoked but not completed yet.
+
+        If ``max_concurrent_invocations`` is set, only the invocations counted
+        against that limit are returned. Otherwise, all the invocations that
+        are waiting for a response are returned.
+
+        Returns:
+            int: Number of the invocations in flight.
+        """
+        return self._invocation_service.in_flight_count
+
+    def get_queued_write_bytes(self):
+        """Returns the number of bytes waiting in the write queues of the connections of this client.
+
+        The bytes are tracked only when ``max_queued_write_bytes`` is set,
+        so ``0`` is always returned otherwise.
+
+        Returns:
+            int: Total number of bytes waiting to be written to the sockets.
+        """
+        connections = list(six.itervalues(self._connection_manager.active_connections))
+        return sum(connection.queued_write_bytes for connection in connections)
+
     def shutdown(self):
         """Shuts down this HazelcastClient."""
         with self._shutdown_lock:
@@ -625,6 +747,13 @@ class HazelcastClient(object):
         timeout = config.connection_timeout
         return six.MAXSIZE if timeout == 0 else timeout
 
+    @staticmethod
+    def _create_reactor(config):
+        event_loop = config.event_loop
+        if event_loop:
+            return AsyncioReactor(event_loop)
+        return AsyncoreReactor(config.reactor_loop, config.io_thread_count)
+
     @staticmethod
     def _init_load_balancer(config):
         load_balancer = config.load_balancer
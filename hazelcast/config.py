@@ -1,9 +1,18 @@
 import re
 
 from hazelcast import six
+
+try:
+    import asyncio
+except ImportError:
+    # Python2
+    asyncio = None
+
+from hazelcast.core import JsonCodec
 from hazelcast.errors import InvalidConfigurationError
-from hazelcast.serialization.api import StreamSerializer, IdentifiedDataSerializable, Portable
+from hazelcast.serialization.api import StreamSerializer, IdentifiedDataSerializable, Portable, CompressionCodec
 from hazelcast.serialization.portable.classdef import ClassDefinition
+from hazelcast.six.moves import cPickle
 from hazelcast.util import check_not_none, number_types, LoadBalancer, none_type, get_attr_name
 
 
@@ -198,6 +207,46 @@ class ReconnectMode(object):
     """
 
 
+class ReactorLoop(object):
+    """Event loop implementations the client can use for networking."""
+
+    ASYNCORE = 0
+    """
+    Loop based on the asyncore module, which polls all connections on
+    every iteration.
+    """
+
+    SELECTORS = 1
+    """
+    Loop based on the selectors module (epoll or kqueue, if available).
+    Connections are registered once, and are checked for writability only
+    while they have pending writes. Scales better with the number of
+    connections. Requires Python 3.4+.
+    """
+
+
+class BackpressurePolicy(object):
+    """Determines what happens to the invocations that exceed the
+    backpressure limits of the client."""
+
+    BLOCK = 0
+    """
+    Blocks the caller until there is room for the invocation.
+    """
+
+    FAIL_FAST = 1
+    """
+    Fails the invocation with ``HazelcastOverloadError`` immediately.
+    """
+
+    WAIT_WITH_TIMEOUT = 2
+    """
+    Blocks the caller for at most ``backpressure_timeout`` seconds,
+    and fails the invocation with ``HazelcastOverloadError`` if there is
+    still no room for it.
+    """
+
+
 class BitmapIndexOptions(object):
     __slots__ = ("_unique_key", "_unique_key_transformation")
 
@@ -448,12 +497,15 @@ class _Config(object):
                  "_cluster_connect_timeout", "_portable_version", "_data_serializable_factories",
                  "_portable_factories", "_class_definitions", "_check_class_definition_errors",
                  "_is_big_endian", "_default_int_type", "_global_serializer",
-                 "_custom_serializers", "_near_caches", "_load_balancer",
+                 "_custom_serializers", "_pickle_protocol", "_json_codec", "_near_caches",
+                 "_value_compression", "_key_caches", "_load_balancer",
                  "_membership_listeners", "_lifecycle_listeners", "_flake_id_generators",
                  "_labels", "_heartbeat_interval", "_heartbeat_timeout",
                  "_invocation_timeout", "_invocation_retry_pause", "_statistics_enabled",
                  "_statistics_period", "_shuffle_member_list", "_backup_ack_to_client_enabled",
-                 "_operation_backup_timeout", "_fail_on_indeterminate_operation_state")
+                 "_operation_backup_timeout", "_fail_on_indeterminate_operation_state",
+                 "_event_loop", "_reactor_loop", "_io_thread_count", "_max_concurrent_invocations",
+                 "_max_queued_write_bytes", "_backpressure_policy", "_backpressure_timeout")
 
     def __init__(self):
         self._cluster_members = []
@@ -487,7 +539,11 @@ class _Config(object):
         self._default_int_type = IntType.INT
         self._global_serializer = None
         self._custom_serializers = {}
+        self._pickle_protocol = 0
+        self._json_codec = None
         self._near_caches = {}
+        self._value_compression = {}
+        self._key_caches = {}
         self._load_balancer = None
         self._membership_listeners = []
         self._lifecycle_listeners = []
@@ -503,6 +559,13 @@ class _Config(object):
         self._backup_ack_to_client_enabled = True
         self._operation_backup_timeout = 5.0
         self._fail_on_indeterminate_operation_state = False
+        self._event_loop = None
+        self._reactor_loop = ReactorLoop.ASYNCORE
+        self._io_thread_count = 1
+        self._max_concurrent_invocations = -1
+        self._max_queued_write_bytes = -1
+        self._backpressure_policy = BackpressurePolicy.BLOCK
+        self._backpressure_timeout = 10.0
 
     @property
     def cluster_members(self):
@@ -911,6 +974,30 @@ class _Config(object):
         else:
             raise TypeError("custom_serializers must be a dict")
 
+    @property
+    def pickle_protocol(self):
+        return self._pickle_protocol
+
+    @pickle_protocol.setter
+    def pickle_protocol(self, value):
+        if isinstance(value, six.integer_types) and not isinstance(value, bool):
+            if not 0 <= value <= cPickle.HIGHEST_PROTOCOL:
+                raise ValueError("pickle_protocol must be between 0 and %s" % cPickle.HIGHEST_PROTOCOL)
+            self._pickle_protocol = value
+        else:
+            raise TypeError("pickle_protocol must be an int")
+
+    @property
+    def json_codec(self):
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, value):
+        if isinstance(value, JsonCodec):
+            self._json_codec = value
+        else:
+            raise TypeError("json_codec must be a JsonCodec")
+
     @property
     def near_caches(self):
         return self._near_caches
@@ -932,6 +1019,48 @@ class _Config(object):
         else:
             raise TypeError("near_caches must be a dict")
 
+    @property
+    def value_compression(self):
+        return self._value_compression
+
+    @value_compression.setter
+    def value_compression(self, value):
+        if isinstance(value, dict):
+            configs = dict()
+            for name, config in six.iteritems(value):
+                if not isinstance(name, six.string_types):
+                    raise TypeError("Keys of value_compression must be strings")
+
+                if not isinstance(config, dict):
+                    raise TypeError("Values of value_compression must be dict")
+
+                configs[name] = _ValueCompressionConfig.from_dict(config)
+
+            self._value_compression = configs
+        else:
+            raise TypeError("value_compression must be a dict")
+
+    @property
+    def key_caches(self):
+        return self._key_caches
+
+    @key_caches.setter
+    def key_caches(self, value):
+        if isinstance(value, dict):
+            configs = dict()
+            for name, config in six.iteritems(value):
+                if not isinstance(name, six.string_types):
+                    raise TypeError("Keys of key_caches must be strings")
+
+                if not isinstance(config, dict):
+                    raise TypeError("Values of key_caches must be dict")
+
+                configs[name] = _KeyCacheConfig.from_dict(config)
+
+            self._key_caches = configs
+        else:
+            raise TypeError("key_caches must be a dict")
+
     @property
     def load_balancer(self):
         return self._load_balancer
@@ -1140,6 +1269,91 @@ class _Config(object):
         else:
             raise TypeError("fail_on_indeterminate_operation_state must be a boolean")
 
+    @property
+    def event_loop(self):
+        return self._event_loop
+
+    @event_loop.setter
+    def event_loop(self, value):
+        if asyncio and isinstance(value, asyncio.AbstractEventLoop):
+            self._event_loop = value
+        else:
+            raise TypeError("event_loop must be an asyncio event loop")
+
+    @property
+    def reactor_loop(self):
+        return self._reactor_loop
+
+    @reactor_loop.setter
+    def reactor_loop(self, value):
+        if get_attr_name(ReactorLoop, value):
+            self._reactor_loop = value
+        else:
+            raise TypeError("reactor_loop must be a type of ReactorLoop")
+
+    @property
+    def io_thread_count(self):
+        return self._io_thread_count
+
+    @io_thread_count.setter
+    def io_thread_count(self, value):
+        if isinstance(value, six.integer_types):
+            if value < 1:
+                raise ValueError("io_thread_count must be positive")
+            self._io_thread_count = value
+        else:
+            raise TypeError("io_thread_count must be an integer")
+
+    @property
+    def max_concurrent_invocations(self):
+        return self._max_concurrent_invocations
+
+    @max_concurrent_invocations.setter
+    def max_concurrent_invocations(self, value):
+        if isinstance(value, six.integer_types):
+            if value < 1 and value != -1:
+                raise ValueError("max_concurrent_invocations must be positive or -1")
+            self._max_concurrent_invocations = value
+        else:
+            raise TypeError("max_concurrent_invocations must be an integer")
+
+    @property
+    def max_queued_write_bytes(self):
+        return self._max_queued_write_bytes
+
+    @max_queued_write_bytes.setter
+    def max_queued_write_bytes(self, value):
+        if isinstance(value, six.integer_types):
+            if value < 1 and value != -1:
+                raise ValueError("max_queued_write_bytes must be positive or -1")
+            self._max_queued_write_bytes = value
+        else:
+            raise TypeError("max_queued_write_bytes must be an integer")
+
+    @property
+    def backpressure_policy(self):
+        return self._backpressure_policy
+
+    @backpressure_policy.setter
+    def backpressure_policy(self, value):
+        if get_attr_name(BackpressurePolicy, value):
+            self._backpressure_policy = value
+        else:
+            raise TypeError("backpressure_policy must be a type of BackpressurePolicy")
+
+    @property
+    def backpressure_timeout(self):
+        return self._backpressure_timeout
+
+    @backpressure_timeout.setter
+    def backpressure_timeout(self, value):
+        if isinstance(value, number_types):
+            if value < 0:
+                raise ValueError("backpressure_timeout must be non-negative")
+            self._backpressure_timeout = value
+        else:
+            raise TypeError("backpressure_timeout must be a number")
+
     @classmethod
     def from_dict(cls, d):
         config = cls()
@@ -1276,6 +1490,78 @@ class _NearCacheConfig(object):
         return config
 
 
+class _ValueCompressionConfig(object):
+    __slots__ = ("_threshold", "_codec")
+
+    def __init__(self):
+        self._threshold = 16 * 1024
+        self._codec = None
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value):
+        if isinstance(value, six.integer_types):
+            if value < 0:
+                raise ValueError("threshold must be non-negative")
+            self._threshold = value
+        else:
+            raise TypeError("threshold must be an int")
+
+    @property
+    def codec(self):
+        return self._codec
+
+    @codec.setter
+    def codec(self, value):
+        if isinstance(value, CompressionCodec):
+            self._codec = value
+        else:
+            raise TypeError("codec must be a CompressionCodec")
+
+    @classmethod
+    def from_dict(cls, d):
+        config = cls()
+        for k, v in six.iteritems(d):
+            try:
+                config.__setattr__(k, v)
+            except AttributeError:
+                raise InvalidConfigurationError("Unrecognized config option for the value compression: %s" % k)
+        return config
+
+
+class _KeyCacheConfig(object):
+    __slots__ = ("_max_size",)
+
+    def __init__(self):
+        self._max_size = 10000
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        if isinstance(value, six.integer_types):
+            if value < 1:
+                raise ValueError("max_size must be positive")
+            self._max_size = value
+        else:
+            raise TypeError("max_size must be an int")
+
+    @classmethod
+    def from_dict(cls, d):
+        config = cls()
+        for k, v in six.iteritems(d):
+            try:
+                config.__setattr__(k, v)
+            except AttributeError:
+                raise InvalidConfigurationError("Unrecognized config option for the key cache: %s" % k)
+        return config
+
+
 class _FlakeIdGeneratorConfig(object):
     __slots__ = ("_prefetch_count", "_prefetch_validity")
 
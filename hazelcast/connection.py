@@ -4,7 +4,6 @@ import struct
 import sys
 import threading
 import time
-import io
 import uuid
 from collections import OrderedDict
 
@@ -205,6 +204,8 @@ class ConnectionManager(object):
                     self._lifecycle_service.fire_lifecycle_event(LifecycleState.DISCONNECTED)
                     self._trigger_cluster_reconnection()
 
+        self._invocation_service.on_connection_close(closed_connection)
+
         if connection:
             for _, on_connection_closed in self._connection_listeners:
                 if on_connection_closed:
@@ -539,22 +540,77 @@ class _HeartbeatManager(object):
 
 
 _frame_header = struct.Struct('<iH')
+_READ_BUFFER_SIZE = 128000
 
 
 class _Reader(object):
-    def __init__(self, builder):
-        self._buf = io.BytesIO()
+    """Assembles inbound client messages from the bytes received on a connection.
+
+    Bytes are received directly into a bytearray via ``get_buffer`` and
+    ``buffer_updated``, and large frames are handed out as memoryview slices
+    of it, so their bodies are never copied on Python 3. Since these slices
+    may outlive the message, a buffer is never overwritten once a frame is
+    handed out from it. Instead, the bytes are received into its free tail,
+    and a new buffer is allocated only when it is full or the frame being
+    received does not fit into it. Then, only the bytes of the partially
+    received frame are moved into the new buffer.
+
+    Frames smaller than a sixteenth of the buffer size are copied out, so
+    that a small retained value cannot keep a whole buffer alive, and the
+    buffer is reused in place while only small frames are received. On
+    Python 2, all the frames are copied out.
+    """
+
+    _zero_copy = six.PY3
+
+    def __init__(self, builder, buffer_size=_READ_BUFFER_SIZE):
         self._builder = builder
+        self._buffer_size = buffer_size
+        self._min_view_size = buffer_size // 16
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._exported = False
         self._bytes_read = 0
         self._bytes_written = 0
         self._frame_size = 0
         self._frame_flags = 0
         self._message = None
 
+    def get_buffer(self, size):
+        """Returns a writable view that the next received bytes should be
+        written into.
+
+        The view might be smaller than ``size``, when the free tail of a
+        buffer that frames are handed out from is used.
+
+        Args:
+            size (int): Maximum number of bytes that will be written.
+
+        Returns:
+            memoryview: Writable view at the end of the received bytes.
+        """
+        free = len(self._buf) - self._bytes_written
+        if free < size and (not self._exported or free == 0
+                            or self._bytes_read + self._frame_size > len(self._buf)):
+            self._make_room(size)
+            free = len(self._buf) - self._bytes_written
+        return self._view[self._bytes_written:self._bytes_written + min(size, free)]
+
+    def buffer_updated(self, n):
+        """Marks ``n`` bytes written into the view returned from the last
+        ``get_buffer`` call as received.
+
+        Args:
+            n (int): Number of bytes written.
+        """
+        self._bytes_written += n
+
     def read(self, data):
-        self._buf.seek(self._bytes_written)
-        self._buf.write(data)
-        self._bytes_written += len(data)
+        n = len(data)
+        if len(self._buf) - self._bytes_written < n:
+            self._make_room(n)
+        self._view[self._bytes_written:self._bytes_written + n] = data
+        self._bytes_written += n
 
     def process(self):
         message = self._read_message()
@@ -567,7 +623,7 @@ class _Reader(object):
             if self._read_frame():
                 if self._message.end_frame.is_final_frame():
                     msg = self._message
-                    self._reset()
+                    self._message = None
                     return msg
             else:
                 return None
@@ -584,10 +640,14 @@ class _Reader(object):
         if n < self._frame_size:
             return False
 
-        self._buf.seek(self._bytes_read)
-        size = self._frame_size - SIZE_OF_FRAME_LENGTH_AND_FLAGS
-        data = self._buf.read(size)
-        self._bytes_read += size
+        start = self._bytes_read + SIZE_OF_FRAME_LENGTH_AND_FLAGS
+        end = self._bytes_read + self._frame_size
+        if self._zero_copy and end - start >= self._min_view_size:
+            data = self._view[start:end]
+            self._exported = True
+        else:
+            data = self._view[start:end].tobytes()
+        self._bytes_read = end
         self._frame_size = 0
         # No need to reset flags since it will be overwritten on the next read_frame_size_and_flags call
         frame = Frame(data, self._frame_flags)
@@ -598,18 +658,25 @@ class _Reader(object):
         return True
 
     def _read_frame_size_and_flags(self):
-        self._buf.seek(self._bytes_read)
-        header_data = self._buf.read(SIZE_OF_FRAME_LENGTH_AND_FLAGS)
-        self._frame_size, self._frame_flags = _frame_header.unpack_from(header_data, 0)
-        self._bytes_read += SIZE_OF_FRAME_LENGTH_AND_FLAGS
-
-    def _reset(self):
-        if self._bytes_written == self._bytes_read:
-            self._buf.seek(0)
-            self._buf.truncate()
-            self._bytes_written = 0
-            self._bytes_read = 0
-        self._message = None
+        self._frame_size, self._frame_flags = _frame_header.unpack_from(self._buf, self._bytes_read)
+
+    def _make_room(self, size):
+        pending = self.length
+        # Make sure that the rest of the frame being received fits into
+        # the buffer, so that large frames do not cause repeated moves.
+        required = pending + max(size, self._frame_size - pending)
+        if self._exported or len(self._buf) < required:
+            buf = bytearray(max(self._buffer_size, required))
+            buf[:pending] = self._view[self._bytes_read:self._bytes_written]
+            self._buf = buf
+            self._view = memoryview(buf)
+            self._exported = False
+        elif pending:
+            # Slicing the bytearray copies the pending bytes first, which
+            # is required as the source and destination may overlap
+            self._buf[:pending] = self._buf[self._bytes_read:self._bytes_written]
+        self._bytes_read = 0
+        self._bytes_written = pending
 
     @property
     def length(self):
@@ -635,6 +702,44 @@ class Connection(object):
         self._id = connection_id
         self._builder = ClientMessageBuilder(message_callback)
         self._reader = _Reader(self._builder)
+        # Queued bytes are tracked only when max_queued_write_bytes is set
+        self._track_queued_write_bytes = False
+        self._queued_write_bytes = 0
+        self._write_condition = threading.Condition(threading.Lock())
+
+    @property
+    def queued_write_bytes(self):
+        """int: Number of bytes that are waiting to be written to the socket.
+        Always ``0`` if ``max_queued_write_bytes`` is not set."""
+        return self._queued_write_bytes
+
+    def wait_for_write_capacity(self, max_bytes, timeout=None):
+        """Waits until the number of queued bytes drops below the given limit.
+
+        Args:
+            max_bytes (int): Maximum number of queued bytes.
+            timeout (float): Maximum time in seconds to wait. Waits until
+                there is capacity if not provided.
+
+        Returns:
+            bool: ``False`` if the timeout elapsed before there is capacity,
+            ``True`` otherwise. Also returns ``True`` if the connection is
+            closed, as nothing will be written to it anymore.
+        """
+        with self._write_condition:
+            if timeout is not None:
+                end = time.time() + timeout
+
+            while self.live and self._queued_write_bytes >= max_bytes:
+                if timeout is None:
+                    self._write_condition.wait()
+                else:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        return False
+                    self._write_condition.wait(remaining)
+
+            return True
 
     def send_message(self, message):
         """Sends a message to this connection.
@@ -663,6 +768,9 @@ class Connection(object):
 
         self.live = False
         self.close_reason = reason
+        with self._write_condition:
+            # Writers waiting for capacity should not wait anymore
+            self._write_condition.notify_all()
         self._log_close(reason, cause)
         try:
             self._inner_close()
@@ -690,6 +798,21 @@ class Connection(object):
     def _write(self, buf):
         raise NotImplementedError()
 
+    def _on_write_queued(self, length):
+        if not self._track_queued_write_bytes:
+            return
+
+        with self._write_condition:
+            self._queued_write_bytes += length
+
+    def _on_write_flushed(self, length):
+        if not self._track_queued_write_bytes:
+            return
+
+        with self._write_condition:
+            self._queued_write_bytes -= length
+            self._write_condition.notify_all()
+
     def __eq__(self, other):
         return isinstance(other, Connection) and self._id == other._id
 
@@ -5,6 +5,11 @@ from hazelcast import six
 from hazelcast.six.moves import range
 from hazelcast import util
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CLIENT_TYPE = "PYH"
 SERIALIZATION_VERSION = 1
 
@@ -260,6 +265,74 @@ class SimpleEntryView(object):
                   self.ttl, self.max_idle)
 
 
+class JsonCodec(object):
+    """A base class for the codecs that convert the values of
+    :class:`HazelcastJsonValue` objects to and from JSON.
+
+    See the ``json_codec`` option of the client.
+    """
+
+    def dumps(self, obj):
+        """Converts the object to JSON.
+
+        Args:
+            obj: JSON serializable object.
+
+        Returns:
+            str or bytes: The JSON string, or its UTF-8 encoding.
+        """
+        raise NotImplementedError("dumps method must be implemented")
+
+    def loads(self, buf):
+        """Parses the JSON string.
+
+        Args:
+            buf (str or bytes or bytearray): The JSON string, or its UTF-8 encoding.
+
+        Returns:
+            any: The Python object represented by the JSON string.
+        """
+        raise NotImplementedError("loads method must be implemented")
+
+
+class StandardJsonCodec(JsonCodec):
+    """Converts the values to and from JSON with the ``json`` module of the standard library.
+
+    This is the default codec.
+    """
+
+    def dumps(self, obj):
+        return json.dumps(obj)
+
+    def loads(self, buf):
+        if isinstance(buf, bytearray) or (six.PY3 and isinstance(buf, bytes)):
+            buf = buf.decode("utf-8")
+        return json.loads(buf)
+
+
+class OrjsonCodec(JsonCodec):
+    """Converts the values to and from JSON with the `orjson <https://pypi.org/project/orjson/>`_
+    library, which is considerably faster than the ``json`` module of the standard library.
+
+    orjson does not support Python 2 and must be installed separately.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson must be installed to use the OrjsonCodec")
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, buf):
+        return orjson.loads(buf)
+
+
+_DEFAULT_JSON_CODEC = StandardJsonCodec()
+
+_NOT_PARSED = object()
+
+
 class HazelcastJsonValue(object):
     """HazelcastJsonValue is a wrapper for JSON formatted strings.
 
@@ -281,16 +354,37 @@ class HazelcastJsonValue(object):
     HazelcastJsonValue can also be constructed from JSON serializable objects.
     In that case, objects are converted to JSON strings and stored as such.
     If an error occurs during the conversion, it is raised directly.
+
+    HazelcastJsonValue can also be constructed from the UTF-8 encoded bytes of
+    a JSON string. Values received from the cluster are constructed that way,
+    so that the values that are only passed through are never decoded or
+    parsed.
     
     None values are not allowed.
+
+    Args:
+        value (str or bytes or bytearray or any): JSON string, its UTF-8 encoding or
+            a JSON serializable object.
+        codec (JsonCodec): The codec that converts the objects to and from JSON.
+            When not given, the ``json`` module of the standard library is used.
     """
 
-    def __init__(self, value):
+    def __init__(self, value, codec=None):
         util.check_not_none(value, "JSON string or the object cannot be None.")
+        self._codec = codec or _DEFAULT_JSON_CODEC
+        self._json_string = None
+        self._json_bytes = None
+        self._value = _NOT_PARSED
         if isinstance(value, six.string_types):
             self._json_string = value
+        elif isinstance(value, (bytes, bytearray)):
+            self._json_bytes = value
         else:
-            self._json_string = json.dumps(value)
+            dumped = self._codec.dumps(value)
+            if isinstance(dumped, six.string_types):
+                self._json_string = dumped
+            else:
+                self._json_bytes = dumped
 
     def to_string(self):
         """Returns unaltered string that was used to create this object.
@@ -298,19 +392,44 @@ class HazelcastJsonValue(object):
         Returns:
             str: The original string.
         """
+        if self._json_string is None:
+            self._json_string = self._json_bytes.decode("utf-8")
         return self._json_string
 
+    def to_bytes(self):
+        """Returns the UTF-8 encoding of the string that was used to create this object.
+
+        Returns:
+            bytes or bytearray: The encoded string.
+        """
+        if self._json_bytes is None:
+            return self._json_string.encode("utf-8")
+        return self._json_bytes
+
     def loads(self):
         """Deserializes the string that was used to create this object
         and returns as Python object.
+
+        The string is parsed on the first call, and the same object is returned
+        from the subsequent calls. Hence, the returned object should not be
+        modified.
         
         Returns:
             any: The Python object represented by the original string.
         """
-        return json.loads(self._json_string)
+        if self._value is _NOT_PARSED:
+            if self._json_string is None:
+                self._value = self._codec.loads(self._json_bytes)
+            else:
+                self._value = self._codec.loads(self._json_string)
+        return self._value
 
     def __eq__(self, other):
-        return isinstance(other, HazelcastJsonValue) and self._json_string == other._json_string
+        if not isinstance(other, HazelcastJsonValue):
+            return False
+        if self._json_bytes is not None and other._json_bytes is not None:
+            return self._json_bytes == other._json_bytes
+        return self.to_string() == other.to_string()
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -5,6 +5,15 @@ import threading
 from hazelcast.util import AtomicInteger
 from hazelcast import six
 
+try:
+    import asyncio
+except ImportError:
+    # Python2
+    asyncio = None
+
+# Python 3.7+
+_get_running_loop = getattr(asyncio, "get_running_loop", None)
+
 _logger = logging.getLogger(__name__)
 NONE_RESULT = object()
 
@@ -154,6 +163,16 @@ class Future(object):
         self.add_done_callback(callback)
         return future
 
+    def __await__(self):
+        """Makes the Future awaitable from the coroutines running on an asyncio event loop.
+
+        When the Future is completed on the thread running the event loop, as it is
+        the case with the :class:`hazelcast.reactor.AsyncioReactor`, the result is
+        passed to the awaiting coroutine without any thread hops. Otherwise, the
+        result is passed to the event loop in a thread-safe manner.
+        """
+        return _to_asyncio_future(self).__await__()
+
     def _chain(self, chained_future):
         def callback(f):
             try:
@@ -249,6 +268,46 @@ class ImmediateExceptionFuture(Future):
         self._invoke_cb(callback)
 
 
+def _is_loop_thread(loop):
+    """Returns ``True`` if the given asyncio event loop is running on the current thread."""
+    if _get_running_loop is not None:
+        try:
+            return _get_running_loop() is loop
+        except RuntimeError:
+            # No running loop
+            return False
+
+    # Before Python 3.7, there is no public way to get the running loop,
+    # so only the loops of the asyncio reactors, marked on their threads, are known.
+    return getattr(Future._threading_locals, "asyncio_loop", None) is loop
+
+
+def _to_asyncio_future(future):
+    loop = asyncio.get_event_loop()
+    asyncio_future = asyncio.Future(loop=loop)
+
+    def callback(f):
+        if _is_loop_thread(loop):
+            _copy_future_state(f, asyncio_future)
+        else:
+            loop.call_soon_threadsafe(_copy_future_state, f, asyncio_future)
+
+    future.add_done_callback(callback)
+    return asyncio_future
+
+
+def _copy_future_state(future, asyncio_future):
+    if asyncio_future.done():
+        # Cancelled by the awaiting coroutine
+        return
+
+    exception = future.exception()
+    if exception:
+        asyncio_future.set_exception(exception)
+    else:
+        asyncio_future.set_result(future.result())
+
+
 def combine_futures(futures):
     """Combines set of Futures.
 
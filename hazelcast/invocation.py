@@ -1,10 +1,12 @@
 import logging
+import threading
 import time
 import functools
 
+from hazelcast.config import BackpressurePolicy
 from hazelcast.errors import create_error_from_message, HazelcastInstanceNotActiveError, is_retryable_error, \
     TargetDisconnectedError, HazelcastClientNotActiveError, TargetNotMemberError, \
-    EXCEPTION_MESSAGE_TYPE, IndeterminateOperationStateError, OperationTimeoutError
+    EXCEPTION_MESSAGE_TYPE, IndeterminateOperationStateError, OperationTimeoutError, HazelcastOverloadError
 from hazelcast.future import Future
 from hazelcast.protocol.codec import client_local_backup_listener_codec
 from hazelcast.util import AtomicInteger
@@ -12,6 +14,13 @@ from hazelcast import six
 
 _logger = logging.getLogger(__name__)
 
+# Returned for the invocations that are not held back for room
+_NO_HOLD_BACK = object()
+
+# Guards the completed flags of the invocations. It is held only to
+# check and set a flag, so a single lock is shared by all of them.
+_completion_lock = threading.Lock()
+
 
 def _no_op_response_handler(_):
     pass
@@ -20,10 +29,12 @@ def _no_op_response_handler(_):
 class Invocation(object):
     __slots__ = ("request", "timeout", "partition_id", "uuid", "connection", "event_handler",
                  "future", "sent_connection", "urgent", "response_handler", "backup_acks_received",
-                 "backup_acks_expected", "pending_response", "pending_response_received_time")
+                 "backup_acks_expected", "pending_response", "pending_response_received_time", "deadline_timer",
+                 "backup_timer", "in_flight", "count_in_flight", "completed")
 
     def __init__(self, request, partition_id=-1, uuid=None, connection=None,
-                 event_handler=None, urgent=False, timeout=None, response_handler=_no_op_response_handler):
+                 event_handler=None, urgent=False, timeout=None, response_handler=_no_op_response_handler,
+                 count_in_flight=True):
         self.request = request
         self.partition_id = partition_id
         self.uuid = uuid
@@ -32,28 +43,61 @@ class Invocation(object):
         self.urgent = urgent
         self.timeout = timeout
         self.future = Future()
-        self.timeout = None
         self.sent_connection = None
         self.response_handler = response_handler
         self.backup_acks_received = 0
         self.backup_acks_expected = -1
         self.pending_response = None
         self.pending_response_received_time = -1
+        self.deadline_timer = None
+        self.backup_timer = None
+        self.in_flight = False
+        # Long polls that park on the member until there is something to
+        # return are not counted against max_concurrent_invocations
+        self.count_in_flight = count_in_flight
+        self.completed = False
+
+    def claim_completion(self):
+        """Claims the right to complete this invocation.
+
+        The response, the deadline timer and the errors might race to
+        complete the invocation on different threads. Only the first one
+        to claim it completes the invocation.
+
+        Returns:
+            bool: ``True`` if the caller should complete the invocation,
+            ``False`` if it is already claimed.
+        """
+        with _completion_lock:
+            if self.completed:
+                return False
+            self.completed = True
+            return True
 
     def set_response(self, response):
+        if self.claim_completion():
+            self.resolve(response)
+
+    def set_exception(self, exception, traceback=None):
+        if self.claim_completion():
+            self.reject(exception, traceback)
+
+    def resolve(self, response):
+        """Completes the future with the handled response. The caller must
+        have claimed the completion."""
         try:
             result = self.response_handler(response)
             self.future.set_result(result)
         except Exception as e:
             self.future.set_exception(e)
 
-    def set_exception(self, exception, traceback=None):
+    def reject(self, exception, traceback=None):
+        """Completes the future with the error. The caller must have
+        claimed the completion."""
         self.future.set_exception(exception, traceback)
 
 
 class InvocationService(object):
-    _CLEAN_RESOURCES_PERIOD = 0.1
-
     def __init__(self, client, reactor):
         config = client.config
         smart_routing = config.smart_routing
@@ -69,6 +113,8 @@ class InvocationService(object):
         self._listener_service = None
         self._check_invocation_allowed_fn = None
         self._pending = {}
+        # Connection to the pending invocations sent to it, keyed by their correlation ids
+        self._connection_invocations = {}
         self._next_correlation_id = AtomicInteger(1)
         self._is_redo_operation = config.redo_operation
         self._invocation_timeout = config.invocation_timeout
@@ -76,8 +122,16 @@ class InvocationService(object):
         self._backup_ack_to_client_enabled = smart_routing and config.backup_ack_to_client_enabled
         self._fail_on_indeterminate_state = config.fail_on_indeterminate_operation_state
         self._backup_timeout = config.operation_backup_timeout
-        self._clean_resources_timer = None
+        self._max_concurrent_invocations = config.max_concurrent_invocations
+        self._max_queued_write_bytes = config.max_queued_write_bytes
+        self._backpressure_policy = config.backpressure_policy
+        self._backpressure_timeout = config.backpressure_timeout
+        self._in_flight_count = 0
+        self._in_flight_condition = threading.Condition(threading.Lock())
         self._shutdown = False
+        # Responses, backup acks and backup timeouts of an invocation might be
+        # handled concurrently, on different I/O threads and the timer thread.
+        self._backup_lock = threading.Lock()
 
     def init(self, partition_service, connection_manager, listener_service):
         self._partition_service = partition_service
@@ -85,8 +139,18 @@ class InvocationService(object):
         self._listener_service = listener_service
         self._check_invocation_allowed_fn = connection_manager.check_invocation_allowed
 
+    @property
+    def in_flight_count(self):
+        """int: Number of invocations counted in flight, that are invoked but not completed yet.
+
+        Invocations are counted only when ``max_concurrent_invocations`` is set.
+        Otherwise, the number of invocations waiting for a response is returned.
+        """
+        if self._max_concurrent_invocations > 0:
+            return self._in_flight_count
+        return len(self._pending)
+
     def start(self):
-        self._start_clean_resources_timer()
         if self._backup_ack_to_client_enabled:
             self._register_backup_listener()
 
@@ -110,8 +174,23 @@ class InvocationService(object):
         self._notify(invocation, message)
 
     def invoke(self, invocation):
-        if not invocation.timeout:
-            invocation.timeout = self._invocation_timeout + time.time()
+        if not self._acquire_in_flight_slot(invocation):
+            error = HazelcastOverloadError("Maximum number of concurrent invocations (%s) is reached"
+                                           % self._max_concurrent_invocations)
+            invocation.set_exception(error)
+            return
+
+        timeout = invocation.timeout
+        if timeout is None:
+            timeout = self._invocation_timeout
+
+        # From now on, the timeout of the invocation is the deadline
+        invocation.timeout = timeout + time.time()
+        if timeout < six.MAXSIZE:
+            # Infinite timeouts are used for the operations that might block
+            # on the member side, like locks. They are not timed out.
+            deadline_handler = functools.partial(self._notify_deadline, invocation, timeout)
+            invocation.deadline_timer = self._reactor.add_timer(timeout, deadline_handler)
 
         correlation_id = self._next_correlation_id.get_and_increment()
         request = invocation.request
@@ -124,11 +203,27 @@ class InvocationService(object):
             return
 
         self._shutdown = True
-        if self._clean_resources_timer:
-            self._clean_resources_timer.cancel()
+        with self._in_flight_condition:
+            # Wake up the callers waiting for room
+            self._in_flight_condition.notify_all()
+
         for invocation in list(six.itervalues(self._pending)):
             self._notify_error(invocation, HazelcastClientNotActiveError())
 
+    def on_connection_close(self, connection):
+        """Notifies the invocations sent to the closed connection.
+
+        Args:
+            connection (hazelcast.connection.Connection): The closed connection.
+        """
+        invocations = self._connection_invocations.pop(connection, None)
+        if not invocations:
+            return
+
+        error = TargetDisconnectedError(connection.close_reason)
+        for invocation in list(six.itervalues(invocations)):
+            self._notify_error(invocation, error)
+
     def _invoke_on_partition_owner(self, invocation, partition_id):
         owner_uuid = self._partition_service.get_partition_owner(partition_id)
         if not owner_uuid:
@@ -201,21 +296,52 @@ class InvocationService(object):
         if self._backup_ack_to_client_enabled:
             invocation.request.set_backup_aware_flag()
 
+        max_queued_write_bytes = self._max_queued_write_bytes
+        if max_queued_write_bytes > 0 and connection.queued_write_bytes >= max_queued_write_bytes:
+            timeout = self._get_hold_back_timeout(invocation)
+            if timeout is not _NO_HOLD_BACK \
+                    and not connection.wait_for_write_capacity(max_queued_write_bytes, timeout):
+                raise HazelcastOverloadError("Maximum number of queued write bytes (%s) is reached for %s"
+                                             % (max_queued_write_bytes, connection))
+
         message = invocation.request
         correlation_id = message.get_correlation_id()
         self._pending[correlation_id] = invocation
 
+        # Indexed before sending, so that either the connection
+        # is seen as closed below, or the invocation is notified
+        # when the connection is closed.
+        self._untrack_connection(invocation)
+        invocations = self._connection_invocations.get(connection, None)
+        if invocations is None:
+            invocations = self._connection_invocations.setdefault(connection, {})
+        invocations[correlation_id] = invocation
+        invocation.sent_connection = connection
+
         if invocation.event_handler:
             self._listener_service.add_event_handler(correlation_id, invocation.event_handler)
 
         if not connection.send_message(message):
             if invocation.event_handler:
                 self._listener_service.remove_event_handler(correlation_id)
+            self._untrack_connection(invocation)
             return False
 
-        invocation.sent_connection = connection
         return True
 
+    def _untrack_connection(self, invocation):
+        connection = invocation.sent_connection
+        if not connection:
+            return
+
+        invocation.sent_connection = None
+        invocations = self._connection_invocations.get(connection, None)
+        if invocations is not None:
+            invocations.pop(invocation.request.get_correlation_id(), None)
+            if not invocations and not connection.live:
+                # Might be added after the connection is closed
+                self._connection_invocations.pop(connection, None)
+
     def _notify_error(self, invocation, error):
         _logger.debug("Got exception for request %s, error: %s", invocation.request, error)
 
@@ -234,9 +360,30 @@ class InvocationService(object):
             self._complete_with_error(invocation, error)
             return
 
-        invoke_func = functools.partial(self._do_invoke, invocation)
+        invoke_func = functools.partial(self._retry, invocation)
         self._reactor.add_timer(self._invocation_retry_pause, invoke_func)
 
+    def _retry(self, invocation):
+        if invocation.completed:
+            # Timed out while waiting for the retry
+            return
+
+        self._do_invoke(invocation)
+
+    def _notify_deadline(self, invocation, timeout):
+        if invocation.completed:
+            return
+
+        if invocation.pending_response:
+            # The response is received, and the invocation is waiting
+            # for the backup acks. It will be completed on the backup
+            # timeout at the latest.
+            return
+
+        error = OperationTimeoutError("Request timed out because no response is received "
+                                      "in %s seconds: %s" % (timeout, invocation.request))
+        self._complete_with_error(invocation, error)
+
     def _should_retry(self, invocation, error):
         if invocation.connection and isinstance(error, (IOError, TargetDisconnectedError)):
             return False
@@ -253,9 +400,15 @@ class InvocationService(object):
         return False
 
     def _complete_with_error(self, invocation, error):
-        invocation.set_exception(error, None)
+        if not invocation.claim_completion():
+            return
+
+        self._release_in_flight_slot(invocation)
+        self._cancel_timers(invocation)
+        invocation.reject(error, None)
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        self._untrack_connection(invocation)
 
     def _register_backup_listener(self):
         codec = client_local_backup_listener_codec
@@ -274,66 +427,138 @@ class InvocationService(object):
 
     def _notify(self, invocation, client_message):
         expected_backups = client_message.get_number_of_backup_acks()
-        if expected_backups > invocation.backup_acks_received:
-            invocation.pending_response_received_time = time.time()
-            invocation.backup_acks_expected = expected_backups
-            invocation.pending_response = client_message
-            return
+        if expected_backups > 0:
+            with self._backup_lock:
+                if expected_backups > invocation.backup_acks_received:
+                    invocation.pending_response_received_time = time.time()
+                    invocation.backup_acks_expected = expected_backups
+                    invocation.pending_response = client_message
+                    backup_timeout_handler = functools.partial(self._notify_backup_timeout, invocation)
+                    invocation.backup_timer = self._reactor.add_timer(self._backup_timeout, backup_timeout_handler)
+                    return
 
         self._complete(invocation, client_message)
 
     def _notify_backup_complete(self, invocation):
-        invocation.backup_acks_received += 1
-        if not invocation.pending_response:
-            return
+        with self._backup_lock:
+            invocation.backup_acks_received += 1
+            pending_response = invocation.pending_response
+            if not pending_response:
+                return
 
-        if invocation.backup_acks_expected != invocation.backup_acks_received:
-            return
+            if invocation.backup_acks_expected != invocation.backup_acks_received:
+                return
+
+            # Only the one that takes the pending response completes the invocation
+            invocation.pending_response = None
 
-        self._complete(invocation, invocation.pending_response)
+        self._complete(invocation, pending_response)
 
     def _complete(self, invocation, client_message):
-        invocation.set_response(client_message)
+        if not invocation.claim_completion():
+            # Already timed out or failed
+            return
+
+        self._release_in_flight_slot(invocation)
+        self._cancel_timers(invocation)
+        invocation.resolve(client_message)
         correlation_id = invocation.request.get_correlation_id()
         self._pending.pop(correlation_id, None)
+        self._untrack_connection(invocation)
 
-    def _start_clean_resources_timer(self):
-        def run():
-            if self._shutdown:
-                return
-
-            now = time.time()
-            for invocation in list(self._pending.values()):
-                connection = invocation.sent_connection
-                if not connection:
-                    continue
-
-                if not connection.live:
-                    error = TargetDisconnectedError(connection.close_reason)
-                    self._notify_error(invocation, error)
+    def _acquire_in_flight_slot(self, invocation):
+        max_invocations = self._max_concurrent_invocations
+        if max_invocations <= 0 or not invocation.count_in_flight:
+            return True
 
-                if self._backup_ack_to_client_enabled:
-                    self._detect_and_handle_backup_timeout(invocation, now)
+        condition = self._in_flight_condition
+        with condition:
+            timeout = _NO_HOLD_BACK
+            if max_invocations <= self._in_flight_count:
+                timeout = self._get_hold_back_timeout(invocation)
+
+            if timeout is not _NO_HOLD_BACK:
+                if timeout is not None:
+                    end = time.time() + timeout
+
+                while self._in_flight_count >= max_invocations and not self._shutdown:
+                    if timeout is None:
+                        condition.wait()
+                    else:
+                        remaining = end - time.time()
+                        if remaining <= 0:
+                            return False
+                        condition.wait(remaining)
+
+            self._in_flight_count += 1
+            invocation.in_flight = True
+            return True
 
-            self._clean_resources_timer = self._reactor.add_timer(self._CLEAN_RESOURCES_PERIOD, run)
+    def _release_in_flight_slot(self, invocation):
+        if not invocation.in_flight:
+            # Not counted in flight
+            return
 
-        self._clean_resources_timer = self._reactor.add_timer(self._CLEAN_RESOURCES_PERIOD, run)
+        condition = self._in_flight_condition
+        with condition:
+            invocation.in_flight = False
+            self._in_flight_count -= 1
+            condition.notify()
+
+    def _get_backpressure_timeout(self):
+        policy = self._backpressure_policy
+        if policy == BackpressurePolicy.BLOCK:
+            return None
+        if policy == BackpressurePolicy.FAIL_FAST:
+            return 0
+        return self._backpressure_timeout
+
+    def _get_hold_back_timeout(self, invocation):
+        # Urgent invocations are needed by the client itself, and
+        # the reactor threads must not block, as they are the ones
+        # making room by completing the invocations. The asyncio
+        # event loop thread runs the user coroutines as well, so
+        # the limits fail fast there instead of being skipped.
+        if invocation.urgent:
+            return _NO_HOLD_BACK
+        threading_locals = Future._threading_locals
+        if getattr(threading_locals, "is_reactor_thread", False):
+            return 0 if getattr(threading_locals, "is_asyncio_loop_thread", False) else _NO_HOLD_BACK
+        return self._get_backpressure_timeout()
+
+    @staticmethod
+    def _cancel_timers(invocation):
+        deadline_timer = invocation.deadline_timer
+        if deadline_timer:
+            deadline_timer.cancel()
+
+        backup_timer = invocation.backup_timer
+        if backup_timer:
+            backup_timer.cancel()
+
+    def _notify_backup_timeout(self, invocation):
+        if not self._shutdown:
+            self._detect_and_handle_backup_timeout(invocation, time.time())
 
     def _detect_and_handle_backup_timeout(self, invocation, now):
-        if not invocation.pending_response:
-            return
+        with self._backup_lock:
+            pending_response = invocation.pending_response
+            if not pending_response:
+                return
 
-        if invocation.backup_acks_expected == invocation.backup_acks_received:
-            return
+            if invocation.backup_acks_expected == invocation.backup_acks_received:
+                return
 
-        expiration_time = invocation.pending_response_received_time + self._backup_timeout
-        timeout_reached = 0 < expiration_time < now
-        if not timeout_reached:
-            return
+            expiration_time = invocation.pending_response_received_time + self._backup_timeout
+            timeout_reached = 0 < expiration_time <= now
+            if not timeout_reached:
+                return
+
+            invocation.pending_response = None
 
         if self._fail_on_indeterminate_state:
             error = IndeterminateOperationStateError("Invocation failed because the backup acks are missed")
             self._complete_with_error(invocation, error)
             return
 
-        self._complete(invocation, invocation.pending_response)
+        self._complete(invocation, pending_response)
@@ -1,32 +1,13 @@
 import random
+from collections import OrderedDict
 
 from hazelcast import six
 from hazelcast.config import InMemoryFormat, EvictionPolicy
+from hazelcast.serialization.data import Data
 from hazelcast.util import current_time
-from hazelcast.six.moves import range
 from sys import getsizeof
 
 
-def _lru_key_func(x):
-    return x.last_access_time
-
-
-def _lfu_key_func(x):
-    return x.access_hit
-
-
-def _random_key_func(_):
-    return 0
-
-
-_eviction_key_func = {
-    EvictionPolicy.NONE: None,
-    EvictionPolicy.LRU: _lru_key_func,
-    EvictionPolicy.LFU: _lfu_key_func,
-    EvictionPolicy.RANDOM: _random_key_func
-}
-
-
 class DataRecord(object):
     """An expirable and evictable data object which represents a cache entry."""
     def __init__(self, key, value, create_time=None, ttl_seconds=None):
@@ -56,6 +37,197 @@ class DataRecord(object):
                % (self.key, self.value, self.create_time, self.expiration_time, self.last_access_time, self.access_hit)
 
 
+class _EvictionEngine(object):
+    """Keeps the records of a near cache in the order they should be evicted.
+
+    All operations run in constant time, so that inserting into a full near
+    cache costs the same no matter how many entries it holds. This base
+    implementation is used for ``EvictionPolicy.NONE`` and tracks nothing.
+    """
+
+    def add(self, record):
+        """Starts tracking a newly inserted record."""
+        pass
+
+    def remove(self, record):
+        """Stops tracking a record that is removed from the cache."""
+        pass
+
+    def on_access(self, record):
+        """Updates the eviction order after a cache hit on the record."""
+        pass
+
+    def peek(self):
+        """Returns the record that should be evicted next, or ``None``."""
+        return None
+
+    def clear(self):
+        """Stops tracking all records."""
+        pass
+
+
+class _LRUEvictionEngine(_EvictionEngine):
+    """Evicts the least recently used record.
+
+    Records are kept in an ordered dictionary from the least recently used
+    to the most recently used one.
+    """
+
+    def __init__(self):
+        self._records = OrderedDict()
+
+    def add(self, record):
+        self._records[record.key] = record
+
+    def remove(self, record):
+        self._records.pop(record.key, None)
+
+    def on_access(self, record):
+        # Re-inserting moves the key to the end. OrderedDict#move_to_end
+        # is not available on Python 2.
+        records = self._records
+        records[record.key] = records.pop(record.key)
+
+    def peek(self):
+        for record in six.itervalues(self._records):
+            return record
+        return None
+
+    def clear(self):
+        self._records.clear()
+
+
+class _FrequencyBucket(object):
+    """Records with the same access hit, linked to the buckets with the closest
+    lower and higher access hits."""
+
+    __slots__ = ("frequency", "records", "prev", "next")
+
+    def __init__(self, frequency):
+        self.frequency = frequency
+        self.records = OrderedDict()
+        self.prev = None
+        self.next = None
+
+
+class _LFUEvictionEngine(_EvictionEngine):
+    """Evicts the least frequently used record.
+
+    Records are grouped into buckets by their access hits, and the buckets are
+    kept in a doubly linked list sorted by access hits. Within a bucket, the
+    oldest record is evicted first.
+    """
+
+    def __init__(self):
+        self._head = None
+        self._buckets = {}  # key to bucket
+
+    def add(self, record):
+        bucket = self._head
+        if bucket is None or bucket.frequency != record.access_hit:
+            bucket = self._link_after(None, record.access_hit)
+        bucket.records[record.key] = record
+        self._buckets[record.key] = bucket
+
+    def remove(self, record):
+        bucket = self._buckets.pop(record.key, None)
+        if bucket is None:
+            return
+        del bucket.records[record.key]
+        if not bucket.records:
+            self._unlink(bucket)
+
+    def on_access(self, record):
+        # Called after the access hit of the record is incremented
+        bucket = self._buckets.get(record.key, None)
+        if bucket is None:
+            return
+        next_bucket = bucket.next
+        if next_bucket is None or next_bucket.frequency != record.access_hit:
+            next_bucket = self._link_after(bucket, record.access_hit)
+        del bucket.records[record.key]
+        next_bucket.records[record.key] = record
+        self._buckets[record.key] = next_bucket
+        if not bucket.records:
+            self._unlink(bucket)
+
+    def peek(self):
+        if self._head is None:
+            return None
+        for record in six.itervalues(self._head.records):
+            return record
+        return None
+
+    def clear(self):
+        self._head = None
+        self._buckets.clear()
+
+    def _link_after(self, bucket, frequency):
+        new_bucket = _FrequencyBucket(frequency)
+        if bucket is None:
+            new_bucket.next = self._head
+            if self._head is not None:
+                self._head.prev = new_bucket
+            self._head = new_bucket
+        else:
+            new_bucket.prev = bucket
+            new_bucket.next = bucket.next
+            if bucket.next is not None:
+                bucket.next.prev = new_bucket
+            bucket.next = new_bucket
+        return new_bucket
+
+    def _unlink(self, bucket):
+        if bucket.prev is None:
+            self._head = bucket.next
+        else:
+            bucket.prev.next = bucket.next
+        if bucket.next is not None:
+            bucket.next.prev = bucket.prev
+
+
+class _RandomEvictionEngine(_EvictionEngine):
+    """Evicts a random record.
+
+    Records are kept in a list so that a random one can be picked by index.
+    Removed records are replaced with the last record of the list.
+    """
+
+    def __init__(self):
+        self._records = []
+        self._indexes = {}  # key to index
+
+    def add(self, record):
+        self._indexes[record.key] = len(self._records)
+        self._records.append(record)
+
+    def remove(self, record):
+        index = self._indexes.pop(record.key, None)
+        if index is None:
+            return
+        last = self._records.pop()
+        if index < len(self._records):
+            self._records[index] = last
+            self._indexes[last.key] = index
+
+    def peek(self):
+        if not self._records:
+            return None
+        return self._records[random.randrange(len(self._records))]
+
+    def clear(self):
+        del self._records[:]
+        self._indexes.clear()
+
+
+_eviction_engines = {
+    EvictionPolicy.NONE: _EvictionEngine,
+    EvictionPolicy.LRU: _LRUEvictionEngine,
+    EvictionPolicy.LFU: _LFUEvictionEngine,
+    EvictionPolicy.RANDOM: _RandomEvictionEngine,
+}
+
+
 class NearCache(dict):
     """NearCache is a local cache used by :class:`~hazelcast.proxy.map.MapFeatNearCache`."""
 
@@ -85,8 +257,7 @@ class NearCache(dict):
             self.eviction_sampling_pool_size = self.eviction_max_size
 
         # internal
-        self._key_func = _eviction_key_func[self.eviction_policy]
-        self._eviction_candidates = list()
+        self._eviction_engine = _eviction_engines[self.eviction_policy]()
         self._evictions = 0
         self._expirations = 0
         self._hits = 0
@@ -120,19 +291,29 @@ class NearCache(dict):
 
         if self.in_memory_format == InMemoryFormat.BINARY:
             value = self.serialization_service.to_data(value)
+            buf = value.to_bytes()
+            if isinstance(buf, memoryview):
+                # Data received from the members is a view into the receive buffer
+                # of the connection. Store a copy of it so that the cached entry
+                # does not keep the whole receive buffer alive.
+                value = Data(buf.tobytes())
         elif self.in_memory_format == InMemoryFormat.OBJECT:
             value = self.serialization_service.to_object(value)
         else:
             raise ValueError("Invalid in-memory format!!!")
 
         data_record = DataRecord(key, value, ttl_seconds=self.time_to_live)
+        old_record = self.get(key, None)
+        if old_record is not None:
+            self._eviction_engine.remove(old_record)
         super(NearCache, self).__setitem__(key, data_record)
+        self._eviction_engine.add(data_record)
 
     def __getitem__(self, key):
         try:
             value_record = super(NearCache, self).__getitem__(key)
             if value_record.is_expired(self.max_idle):
-                super(NearCache, self).__delitem__(key)
+                self.__delitem__(key)
                 raise KeyError
         except KeyError as ke:
             self._misses += 1
@@ -142,59 +323,44 @@ class NearCache(dict):
             value_record.last_access_time = current_time()
         elif self.eviction_policy == EvictionPolicy.LFU:
             value_record.access_hit += 1
+        self._eviction_engine.on_access(value_record)
         self._hits += 1
         return self.serialization_service.to_object(value_record.value) \
             if self.in_memory_format == InMemoryFormat.BINARY else value_record.value
 
+    def __delitem__(self, key):
+        record = super(NearCache, self).__getitem__(key)
+        super(NearCache, self).__delitem__(key)
+        self._eviction_engine.remove(record)
+
+    def clear(self):
+        super(NearCache, self).clear()
+        self._eviction_engine.clear()
+
     def _do_eviction_if_required(self):
         if not self._is_eviction_required():
             return
-        new_eviction_samples = self._find_new_random_samples()
-        new_eviction_samples_cleaned = self._scan_and_expire_collection(new_eviction_samples)
-        if len(new_eviction_samples_cleaned) == 0:  # have nothing to expire
-            return
-
-        sorted_candidate_pool = sorted(new_eviction_samples_cleaned, key=self._key_func)
-        min_size = min(self.eviction_sampling_pool_size, len(sorted_candidate_pool))
-        self._eviction_candidates = sorted_candidate_pool[:min_size]  # set new eviction candidate pool
 
-        if len(new_eviction_samples) == len(new_eviction_samples_cleaned):  # did any item expired or do we need to evict
+        # Expired records are removed first, starting from the next eviction
+        # candidate. At most eviction_sampling_count records are checked, and
+        # nothing is evicted when some of them turn out to be expired.
+        expired = 0
+        record = None
+        while expired < self.eviction_sampling_count:
+            record = self._eviction_engine.peek()
+            if record is None or not record.is_expired(self.max_idle):
+                break
+            self._clean_expired_record(record.key)
+            expired += 1
+
+        if expired == 0 and record is not None:
             try:
-                self.__delitem__(self._eviction_candidates[0].key)
+                self.__delitem__(record.key)
                 self._evictions += 1
-                del self._eviction_candidates[0]
             except KeyError:
                 # key may be evicted previously so just ignore it
                 pass
 
-    def _find_new_random_samples(self):
-        records = list(self.values())  # has random order because of dict hash
-        new_sample_pool = set(self._eviction_candidates)
-        start = self._random_index()
-        for i in range(start, start + self.eviction_sampling_count):
-            index = i if i < len(records) else i - len(records)
-            if records[index].is_expired(self.max_idle):
-                self._clean_expired_record(records[index].key)
-            elif self._is_better_than_worse_entry(records[index]) or len(new_sample_pool) < self.eviction_sampling_pool_size:
-                new_sample_pool.add(records[index])
-        return new_sample_pool
-
-    def _scan_and_expire_collection(self, records):
-        new_records = []
-        for record in records:
-            if record.is_expired(self.max_idle):
-                self._clean_expired_record(record.key)
-            else:
-                new_records.append(record)
-        return new_records
-
-    def _random_index(self):
-        return random.randint(0, self.eviction_max_size - 1)
-
-    def _is_better_than_worse_entry(self, data_record):
-        return len(self._eviction_candidates) == 0 \
-               or (self._key_func(data_record) - self._key_func(self._eviction_candidates[-1])) < 0
-
     def _is_eviction_required(self):
         return self.eviction_policy != EvictionPolicy.NONE and self.eviction_max_size <= self.__len__()
 
@@ -0,0 +1,99 @@
+from hazelcast.serialization.api import IdentifiedDataSerializable
+from hazelcast.util import check_not_empty, check_true
+
+PROJECTION_FACTORY_ID = -30
+
+
+class Projection(object):
+    """Marker base class for all projections.
+
+    Projections allow the client to transform (strip down) each query result
+    object in order to avoid redundant network traffic. The transformation is
+    performed on the members, so only the projected values are sent to the
+    client and deserialized there.
+
+    **Attribute Paths**
+
+    The projections accept attribute paths with the same syntax as the
+    predicates, which is explained in the
+    :class:`hazelcast.predicate.Predicate` documentation, except that the
+    ``[any]`` operator is not supported.
+    """
+    pass
+
+
+class _AbstractProjection(IdentifiedDataSerializable, Projection):
+    def write_data(self, object_data_output):
+        raise NotImplementedError("write_data")
+
+    def read_data(self, object_data_input):
+        pass
+
+    def get_factory_id(self):
+        return PROJECTION_FACTORY_ID
+
+    def get_class_id(self):
+        return self.CLASS_ID
+
+
+def _validate_attribute_path(attribute_path):
+    check_not_empty(attribute_path, "Attribute path must not be empty")
+    check_true("[any]" not in attribute_path, "[any] operator is not supported by the projections")
+
+
+class _SingleAttributeProjection(_AbstractProjection):
+    CLASS_ID = 0
+
+    def __init__(self, attribute_path):
+        _validate_attribute_path(attribute_path)
+        self.attribute_path = attribute_path
+
+    def write_data(self, output):
+        output.write_utf(self.attribute_path)
+
+    def __repr__(self):
+        return "SingleAttributeProjection(attribute_path=%s)" % self.attribute_path
+
+
+class _MultiAttributeProjection(_AbstractProjection):
+    CLASS_ID = 1
+
+    def __init__(self, attribute_paths):
+        check_not_empty(attribute_paths, "Attribute paths must not be empty")
+        for attribute_path in attribute_paths:
+            _validate_attribute_path(attribute_path)
+        self.attribute_paths = attribute_paths
+
+    def write_data(self, output):
+        output.write_utf_array(self.attribute_paths)
+
+    def __repr__(self):
+        return "MultiAttributeProjection(attribute_paths=%s)" % ", ".join(self.attribute_paths)
+
+
+def single_attribute(attribute_path):
+    """Creates a projection that extracts the value of the given attribute path.
+
+    Args:
+        attribute_path (str): Path to extract the attribute from.
+
+    Returns:
+        Projection: The created **single attribute** projection instance, that
+        returns the extracted value of each entry.
+    """
+    return _SingleAttributeProjection(attribute_path)
+
+
+def multi_attribute(*attribute_paths):
+    """Creates a projection that extracts the values of the given attribute paths.
+
+    Args:
+        *attribute_paths (str): Paths to extract the attributes from.
+
+    Returns:
+        Projection: The created **multi attribute** projection instance, that
+        returns the list of the extracted values of each entry, in the order
+        of the given paths.
+    """
+    return _MultiAttributeProjection(list(attribute_paths))
+
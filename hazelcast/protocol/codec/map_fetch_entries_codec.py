@@ -0,0 +1,31 @@
+from hazelcast.serialization.bits import *
+from hazelcast.protocol.builtin import FixSizedTypesCodec
+from hazelcast.protocol.client_message import OutboundMessage, REQUEST_HEADER_SIZE, create_initial_buffer
+from hazelcast.protocol.builtin import StringCodec
+from hazelcast.protocol.builtin import EntryListIntegerIntegerCodec
+from hazelcast.protocol.builtin import EntryListCodec
+from hazelcast.protocol.builtin import DataCodec
+
+# hex: 0x013800
+_REQUEST_MESSAGE_TYPE = 79872
+# hex: 0x013801
+_RESPONSE_MESSAGE_TYPE = 79873
+
+_REQUEST_BATCH_OFFSET = REQUEST_HEADER_SIZE
+_REQUEST_INITIAL_FRAME_SIZE = _REQUEST_BATCH_OFFSET + INT_SIZE_IN_BYTES
+
+
+def encode_request(name, iteration_pointers, batch):
+    buf = create_initial_buffer(_REQUEST_INITIAL_FRAME_SIZE, _REQUEST_MESSAGE_TYPE)
+    FixSizedTypesCodec.encode_int(buf, _REQUEST_BATCH_OFFSET, batch)
+    StringCodec.encode(buf, name)
+    EntryListIntegerIntegerCodec.encode(buf, iteration_pointers, True)
+    return OutboundMessage(buf, True)
+
+
+def decode_response(msg):
+    msg.next_frame()
+    response = dict()
+    response["iteration_pointers"] = EntryListIntegerIntegerCodec.decode(msg)
+    response["entries"] = EntryListCodec.decode(msg, DataCodec.decode, DataCodec.decode)
+    return response
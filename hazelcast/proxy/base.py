@@ -43,24 +43,32 @@ class Proxy(object):
     def __repr__(self):
         return '%s(name="%s")' % (type(self).__name__, self.name)
 
-    def _invoke(self, request, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, response_handler=response_handler)
+    def _invoke(self, request, response_handler=_no_op_response_handler, timeout=None,
+                count_in_flight=True):
+        invocation = Invocation(request, response_handler=response_handler, timeout=timeout,
+                                count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
-    def _invoke_on_target(self, request, uuid, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, uuid=uuid, response_handler=response_handler)
+    def _invoke_on_target(self, request, uuid, response_handler=_no_op_response_handler, timeout=None,
+                          count_in_flight=True):
+        invocation = Invocation(request, uuid=uuid, response_handler=response_handler, timeout=timeout,
+                                count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
-    def _invoke_on_key(self, request, key_data, response_handler=_no_op_response_handler):
+    def _invoke_on_key(self, request, key_data, response_handler=_no_op_response_handler, timeout=None,
+                       count_in_flight=True):
         partition_id = self._partition_service.get_partition_id(key_data)
-        invocation = Invocation(request, partition_id=partition_id, response_handler=response_handler)
+        invocation = Invocation(request, partition_id=partition_id, response_handler=response_handler,
+                                timeout=timeout, count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
-    def _invoke_on_partition(self, request, partition_id, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, partition_id=partition_id, response_handler=response_handler)
+    def _invoke_on_partition(self, request, partition_id, response_handler=_no_op_response_handler, timeout=None,
+                             count_in_flight=True):
+        invocation = Invocation(request, partition_id=partition_id, response_handler=response_handler,
+                                timeout=timeout, count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
@@ -77,8 +85,10 @@ class PartitionSpecificProxy(Proxy):
         partition_key = context.serialization_service.to_data(string_partition_strategy(self.name))
         self._partition_id = context.partition_service.get_partition_id(partition_key)
 
-    def _invoke(self, request, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, partition_id=self._partition_id, response_handler=response_handler)
+    def _invoke(self, request, response_handler=_no_op_response_handler, timeout=None,
+                count_in_flight=True):
+        invocation = Invocation(request, partition_id=self._partition_id, response_handler=response_handler,
+                                timeout=timeout, count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
@@ -94,8 +104,10 @@ class TransactionalProxy(object):
         self._to_object = serialization_service.to_object
         self._to_data = serialization_service.to_data
 
-    def _invoke(self, request, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, connection=self.transaction.connection, response_handler=response_handler)
+    def _invoke(self, request, response_handler=_no_op_response_handler, timeout=None,
+                count_in_flight=True):
+        invocation = Invocation(request, connection=self.transaction.connection, response_handler=response_handler,
+                                timeout=timeout, count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
@@ -29,8 +29,10 @@ class BaseCPProxy(object):
         """Returns a version of this proxy with only blocking method calls."""
         return make_blocking(self)
 
-    def _invoke(self, request, response_handler=_no_op_response_handler):
-        invocation = Invocation(request, response_handler=response_handler)
+    def _invoke(self, request, response_handler=_no_op_response_handler, timeout=None,
+                count_in_flight=True):
+        invocation = Invocation(request, response_handler=response_handler, timeout=timeout,
+                                count_in_flight=count_in_flight)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
@@ -3,6 +3,7 @@ import uuid
 from hazelcast.errors import OperationTimeoutError
 from hazelcast.protocol.codec import count_down_latch_await_codec, count_down_latch_get_round_codec, \
     count_down_latch_count_down_codec, count_down_latch_get_count_codec, count_down_latch_try_set_count_codec
+from hazelcast.proxy.base import MAX_SIZE
 from hazelcast.proxy.cp import BaseCPProxy
 from hazelcast.util import to_millis, check_true, check_is_number, check_is_int
 
@@ -65,7 +66,7 @@ class CountDownLatch(BaseCPProxy):
         invocation_uuid = uuid.uuid4()
         codec = count_down_latch_await_codec
         request = codec.encode_request(self._group_id, self._object_name, invocation_uuid, to_millis(timeout))
-        return self._invoke(request, codec.decode_response)
+        return self._invoke(request, codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def count_down(self):
         """Decrements the count of the latch, releasing all waiting threads if
@@ -6,6 +6,7 @@ from hazelcast.errors import LockOwnershipLostError, LockAcquireLimitReachedErro
 from hazelcast.future import ImmediateExceptionFuture
 from hazelcast.protocol.codec import fenced_lock_lock_codec, fenced_lock_try_lock_codec, fenced_lock_unlock_codec, \
     fenced_lock_get_lock_ownership_codec
+from hazelcast.proxy.base import MAX_SIZE
 from hazelcast.proxy.cp import SessionAwareCPProxy
 from hazelcast.util import thread_id, to_millis
 
@@ -399,13 +400,13 @@ class FencedLock(SessionAwareCPProxy):
         codec = fenced_lock_lock_codec
         request = codec.encode_request(self._group_id, self._object_name, session_id, current_thread_id,
                                        invocation_uuid)
-        return self._invoke(request, codec.decode_response)
+        return self._invoke(request, codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def _request_try_lock(self, session_id, current_thread_id, invocation_uuid, timeout):
         codec = fenced_lock_try_lock_codec
         request = codec.encode_request(self._group_id, self._object_name, session_id, current_thread_id,
                                        invocation_uuid, to_millis(timeout))
-        return self._invoke(request, codec.decode_response)
+        return self._invoke(request, codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def _request_unlock(self, session_id, current_thread_id, invocation_uuid):
         codec = fenced_lock_unlock_codec
@@ -5,6 +5,7 @@ from hazelcast.errors import SessionExpiredError, WaitKeyCancelledError, Illegal
 from hazelcast.future import ImmediateFuture, ImmediateExceptionFuture
 from hazelcast.protocol.codec import semaphore_init_codec, semaphore_acquire_codec, semaphore_available_permits_codec, \
     semaphore_drain_codec, semaphore_change_codec, semaphore_release_codec
+from hazelcast.proxy.base import MAX_SIZE
 from hazelcast.proxy.cp import SessionAwareCPProxy, BaseCPProxy
 from hazelcast.util import check_not_negative, check_true, thread_id, to_millis
 
@@ -424,7 +425,7 @@ class SessionAwareSemaphore(Semaphore, SessionAwareCPProxy):
 
         request = codec.encode_request(self._group_id, self._object_name, session_id, current_thread_id,
                                        invocation_uuid, permits, timeout)
-        return self._invoke(request, codec.decode_response)
+        return self._invoke(request, codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def _request_drain(self, session_id, current_thread_id, invocation_uuid):
         codec = semaphore_drain_codec
@@ -497,7 +498,7 @@ class SessionlessSemaphore(Semaphore):
 
         request = codec.encode_request(self._group_id, self._object_name, _NO_SESSION_ID, global_thread_id,
                                        invocation_uuid, permits, timeout)
-        return self._invoke(request, codec.decode_response)
+        return self._invoke(request, codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def _request_change(self, global_thread_id, invocation_uuid, permits):
         global_thread_id = global_thread_id.result()
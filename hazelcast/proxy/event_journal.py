@@ -0,0 +1,307 @@
+import sys
+import threading
+from collections import deque
+
+from hazelcast.errors import HazelcastSerializationError
+from hazelcast.future import Future, ImmediateFuture
+from hazelcast.proxy.base import EntryEventType
+from hazelcast.serialization.data import Data, DATA_OFFSET
+from hazelcast.serialization.input import _ObjectDataInput
+from hazelcast.serialization.serialization_const import CONSTANT_TYPE_DATA_SERIALIZABLE
+from hazelcast.util import get_attr_name
+from hazelcast.six.moves import range
+
+_MAP_DATA_SERIALIZER_FACTORY_ID = -10
+_NONE = object()
+
+
+class EventJournalMapEvent(object):
+    """Map event read from the event journal.
+
+    Attributes:
+        event_type (EntryEventType): Type of the event.
+    """
+
+    __slots__ = ("_to_object", "_key_data", "_new_value_data", "_old_value_data", "event_type")
+
+    def __init__(self, to_object, key, new_value, old_value, event_type):
+        self._to_object = to_object
+        self._key_data = key
+        self._new_value_data = new_value
+        self._old_value_data = old_value
+        self.event_type = event_type
+
+    @property
+    def key(self):
+        """The key of the entry."""
+        return self._to_object(self._key_data)
+
+    @property
+    def new_value(self):
+        """The value of the entry after the event, ``None`` for the removals."""
+        return self._to_object(self._new_value_data)
+
+    @property
+    def old_value(self):
+        """The value of the entry before the event, ``None`` for the insertions."""
+        return self._to_object(self._old_value_data)
+
+    def __repr__(self):
+        return "EventJournalMapEvent(key=%s, new_value=%s, old_value=%s, event_type=%s)" \
+               % (self.key, self.new_value, self.old_value, get_attr_name(EntryEventType, self.event_type))
+
+
+class EventJournalInitialSubscriberState(object):
+    """Sequences of the event journal of a partition, at the time of the subscription.
+
+    Attributes:
+        oldest_sequence (int): Sequence of the oldest event in the journal.
+        newest_sequence (int): Sequence of the newest event in the journal, or
+            ``oldest_sequence - 1`` if the journal is empty.
+    """
+
+    __slots__ = ("oldest_sequence", "newest_sequence")
+
+    def __init__(self, oldest_sequence, newest_sequence):
+        self.oldest_sequence = oldest_sequence
+        self.newest_sequence = newest_sequence
+
+    def __repr__(self):
+        return "EventJournalInitialSubscriberState(oldest_sequence=%s, newest_sequence=%s)" \
+               % (self.oldest_sequence, self.newest_sequence)
+
+
+class EventJournalReadResult(object):
+    """Batch of events read from the event journal of a partition.
+
+    Attributes:
+        read_count (int): Number of the events read from the journal. It can be
+            greater than the number of the items, if some of the events were
+            filtered out by the predicate.
+        items (hazelcast.util.ImmutableLazyDataList): The events, or their
+            projections if a projection is used.
+        item_seqs (list[int]): Sequences of the items, or ``None`` if they are
+            not sent by the member.
+        next_sequence (int): Sequence to continue reading from.
+    """
+
+    __slots__ = ("read_count", "items", "item_seqs", "next_sequence")
+
+    def __init__(self, read_count, items, item_seqs, next_sequence):
+        self.read_count = read_count
+        self.items = items
+        self.item_seqs = item_seqs
+        self.next_sequence = next_sequence
+
+
+def _to_event_journal_map_event(to_object, is_big_endian, data):
+    """Reads the member side ``InternalEventJournalMapEvent`` from the given data.
+
+    The event is an ``IdentifiedDataSerializable`` of the member that the client
+    has no factory for, so it is read directly. The key and the values are kept
+    as data, and deserialized when they are accessed.
+    """
+    inp = _ObjectDataInput(data.to_bytes(), DATA_OFFSET, None, is_big_endian)
+    if data.get_type() != CONSTANT_TYPE_DATA_SERIALIZABLE or not inp.read_boolean() \
+            or inp.read_int() != _MAP_DATA_SERIALIZER_FACTORY_ID:
+        raise HazelcastSerializationError("Event journal item is not a map event. "
+                                          "Use a projection to read custom items.")
+    inp.read_int()  # class id
+    event_type = inp.read_int()
+    key = _read_data(inp)
+    new_value = _read_data(inp)
+    old_value = _read_data(inp)
+    return EventJournalMapEvent(to_object, key, new_value, old_value, event_type)
+
+
+def _read_data(inp):
+    buff = inp.read_byte_array()
+    if buff is None:
+        return None
+    return Data(buff)
+
+
+class EventJournalReader(object):
+    """Reads the event journal of a map from all the partitions concurrently.
+
+    The reader keeps one read in flight per partition. Each read blocks on the
+    member until at least ``min_size`` events are available, and returns at
+    most ``max_size`` events. When a batch is taken by the consumer, the next
+    read of its partition is issued, so at most one batch per partition is
+    buffered on the client.
+
+    The events can be consumed by iterating over the reader, which blocks until
+    the next event is available, with ``async for`` from the coroutines running
+    on an asyncio event loop, or in batches with :func:`read_batch`. These ways
+    should not be mixed.
+
+    The order of the events is preserved within a partition, but not across
+    the partitions.
+
+    :func:`get_sequences` returns the sequences to continue reading from, per
+    partition. They can be saved and given to a new reader to resume from where
+    this reader left off.
+
+    If a read fails, for example because the events were overwritten before
+    they were read, the error is raised to the consumer and the reading of that
+    partition stops. The reader should be closed, and a new one should be
+    created from the saved sequences.
+
+    Do not create this class directly, use :func:`hazelcast.proxy.map.Map.event_journal_reader`
+    instead.
+    """
+
+    def __init__(self, map_proxy, partition_count, start_sequences, start_from_oldest, min_size, max_size,
+                 predicate, projection):
+        self._map = map_proxy
+        self._partition_count = partition_count
+        self._start_from_oldest = start_from_oldest
+        self._min_size = min_size
+        self._max_size = max_size
+        self._predicate = predicate
+        self._projection = projection
+        self._sequences = dict(start_sequences)
+        self._lock = threading.Lock()
+        self._ready = deque()  # (partition_id, future) pairs of the completed reads
+        self._waiter = None
+        self._closed = False
+        self._events = iter(())
+
+    def start(self):
+        for partition_id in range(self._partition_count):
+            sequence = self._sequences.get(partition_id, None)
+            if sequence is None:
+                future = self._map.subscribe_to_event_journal(partition_id).continue_with(self._on_subscribed,
+                                                                                        partition_id)
+            else:
+                future = self._read(partition_id, sequence)
+            future.add_done_callback(self._make_callback(partition_id))
+        return self
+
+    def get_sequences(self):
+        """Returns the sequences to continue reading from, per partition.
+
+        The sequences advance as the events are handed over to the consumer.
+
+        Returns:
+            dict[int, int]: Partition ids to sequences.
+        """
+        return dict(self._sequences)
+
+    def read_batch(self):
+        """Reads the next batch of events, which are from a single partition.
+
+        Returns:
+            hazelcast.future.Future[hazelcast.util.ImmutableLazyDataList]: The events,
+            or ``None`` if the reader is closed.
+        """
+        return self._next_batch().continue_with(self._take_batch)
+
+    def close(self):
+        """Closes the reader.
+
+        The reads in flight are not cancelled on the members, their results are
+        discarded when they arrive. They are not counted against the
+        ``max_concurrent_invocations`` limit of the client, so they do not
+        hold back the other invocations meanwhile.
+        """
+        with self._lock:
+            self._closed = True
+            self._ready.clear()
+            waiter = self._waiter
+            self._waiter = None
+        if waiter:
+            waiter.set_result(None)
+
+    def __iter__(self):
+        while True:
+            for event in self._events:
+                yield event
+            batch = self._next_batch().result()
+            if batch is None:
+                return
+            self._events = self._consume(*batch)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        event = next(self._events, _NONE)
+        if event is not _NONE:
+            return ImmediateFuture(event)
+        return self._next_batch().continue_with(self._anext_from_batch)
+
+    def _anext_from_batch(self, f):
+        batch = f.result()
+        if batch is None:
+            raise StopAsyncIteration
+        self._events = self._consume(*batch)
+        return self.__anext__()
+
+    def _consume(self, partition_id, result):
+        item_seqs = result.item_seqs
+        for index, item in enumerate(result.items):
+            if item_seqs is not None:
+                self._sequences[partition_id] = item_seqs[index] + 1
+            yield item
+        self._sequences[partition_id] = result.next_sequence
+
+    def _take_batch(self, f):
+        batch = f.result()
+        if batch is None:
+            return None
+        partition_id, result = batch
+        self._sequences[partition_id] = result.next_sequence
+        return result.items
+
+    def _next_batch(self):
+        with self._lock:
+            if self._closed:
+                return ImmediateFuture(None)
+            if self._waiter is not None:
+                raise RuntimeError("Event journal reader does not support concurrent consumers")
+            waiter = Future()
+            if not self._ready:
+                self._waiter = waiter
+                return waiter
+            partition_id, future = self._ready.popleft()
+        self._deliver(waiter, partition_id, future)
+        return waiter
+
+    def _deliver(self, waiter, partition_id, future):
+        try:
+            result = future.result()
+        except:
+            exception, traceback = sys.exc_info()[1:]
+            waiter.set_exception(exception, traceback)
+            return
+        if not self._closed:
+            self._read(partition_id, result.next_sequence).add_done_callback(self._make_callback(partition_id))
+        waiter.set_result((partition_id, result))
+
+    def _make_callback(self, partition_id):
+        def callback(future):
+            with self._lock:
+                if self._closed:
+                    return
+                waiter = self._waiter
+                if waiter is None:
+                    self._ready.append((partition_id, future))
+                    return
+                self._waiter = None
+            self._deliver(waiter, partition_id, future)
+
+        return callback
+
+    def _on_subscribed(self, f, partition_id):
+        state = f.result()
+        if self._start_from_oldest:
+            sequence = state.oldest_sequence
+        else:
+            sequence = state.newest_sequence + 1
+        self._sequences[partition_id] = sequence
+        return self._read(partition_id, sequence)
+
+    def _read(self, partition_id, sequence):
+        return self._map.read_from_event_journal(sequence, self._min_size, self._max_size, partition_id,
+                                                 self._predicate, self._projection)
@@ -3,7 +3,7 @@ from hazelcast import future
 from hazelcast.protocol.codec import executor_service_shutdown_codec, \
     executor_service_is_shutdown_codec, \
     executor_service_submit_to_partition_codec, executor_service_submit_to_member_codec
-from hazelcast.proxy.base import Proxy
+from hazelcast.proxy.base import Proxy, MAX_SIZE
 from hazelcast.util import check_not_none
 
 
@@ -32,7 +32,7 @@ class Executor(Proxy):
         partition_id = self._context.partition_service.get_partition_id(key_data)
         uuid = uuid4()
         request = executor_service_submit_to_partition_codec.encode_request(self.name, uuid, task_data)
-        return self._invoke_on_partition(request, partition_id, handler)
+        return self._invoke_on_partition(request, partition_id, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def execute_on_member(self, member, task):
         """Executes a task on the specified member.
@@ -103,4 +103,4 @@ class Executor(Proxy):
             return self._to_object(executor_service_submit_to_member_codec.decode_response(message))
 
         request = executor_service_submit_to_member_codec.encode_request(self.name, uuid, task_data, member_uuid)
-        return self._invoke_on_target(request, member_uuid, handler)
+        return self._invoke_on_target(request, member_uuid, handler, timeout=MAX_SIZE, count_in_flight=False)
@@ -18,12 +18,24 @@ from hazelcast.protocol.codec import map_add_entry_listener_codec, map_add_entry
     map_execute_with_predicate_codec, map_add_near_cache_invalidation_listener_codec, map_add_index_codec, \
     map_set_ttl_codec, map_entries_with_paging_predicate_codec, map_key_set_with_paging_predicate_codec, \
     map_values_with_paging_predicate_codec, map_put_with_max_idle_codec, map_put_if_absent_with_max_idle_codec, \
-    map_put_transient_with_max_idle_codec, map_set_with_max_idle_codec
+    map_put_transient_with_max_idle_codec, map_set_with_max_idle_codec, map_aggregate_codec, \
+    map_aggregate_with_predicate_codec, map_project_codec, map_project_with_predicate_codec, \
+    map_event_journal_subscribe_codec, map_event_journal_read_codec, map_remove_all_codec, \
+    map_fetch_keys_codec, map_fetch_entries_codec
 from hazelcast.proxy.base import Proxy, EntryEvent, EntryEventType, get_entry_listener_flags, MAX_SIZE
+from hazelcast.proxy.event_journal import EventJournalInitialSubscriberState, EventJournalReadResult, \
+    EventJournalReader, _to_event_journal_map_event
 from hazelcast.predicate import PagingPredicate
-from hazelcast.util import check_not_none, thread_id, to_millis, ImmutableLazyDataList, IterationType
+from hazelcast.serialization.key_cache import KeyDataCache
+from hazelcast.util import check_not_none, check_not_negative, check_true, thread_id, to_millis, \
+    ImmutableLazyDataList, IterationType
 from hazelcast import six
 
+_INITIAL_ITERATION_POINTERS = [(2147483647, -1)]
+"""Iteration pointers to start fetching a partition from. The members
+iterate a partition from the highest index to the lowest one, and return
+a pointer with a negative index once the partition is exhausted."""
+
 
 class Map(Proxy):
     """Hazelcast Map client proxy to access the map on the cluster.
@@ -61,6 +73,15 @@ class Map(Proxy):
     def __init__(self, service_name, name, context):
         super(Map, self).__init__(service_name, name, context)
         self._reference_id_generator = context.lock_reference_id_generator
+        self._value_compressor = context.serialization_service.get_value_compressor(name)
+        self._value_to_data = self._value_compressor.to_data if self._value_compressor else self._to_data
+        key_cache_config = context.config.key_caches.get(name, None)
+        if key_cache_config is None:
+            self._key_cache = None
+            self._key_to_data = self._to_data
+        else:
+            self._key_cache = KeyDataCache(self._to_data, key_cache_config.max_size)
+            self._key_to_data = self._key_cache.to_data
 
     def add_entry_listener(self, include_value=False, key=None, predicate=None, added_func=None, removed_func=None,
                            updated_func=None, evicted_func=None, evict_all_func=None, clear_all_func=None,
@@ -92,12 +113,12 @@ class Map(Proxy):
 
         if key and predicate:
             codec = map_add_entry_listener_to_key_with_predicate_codec
-            key_data = self._to_data(key)
+            key_data = self._key_to_data(key)
             predicate_data = self._to_data(predicate)
             request = codec.encode_request(self.name, key_data, predicate_data, include_value, flags, self._is_smart)
         elif key and not predicate:
             codec = map_add_entry_listener_to_key_codec
-            key_data = self._to_data(key)
+            key_data = self._key_to_data(key)
             request = codec.encode_request(self.name, key_data, include_value, flags, self._is_smart)
         elif not key and predicate:
             codec = map_add_entry_listener_with_predicate_codec
@@ -201,6 +222,38 @@ class Map(Proxy):
         request = map_add_interceptor_codec.encode_request(self.name, interceptor_data)
         return self._invoke(request, map_add_interceptor_codec.decode_response)
 
+    def aggregate(self, aggregator, predicate=None):
+        """Applies the aggregation logic on the map entries and returns the result.
+
+        The aggregation is performed on the members, so only the result is sent to
+        the client. If the predicate is given, only the entries that satisfy it are
+        aggregated.
+
+        Args:
+            aggregator (hazelcast.aggregator.Aggregator): Aggregator to aggregate the entries with.
+            predicate (hazelcast.predicate.Predicate): Predicate to filter the entries with.
+
+        Returns:
+            hazelcast.future.Future: The result of the aggregation.
+        """
+        check_not_none(aggregator, "aggregator can't be None")
+        aggregator_data = self._to_data(aggregator)
+        if predicate:
+            check_true(not isinstance(predicate, PagingPredicate), "Paging predicate is not supported.")
+
+            def handler(message):
+                return self._to_object(map_aggregate_with_predicate_codec.decode_response(message))
+
+            predicate_data = self._to_data(predicate)
+            request = map_aggregate_with_predicate_codec.encode_request(self.name, aggregator_data, predicate_data)
+        else:
+            def handler(message):
+                return self._to_object(map_aggregate_codec.decode_response(message))
+
+            request = map_aggregate_codec.encode_request(self.name, aggregator_data)
+
+        return self._invoke(request, handler)
+
     def clear(self):
         """Clears the map.
         
@@ -212,7 +265,7 @@ class Map(Proxy):
         request = map_clear_codec.encode_request(self.name)
         return self._invoke(request)
 
-    def contains_key(self, key):
+    def contains_key(self, key, timeout=None):
         """Determines whether this map contains an entry with the key.
         
         Warning: 
@@ -221,14 +274,18 @@ class Map(Proxy):
 
         Args:
             key: The specified key.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[bool]: ``True`` if this map contains an entry for the specified key,
             ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
-        return self._contains_key_internal(key_data)
+        key_data = self._key_to_data(key)
+        return self._contains_key_internal(key_data, timeout)
 
     def contains_value(self, value):
         """Determines whether this map contains one or more keys for the specified value.
@@ -241,12 +298,12 @@ class Map(Proxy):
             ``False`` otherwise.
         """
         check_not_none(value, "value can't be None")
-        value_data = self._to_data(value)
+        value_data = self._value_to_data(value)
 
         request = map_contains_value_codec.encode_request(self.name, value_data)
         return self._invoke(request, map_contains_value_codec.decode_response)
 
-    def delete(self, key):
+    def delete(self, key, timeout=None):
         """Removes the mapping for a key from this map if it is present (optional operation).
         
         Unlike remove(object), this operation does not return the removed value, which avoids the serialization cost of
@@ -263,13 +320,17 @@ class Map(Proxy):
 
         Args:
             key: Key of the mapping to be deleted.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[None]:
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
-        return self._delete_internal(key_data)
+        key_data = self._key_to_data(key)
+        return self._delete_internal(key_data, timeout)
 
     def entry_set(self, predicate=None):
         """Returns a list clone of the mappings contained in this map.
@@ -313,6 +374,41 @@ class Map(Proxy):
 
         return self._invoke(request, handler)
 
+    def event_journal_reader(self, start_sequences=None, start_from_oldest=True, min_size=1, max_size=100,
+                             predicate=None, projection=None):
+        """Creates a reader that streams the events of this map from the event journal.
+
+        The reader subscribes to the event journals of all the partitions and reads
+        them concurrently, in batches. See :class:`hazelcast.proxy.event_journal.EventJournalReader`
+        for the ways to consume the events.
+
+        The event journal must be enabled for this map in the member configuration.
+
+        Args:
+            start_sequences (dict[int, int]): Sequences to start reading from, per partition id,
+                as returned by :func:`hazelcast.proxy.event_journal.EventJournalReader.get_sequences`.
+                The partitions without a sequence are read from the start position.
+            start_from_oldest (bool): If ``True``, the partitions without a sequence are read from
+                the oldest event in the journal. Otherwise, only the events that are added after
+                the subscription are read.
+            min_size (int): Minimum number of events to read in a batch. Each read waits on the
+                member until that many events are available.
+            max_size (int): Maximum number of events to read in a batch.
+            predicate: Member side predicate to filter the events with. It receives the
+                ``EventJournalMapEvent`` instances, so it must be implemented on the members.
+            projection: Member side projection to transform the events with. It receives the
+                ``EventJournalMapEvent`` instances, so it must be implemented on the members.
+
+        Returns:
+            hazelcast.proxy.event_journal.EventJournalReader: The started reader.
+        """
+        check_true(min_size > 0, "min_size must be positive")
+        check_true(max_size >= min_size, "max_size should be greater than or equal to min_size")
+        partition_count = self._partition_service.get_partition_count()
+        reader = EventJournalReader(self, partition_count, start_sequences or {}, start_from_oldest, min_size,
+                                    max_size, predicate, projection)
+        return reader.start()
+
     def evict(self, key):
         """Evicts the specified key from this map.
         
@@ -327,7 +423,7 @@ class Map(Proxy):
             hazelcast.future.Future[bool]: ``True`` if the key is evicted, ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._evict_internal(key_data)
 
     def evict_all(self):
@@ -370,7 +466,7 @@ class Map(Proxy):
             entry_processor_data = self._to_data(entry_processor)
             request = map_execute_on_all_keys_codec.encode_request(self.name, entry_processor_data)
 
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def execute_on_key(self, key, entry_processor):
         """Applies the user defined EntryProcessor to the entry mapped by the key.
@@ -387,7 +483,7 @@ class Map(Proxy):
             hazelcast.future.Future[any]: Result of entry process.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._execute_on_key_internal(key_data, entry_processor)
 
     def execute_on_keys(self, keys, entry_processor):
@@ -408,7 +504,7 @@ class Map(Proxy):
         key_list = []
         for key in keys:
             check_not_none(key, "key can't be None")
-            key_list.append(self._to_data(key))
+            key_list.append(self._key_to_data(key))
 
         if len(keys) == 0:
             return ImmediateFuture([])
@@ -418,7 +514,7 @@ class Map(Proxy):
 
         entry_processor_data = self._to_data(entry_processor)
         request = map_execute_on_keys_codec.encode_request(self.name, entry_processor_data, key_list)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def flush(self):
         """Flushes all the local dirty entries.
@@ -445,13 +541,13 @@ class Map(Proxy):
             hazelcast.future.Future[None]:
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_force_unlock_codec.encode_request(self.name, key_data,
                                                         self._reference_id_generator.get_and_increment())
         return self._invoke_on_key(request, key_data)
 
-    def get(self, key):
+    def get(self, key, timeout=None):
         """Returns the value for the specified key, or ``None`` if this map does not contain this key.
         
         Warning:
@@ -468,13 +564,17 @@ class Map(Proxy):
 
         Args:
             key: The specified key.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[any]: The value for the specified key.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
-        return self._get_internal(key_data)
+        key_data = self._key_to_data(key)
+        return self._get_internal(key_data, timeout)
 
     def get_all(self, keys):
         """Returns the entries for the given keys.
@@ -502,7 +602,7 @@ class Map(Proxy):
 
         for key in keys:
             check_not_none(key, "key can't be None")
-            key_data = self._to_data(key)
+            key_data = self._key_to_data(key)
             partition_id = partition_service.get_partition_id(key_data)
             try:
                 partition_to_keys[partition_id][key] = key_data
@@ -511,6 +611,35 @@ class Map(Proxy):
 
         return self._get_all_internal(partition_to_keys)
 
+    def get_compression_statistics(self):
+        """Returns the statistics of the value compression of this map.
+
+        The statistics are collected locally, for the values compressed by this
+        client. See the ``value_compression`` option of the client.
+
+        Returns:
+            dict: The statistics described in
+            :func:`hazelcast.serialization.compression.ValueCompressor.get_statistics`, or ``None``
+            if the value compression is not configured for this map.
+        """
+        if self._value_compressor is None:
+            return None
+        return self._value_compressor.get_statistics()
+
+    def get_key_cache_statistics(self):
+        """Returns the statistics of the serialized key cache of this map.
+
+        See the ``key_caches`` option of the client.
+
+        Returns:
+            dict: The statistics described in
+            :func:`hazelcast.serialization.key_cache.KeyDataCache.get_statistics`, or ``None``
+            if the key cache is not configured for this map.
+        """
+        if self._key_cache is None:
+            return None
+        return self._key_cache.get_statistics()
+
     def get_entry_view(self, key):
         """Returns the EntryView for the specified key.
         
@@ -540,7 +669,7 @@ class Map(Proxy):
             entry_view.value = self._to_object(entry_view.value)
             return entry_view
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_get_entry_view_codec.encode_request(self.name, key_data, thread_id())
         return self._invoke_on_key(request, key_data, handler)
 
@@ -567,11 +696,34 @@ class Map(Proxy):
             hazelcast.future.Future[bool]: ``True`` if lock is acquired, ``False`` otherwise.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_is_locked_codec.encode_request(self.name, key_data)
         return self._invoke_on_key(request, key_data, map_is_locked_codec.decode_response)
 
+    def iterator(self, fetch_size=100, iteration_type=IterationType.ENTRY):
+        """Returns an iterator that fetches the map partition by partition, in pages.
+
+        Unlike :func:`entry_set`, :func:`key_set` and :func:`values`, the whole map
+        is not transferred in a single response. The partitions are walked one at
+        a time and each page holds at most ``fetch_size`` items. While a page is
+        consumed, the next one is fetched, so at most two pages are held in memory.
+
+        The iterator does not provide a consistent snapshot of the map. The entries
+        that are added or removed during the iteration may or may not be returned.
+
+        Args:
+            fetch_size (int): Maximum number of items to fetch in a page.
+            iteration_type (int): Whether to iterate over the keys, the values, or the
+                key-value tuples. See :class:`hazelcast.util.IterationType`.
+
+        Returns:
+            iterator: Iterator over the items of the map.
+        """
+        check_true(fetch_size > 0, "fetch_size must be positive")
+        partition_count = self._partition_service.get_partition_count()
+        return self._iterate_pages(partition_count, fetch_size, iteration_type)
+
     def key_set(self, predicate=None):
         """Returns a List clone of the keys contained in this map or 
         the keys of the entries filtered with the predicate if provided.
@@ -661,16 +813,49 @@ class Map(Proxy):
             hazelcast.future.Future[None]:
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
 
         request = map_lock_codec.encode_request(self.name, key_data, thread_id(), to_millis(lease_time),
                                                 self._reference_id_generator.get_and_increment())
         partition_id = self._context.partition_service.get_partition_id(key_data)
-        invocation = Invocation(request, partition_id=partition_id, timeout=MAX_SIZE)
+        invocation = Invocation(request, partition_id=partition_id, timeout=MAX_SIZE, count_in_flight=False)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
-    def put(self, key, value, ttl=None, max_idle=None):
+    def project(self, projection, predicate=None):
+        """Applies the projection logic on the map entries and returns the result.
+
+        The projection is performed on the members, so only the projected values
+        are sent to the client and deserialized there. If the predicate is given,
+        only the entries that satisfy it are projected.
+
+        Args:
+            projection (hazelcast.projection.Projection): Projection to project the entries with.
+            predicate (hazelcast.predicate.Predicate): Predicate to filter the entries with.
+
+        Returns:
+            hazelcast.future.Future[list]: The list of the projected values. The values are
+            deserialized lazily, when they are accessed.
+        """
+        check_not_none(projection, "projection can't be None")
+        projection_data = self._to_data(projection)
+        if predicate:
+            check_true(not isinstance(predicate, PagingPredicate), "Paging predicate is not supported.")
+
+            def handler(message):
+                return ImmutableLazyDataList(map_project_with_predicate_codec.decode_response(message), self._to_object)
+
+            predicate_data = self._to_data(predicate)
+            request = map_project_with_predicate_codec.encode_request(self.name, projection_data, predicate_data)
+        else:
+            def handler(message):
+                return ImmutableLazyDataList(map_project_codec.decode_response(message), self._to_object)
+
+            request = map_project_codec.encode_request(self.name, projection_data)
+
+        return self._invoke(request, handler)
+
+    def put(self, key, value, ttl=None, max_idle=None, timeout=None):
         """Associates the specified value with the specified key in this map. 
         
         If the map previously contained a mapping for the key, the old value is replaced by the specified value. 
@@ -695,6 +880,10 @@ class Map(Proxy):
                 in the map. If not provided, the value configured on the server
                 side configuration will be used. Setting this to ``0`` means
                 infinite max idle time.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[any]: Previous value associated with key 
@@ -702,9 +891,9 @@ class Map(Proxy):
         """
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
-        return self._put_internal(key_data, value_data, ttl, max_idle)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
+        return self._put_internal(key_data, value_data, ttl, max_idle, timeout)
 
     def put_all(self, map):
         """Copies all of the mappings from the specified map to this map. 
@@ -728,7 +917,7 @@ class Map(Proxy):
         for key, value in six.iteritems(map):
             check_not_none(key, "key can't be None")
             check_not_none(value, "value can't be None")
-            entry = (self._to_data(key), self._to_data(value))
+            entry = (self._key_to_data(key), self._value_to_data(value))
             partition_id = partition_service.get_partition_id(entry[0])
             try:
                 partition_map[partition_id].append(entry)
@@ -781,8 +970,8 @@ class Map(Proxy):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
         return self._put_if_absent_internal(key_data, value_data, ttl, max_idle)
 
     def put_transient(self, key, value, ttl=None, max_idle=None):
@@ -810,11 +999,55 @@ class Map(Proxy):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
         return self._put_transient_internal(key_data, value_data, ttl, max_idle)
 
-    def remove(self, key):
+    def read_from_event_journal(self, start_sequence, min_size, max_size, partition_id, predicate=None,
+                                projection=None):
+        """Reads a batch of events from the event journal of the given partition.
+
+        The read waits on the member until at least ``min_size`` events are available.
+        Then, at most ``max_size`` events are returned.
+
+        Args:
+            start_sequence (int): Sequence of the first event to read.
+            min_size (int): Minimum number of events to read.
+            max_size (int): Maximum number of events to read.
+            partition_id (int): Id of the partition.
+            predicate: Member side predicate to filter the events with.
+            projection: Member side projection to transform the events with.
+
+        Returns:
+            hazelcast.future.Future[hazelcast.proxy.event_journal.EventJournalReadResult]: The read
+            events. Without a projection, the items are
+            :class:`hazelcast.proxy.event_journal.EventJournalMapEvent` instances.
+        """
+        check_not_negative(min_size, "min_size can't be negative")
+        check_true(max_size >= min_size, "max_size should be greater than or equal to min_size")
+        if projection is None:
+            is_big_endian = self._context.config.is_big_endian
+
+            def to_item(data):
+                return _to_event_journal_map_event(self._to_object, is_big_endian, data)
+        else:
+            to_item = self._to_object
+
+        def handler(message):
+            response = map_event_journal_read_codec.decode_response(message)
+            return EventJournalReadResult(response["read_count"], ImmutableLazyDataList(response["items"], to_item),
+                                          response["item_seqs"], response["next_seq"])
+
+        request = map_event_journal_read_codec.encode_request(self.name, start_sequence, min_size, max_size,
+                                                              self._to_data(predicate), self._to_data(projection))
+        # Blocks on the member until min_size events are available, so it is not
+        # counted in flight, not to hold the room of the other invocations.
+        invocation = Invocation(request, partition_id=partition_id, timeout=MAX_SIZE, response_handler=handler,
+                                count_in_flight=False)
+        self._invocation_service.invoke(invocation)
+        return invocation.future
+
+    def remove(self, key, timeout=None):
         """Removes the mapping for a key from this map if it is present. 
         
         The map will not contain a mapping for the specified key once the call returns.
@@ -825,14 +1058,35 @@ class Map(Proxy):
 
         Args:
             key: Key of the mapping to be deleted.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[any]: The previous value associated with key, 
             or ``None`` if there was no mapping for key.
         """
         check_not_none(key, "key can't be None")
-        key_data = self._to_data(key)
-        return self._remove_internal(key_data)
+        key_data = self._key_to_data(key)
+        return self._remove_internal(key_data, timeout)
+
+    def remove_all(self, predicate):
+        """Removes all the entries that satisfy the given predicate.
+
+        The entries are removed on the members, in a single pass over each partition,
+        without sending the keys to the client.
+
+        Args:
+            predicate (hazelcast.predicate.Predicate): Predicate to filter the entries to remove.
+
+        Returns:
+            hazelcast.future.Future[None]:
+        """
+        check_not_none(predicate, "predicate can't be None")
+        check_true(not isinstance(predicate, PagingPredicate), "Paging predicate is not supported.")
+        predicate_data = self._to_data(predicate)
+        return self._remove_all_internal(predicate_data)
 
     def remove_if_same(self, key, value):
         """Removes the entry for a key only if it is currently mapped to a given value.
@@ -859,8 +1113,8 @@ class Map(Proxy):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
         return self._remove_if_same_internal_(key_data, value_data)
 
     def remove_entry_listener(self, registration_id):
@@ -905,8 +1159,8 @@ class Map(Proxy):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
 
         return self._replace_internal(key_data, value_data)
 
@@ -937,13 +1191,13 @@ class Map(Proxy):
         check_not_none(old_value, "old_value can't be None")
         check_not_none(new_value, "new_value can't be None")
 
-        key_data = self._to_data(key)
-        old_value_data = self._to_data(old_value)
-        new_value_data = self._to_data(new_value)
+        key_data = self._key_to_data(key)
+        old_value_data = self._value_to_data(old_value)
+        new_value_data = self._value_to_data(new_value)
 
         return self._replace_if_same_internal(key_data, old_value_data, new_value_data)
 
-    def set(self, key, value, ttl=None, max_idle=None):
+    def set(self, key, value, ttl=None, max_idle=None, timeout=None):
         """Puts an entry into this map.
 
         Similar to the put operation except that set doesn't return the old value, which is more efficient.
@@ -964,15 +1218,19 @@ class Map(Proxy):
                 in the map. If not provided, the value configured on the server
                 side configuration will be used. Setting this to ``0`` means
                 infinite max idle time.
+            timeout (float): Maximum time in seconds to wait for the result,
+                after which the returned future fails with
+                ``OperationTimeoutError``. If not provided, the invocation
+                timeout of the client is used.
 
         Returns:
             hazelcast.future.Future[None]:
         """
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
-        return self._set_internal(key_data, value_data, ttl, max_idle)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
+        return self._set_internal(key_data, value_data, ttl, max_idle, timeout)
 
     def set_ttl(self, key, ttl):
         """Updates the TTL (time to live) value of the entry specified by the given key with a new TTL value. 
@@ -991,7 +1249,7 @@ class Map(Proxy):
         """
         check_not_none(key, "key can't be None")
         check_not_none(ttl, "ttl can't be None")
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._set_ttl_internal(key_data, ttl)
 
     def size(self):
@@ -1003,6 +1261,23 @@ class Map(Proxy):
         request = map_size_codec.encode_request(self.name)
         return self._invoke(request, map_size_codec.decode_response)
 
+    def subscribe_to_event_journal(self, partition_id):
+        """Subscribes to the event journal of the given partition.
+
+        Args:
+            partition_id (int): Id of the partition.
+
+        Returns:
+            hazelcast.future.Future[hazelcast.proxy.event_journal.EventJournalInitialSubscriberState]: The
+            oldest and the newest sequences of the journal.
+        """
+        def handler(message):
+            response = map_event_journal_subscribe_codec.decode_response(message)
+            return EventJournalInitialSubscriberState(response["oldest_sequence"], response["newest_sequence"])
+
+        request = map_event_journal_subscribe_codec.encode_request(self.name)
+        return self._invoke_on_partition(request, partition_id, handler)
+
     def try_lock(self, key, lease_time=None, timeout=0):
         """Tries to acquire the lock for the specified key. 
         
@@ -1027,13 +1302,13 @@ class Map(Proxy):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_try_lock_codec.encode_request(self.name, key_data, thread_id(),
                                                     to_millis(lease_time), to_millis(timeout),
                                                     self._reference_id_generator.get_and_increment())
         partition_id = self._context.partition_service.get_partition_id(key_data)
         invocation = Invocation(request, partition_id=partition_id, timeout=MAX_SIZE,
-                                response_handler=map_try_lock_codec.decode_response)
+                                response_handler=map_try_lock_codec.decode_response, count_in_flight=False)
         self._invocation_service.invoke(invocation)
         return invocation.future
 
@@ -1053,8 +1328,8 @@ class Map(Proxy):
         check_not_none(key, "key can't be None")
         check_not_none(value, "value can't be None")
 
-        key_data = self._to_data(key)
-        value_data = self._to_data(value)
+        key_data = self._key_to_data(key)
+        value_data = self._value_to_data(value)
 
         return self._try_put_internal(key_data, value_data, timeout)
 
@@ -1072,7 +1347,7 @@ class Map(Proxy):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         return self._try_remove_internal(key_data, timeout)
 
     def unlock(self, key):
@@ -1089,7 +1364,7 @@ class Map(Proxy):
         """
         check_not_none(key, "key can't be None")
 
-        key_data = self._to_data(key)
+        key_data = self._key_to_data(key)
         request = map_unlock_codec.encode_request(self.name, key_data, thread_id(),
                                                   self._reference_id_generator.get_and_increment())
         return self._invoke_on_key(request, key_data)
@@ -1139,16 +1414,16 @@ class Map(Proxy):
         return self._invoke(request, handler)
 
     # internals
-    def _contains_key_internal(self, key_data):
+    def _contains_key_internal(self, key_data, timeout=None):
         request = map_contains_key_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, map_contains_key_codec.decode_response)
+        return self._invoke_on_key(request, key_data, map_contains_key_codec.decode_response, timeout)
 
-    def _get_internal(self, key_data):
+    def _get_internal(self, key_data, timeout=None):
         def handler(message):
             return self._to_object(map_get_codec.decode_response(message))
 
         request = map_get_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, handler, timeout)
 
     def _get_all_internal(self, partition_to_keys, futures=None):
         if futures is None:
@@ -1167,22 +1442,62 @@ class Map(Proxy):
 
         return combine_futures(futures).continue_with(merge)
 
-    def _remove_internal(self, key_data):
+    def _remove_internal(self, key_data, timeout=None):
         def handler(message):
             return self._to_object(map_remove_codec.decode_response(message))
 
         request = map_remove_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, handler, timeout)
 
     def _remove_if_same_internal_(self, key_data, value_data):
         request = map_remove_if_same_codec.encode_request(self.name, key_data, value_data, thread_id())
         return self._invoke_on_key(request, key_data, response_handler=map_remove_if_same_codec.decode_response)
 
-    def _delete_internal(self, key_data):
+    def _remove_all_internal(self, predicate_data):
+        request = map_remove_all_codec.encode_request(self.name, predicate_data)
+        return self._invoke(request)
+
+    def _fetch_page(self, partition_id, iteration_pointers, fetch_size, iteration_type):
+        if iteration_type == IterationType.KEY:
+            def handler(message):
+                response = map_fetch_keys_codec.decode_response(message)
+                return response["iteration_pointers"], ImmutableLazyDataList(response["keys"], self._to_object)
+
+            request = map_fetch_keys_codec.encode_request(self.name, iteration_pointers, fetch_size)
+        else:
+            def handler(message):
+                response = map_fetch_entries_codec.decode_response(message)
+                entries = response["entries"]
+                if iteration_type == IterationType.VALUE:
+                    entries = [value for _, value in entries]
+                return response["iteration_pointers"], ImmutableLazyDataList(entries, self._to_object)
+
+            request = map_fetch_entries_codec.encode_request(self.name, iteration_pointers, fetch_size)
+        return self._invoke_on_partition(request, partition_id, handler)
+
+    def _iterate_pages(self, partition_count, fetch_size, iteration_type):
+        partition_id = 0
+        future = self._fetch_page(partition_id, _INITIAL_ITERATION_POINTERS, fetch_size, iteration_type)
+        while future is not None:
+            iteration_pointers, page = future.result()
+            # Fetch the next page before handing over this one
+            if len(page) > 0 and iteration_pointers[-1][0] >= 0:
+                future = self._fetch_page(partition_id, iteration_pointers, fetch_size, iteration_type)
+            else:
+                partition_id += 1
+                if partition_id < partition_count:
+                    future = self._fetch_page(partition_id, _INITIAL_ITERATION_POINTERS, fetch_size,
+                                              iteration_type)
+                else:
+                    future = None
+            for item in page.drain():
+                yield item
+
+    def _delete_internal(self, key_data, timeout=None):
         request = map_delete_codec.encode_request(self.name, key_data, thread_id())
-        return self._invoke_on_key(request, key_data)
+        return self._invoke_on_key(request, key_data, timeout=timeout)
 
-    def _put_internal(self, key_data, value_data, ttl, max_idle):
+    def _put_internal(self, key_data, value_data, ttl, max_idle, timeout=None):
         def handler(message):
             return self._to_object(map_put_codec.decode_response(message))
 
@@ -1191,15 +1506,15 @@ class Map(Proxy):
                                                                  to_millis(ttl), to_millis(max_idle))
         else:
             request = map_put_codec.encode_request(self.name, key_data, value_data, thread_id(), to_millis(ttl))
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, handler, timeout)
 
-    def _set_internal(self, key_data, value_data, ttl, max_idle):
+    def _set_internal(self, key_data, value_data, ttl, max_idle, timeout=None):
         if max_idle is not None:
             request = map_set_with_max_idle_codec.encode_request(self.name, key_data, value_data, thread_id(),
                                                                  to_millis(ttl), to_millis(max_idle))
         else:
             request = map_set_codec.encode_request(self.name, key_data, value_data, thread_id(), to_millis(ttl))
-        return self._invoke_on_key(request, key_data)
+        return self._invoke_on_key(request, key_data, timeout=timeout)
 
     def _set_ttl_internal(self, key_data, ttl):
         request = map_set_ttl_codec.encode_request(self.name, key_data, to_millis(ttl))
@@ -1207,11 +1522,13 @@ class Map(Proxy):
 
     def _try_remove_internal(self, key_data, timeout):
         request = map_try_remove_codec.encode_request(self.name, key_data, thread_id(), to_millis(timeout))
-        return self._invoke_on_key(request, key_data, map_try_remove_codec.decode_response)
+        return self._invoke_on_key(request, key_data, map_try_remove_codec.decode_response, timeout=MAX_SIZE,
+                                   count_in_flight=False)
 
     def _try_put_internal(self, key_data, value_data, timeout):
         request = map_try_put_codec.encode_request(self.name, key_data, value_data, thread_id(), to_millis(timeout))
-        return self._invoke_on_key(request, key_data, map_try_put_codec.decode_response)
+        return self._invoke_on_key(request, key_data, map_try_put_codec.decode_response, timeout=MAX_SIZE,
+                                   count_in_flight=False)
 
     def _put_transient_internal(self, key_data, value_data, ttl, max_idle):
         if max_idle is not None:
@@ -1260,7 +1577,7 @@ class Map(Proxy):
 
         entry_processor_data = self._to_data(entry_processor)
         request = map_execute_on_key_codec.encode_request(self.name, entry_processor_data, key_data, thread_id())
-        return self._invoke_on_key(request, key_data, handler)
+        return self._invoke_on_key(request, key_data, handler, timeout=MAX_SIZE, count_in_flight=False)
 
 
 class MapFeatNearCache(Map):
@@ -1325,18 +1642,18 @@ class MapFeatNearCache(Map):
             self._near_cache._invalidate(key_data)
 
     # internals
-    def _contains_key_internal(self, key_data):
+    def _contains_key_internal(self, key_data, timeout=None):
         try:
             return self._near_cache[key_data]
         except KeyError:
-            return super(MapFeatNearCache, self)._contains_key_internal(key_data)
+            return super(MapFeatNearCache, self)._contains_key_internal(key_data, timeout)
 
-    def _get_internal(self, key_data):
+    def _get_internal(self, key_data, timeout=None):
         try:
             value = self._near_cache[key_data]
             return ImmediateFuture(value)
         except KeyError:
-            future = super(MapFeatNearCache, self)._get_internal(key_data)
+            future = super(MapFeatNearCache, self)._get_internal(key_data, timeout)
             return future.continue_with(self._update_cache, key_data)
 
     def _update_cache(self, f, key_data):
@@ -1366,9 +1683,9 @@ class MapFeatNearCache(Map):
         self._invalidate_cache(key_data)
         return super(MapFeatNearCache, self)._try_put_internal(key_data, value_data, timeout)
 
-    def _set_internal(self, key_data, value_data, ttl, max_idle):
+    def _set_internal(self, key_data, value_data, ttl, max_idle, timeout=None):
         self._invalidate_cache(key_data)
-        return super(MapFeatNearCache, self)._set_internal(key_data, value_data, ttl, max_idle)
+        return super(MapFeatNearCache, self)._set_internal(key_data, value_data, ttl, max_idle, timeout)
 
     def _set_ttl_internal(self, key_data, ttl):
         self._invalidate_cache(key_data)
@@ -1382,21 +1699,31 @@ class MapFeatNearCache(Map):
         self._invalidate_cache(key_data)
         return super(MapFeatNearCache, self)._replace_if_same_internal(key_data, old_value_data, new_value_data)
 
-    def _remove_internal(self, key_data):
+    def _remove_internal(self, key_data, timeout=None):
         self._invalidate_cache(key_data)
-        return super(MapFeatNearCache, self)._remove_internal(key_data)
+        return super(MapFeatNearCache, self)._remove_internal(key_data, timeout)
 
     def _remove_if_same_internal_(self, key_data, value_data):
         self._invalidate_cache(key_data)
         return super(MapFeatNearCache, self)._remove_if_same_internal_(key_data, value_data)
 
+    def _remove_all_internal(self, predicate_data):
+        # The removed keys are not known on the client, so the whole near cache is
+        # cleared once the entries are removed, like the Java client does
+        future = super(MapFeatNearCache, self)._remove_all_internal(predicate_data)
+        return future.continue_with(self._clear_near_cache)
+
+    def _clear_near_cache(self, f):
+        self._near_cache._clear()
+        return f.result()
+
     def _put_transient_internal(self, key_data, value_data, ttl, max_idle):
         self._invalidate_cache(key_data)
         return super(MapFeatNearCache, self)._put_transient_internal(key_data, value_data, ttl, max_idle)
 
-    def _put_internal(self, key_data, value_data, ttl, max_idle):
+    def _put_internal(self, key_data, value_data, ttl, max_idle, timeout=None):
         self._invalidate_cache(key_data)
-        return super(MapFeatNearCache, self)._put_internal(key_data, value_data, ttl, max_idle)
+        return super(MapFeatNearCache, self)._put_internal(key_data, value_data, ttl, max_idle, timeout)
 
     def _put_if_absent_internal(self, key_data, value_data, ttl, max_idle):
         self._invalidate_cache(key_data)
@@ -1414,9 +1741,9 @@ class MapFeatNearCache(Map):
         self._invalidate_cache(key_data)
         return super(MapFeatNearCache, self)._evict_internal(key_data)
 
-    def _delete_internal(self, key_data):
+    def _delete_internal(self, key_data, timeout=None):
         self._invalidate_cache(key_data)
-        return super(MapFeatNearCache, self)._delete_internal(key_data)
+        return super(MapFeatNearCache, self)._delete_internal(key_data, timeout)
 
 
 def create_map_proxy(service_name, name, context):
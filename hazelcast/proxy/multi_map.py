@@ -4,7 +4,7 @@ from hazelcast.protocol.codec import multi_map_add_entry_listener_codec, multi_m
     multi_map_key_set_codec, multi_map_lock_codec, multi_map_put_codec, multi_map_remove_codec, \
     multi_map_remove_entry_codec, multi_map_remove_entry_listener_codec, multi_map_size_codec, multi_map_try_lock_codec, \
     multi_map_unlock_codec, multi_map_value_count_codec, multi_map_values_codec
-from hazelcast.proxy.base import Proxy, EntryEvent, EntryEventType
+from hazelcast.proxy.base import Proxy, EntryEvent, EntryEventType, MAX_SIZE
 from hazelcast.util import check_not_none, thread_id, to_millis, ImmutableLazyDataList
 
 
@@ -237,7 +237,7 @@ class MultiMap(Proxy):
         key_data = self._to_data(key)
         request = multi_map_lock_codec.encode_request(self.name, key_data, thread_id(), to_millis(lease_time),
                                                       self._reference_id_generator.get_and_increment())
-        return self._invoke_on_key(request, key_data)
+        return self._invoke_on_key(request, key_data, timeout=MAX_SIZE, count_in_flight=False)
 
     def remove(self, key, value):
         """Removes the given key-value tuple from the multimap.
@@ -392,7 +392,8 @@ class MultiMap(Proxy):
         request = multi_map_try_lock_codec.encode_request(self.name, key_data, thread_id(),
                                                           to_millis(lease_time), to_millis(timeout),
                                                           self._reference_id_generator.get_and_increment())
-        return self._invoke_on_key(request, key_data, multi_map_try_lock_codec.decode_response)
+        return self._invoke_on_key(request, key_data, multi_map_try_lock_codec.decode_response, timeout=MAX_SIZE,
+                                   count_in_flight=False)
 
     def unlock(self, key):
         """Releases the lock for the specified key. It never blocks and returns immediately.
@@ -19,7 +19,7 @@ from hazelcast.protocol.codec import \
     queue_remove_listener_codec, \
     queue_size_codec, \
     queue_take_codec
-from hazelcast.proxy.base import PartitionSpecificProxy, ItemEvent, ItemEventType
+from hazelcast.proxy.base import PartitionSpecificProxy, ItemEvent, ItemEventType, MAX_SIZE
 from hazelcast.util import check_not_none, to_millis, ImmutableLazyDataList
 
 
@@ -198,7 +198,7 @@ class Queue(PartitionSpecificProxy):
         check_not_none(item, "Value can't be None")
         element_data = self._to_data(item)
         request = queue_offer_codec.encode_request(self.name, element_data, to_millis(timeout))
-        return self._invoke(request, queue_offer_codec.decode_response)
+        return self._invoke(request, queue_offer_codec.decode_response, timeout=MAX_SIZE, count_in_flight=False)
 
     def peek(self):
         """Retrieves the head of queue without removing it from the queue. 
@@ -231,7 +231,7 @@ class Queue(PartitionSpecificProxy):
             return self._to_object(queue_poll_codec.decode_response(message))
 
         request = queue_poll_codec.encode_request(self.name, to_millis(timeout))
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def put(self, item):
         """Adds the specified element into this queue. 
@@ -247,7 +247,7 @@ class Queue(PartitionSpecificProxy):
         check_not_none(item, "Value can't be None")
         element_data = self._to_data(item)
         request = queue_put_codec.encode_request(self.name, element_data)
-        return self._invoke(request)
+        return self._invoke(request, timeout=MAX_SIZE, count_in_flight=False)
 
     def remaining_capacity(self):
         """Returns the remaining capacity of this queue.
@@ -343,4 +343,4 @@ class Queue(PartitionSpecificProxy):
             return self._to_object(queue_take_codec.decode_response(message))
 
         request = queue_take_codec.encode_request(self.name)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
@@ -2,7 +2,7 @@ from hazelcast.future import ImmediateFuture, Future
 from hazelcast.protocol.codec import ringbuffer_add_all_codec, ringbuffer_add_codec, ringbuffer_capacity_codec, \
     ringbuffer_head_sequence_codec, ringbuffer_read_many_codec, ringbuffer_read_one_codec, \
     ringbuffer_remaining_capacity_codec, ringbuffer_size_codec, ringbuffer_tail_sequence_codec
-from hazelcast.proxy.base import PartitionSpecificProxy
+from hazelcast.proxy.base import PartitionSpecificProxy, MAX_SIZE
 from hazelcast.util import check_not_negative, check_not_none, check_not_empty, check_true, ImmutableLazyDataList
 
 OVERFLOW_POLICY_OVERWRITE = 0
@@ -211,7 +211,8 @@ class Ringbuffer(PartitionSpecificProxy):
                 capacity = capacity.result()
                 check_true(min_count <= capacity, "min count: %d should be smaller or equal to capacity: %d"
                            % (min_count, capacity))
-                f = self._invoke(request, handler)
+                # Blocks on the member until min count items are available
+                f = self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
                 f.add_done_callback(set_result)
             except Exception as e:
                 future.set_exception(e)
@@ -4,7 +4,7 @@ from hazelcast.protocol.codec import transactional_map_contains_key_codec, trans
     transactional_map_put_if_absent_codec, transactional_map_remove_codec, transactional_map_remove_if_same_codec, \
     transactional_map_replace_codec, transactional_map_replace_if_same_codec, transactional_map_set_codec, \
     transactional_map_size_codec, transactional_map_values_codec, transactional_map_values_with_predicate_codec
-from hazelcast.proxy.base import TransactionalProxy
+from hazelcast.proxy.base import TransactionalProxy, MAX_SIZE
 from hazelcast.util import check_not_none, to_millis, thread_id, ImmutableLazyDataList
 
 
@@ -67,7 +67,7 @@ class TransactionalMap(TransactionalProxy):
         key_data = self._to_data(key)
         request = transactional_map_get_for_update_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                         key_data)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def size(self):
         """Transactional implementation of :func:`Map.size() <hazelcast.proxy.map.Map.size>`
@@ -112,7 +112,7 @@ class TransactionalMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_map_put_codec.encode_request(self.name, self.transaction.id, thread_id(), key_data,
                                                              value_data, to_millis(ttl))
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def put_if_absent(self, key, value):
         """Transactional implementation of :func:`Map.put_if_absent(key, value) <hazelcast.proxy.map.Map.put_if_absent>`
@@ -137,7 +137,7 @@ class TransactionalMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_map_put_if_absent_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                        key_data, value_data)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def set(self, key, value):
         """Transactional implementation of :func:`Map.set(key, value) <hazelcast.proxy.map.Map.set>`
@@ -159,7 +159,7 @@ class TransactionalMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_map_set_codec.encode_request(self.name, self.transaction.id,
                                                              thread_id(), key_data, value_data)
-        return self._invoke(request)
+        return self._invoke(request, timeout=MAX_SIZE, count_in_flight=False)
 
     def replace(self, key, value):
         """Transactional implementation of :func:`Map.replace(key, value) <hazelcast.proxy.map.Map.replace>`
@@ -185,7 +185,7 @@ class TransactionalMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_map_replace_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                  key_data, value_data)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def replace_if_same(self, key, old_value, new_value):
         """Transactional implementation of :func:`Map.replace_if_same(key, old_value, new_value)
@@ -211,7 +211,8 @@ class TransactionalMap(TransactionalProxy):
         new_value_data = self._to_data(new_value)
         request = transactional_map_replace_if_same_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                          key_data, old_value_data, new_value_data)
-        return self._invoke(request, transactional_map_replace_if_same_codec.decode_response)
+        return self._invoke(request, transactional_map_replace_if_same_codec.decode_response, timeout=MAX_SIZE,
+                            count_in_flight=False)
 
     def remove(self, key):
         """Transactional implementation of :func:`Map.remove(key) <hazelcast.proxy.map.Map.remove>`
@@ -233,7 +234,7 @@ class TransactionalMap(TransactionalProxy):
 
         key_data = self._to_data(key)
         request = transactional_map_remove_codec.encode_request(self.name, self.transaction.id, thread_id(), key_data)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def remove_if_same(self, key, value):
         """Transactional implementation of :func:`Map.remove_if_same(key, value)
@@ -256,7 +257,8 @@ class TransactionalMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_map_remove_if_same_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                         key_data, value_data)
-        return self._invoke(request, transactional_map_remove_if_same_codec.decode_response)
+        return self._invoke(request, transactional_map_remove_if_same_codec.decode_response, timeout=MAX_SIZE,
+                            count_in_flight=False)
 
     def delete(self, key):
         """Transactional implementation of :func:`Map.delete(key) <hazelcast.proxy.map.Map.delete>`
@@ -274,7 +276,7 @@ class TransactionalMap(TransactionalProxy):
 
         key_data = self._to_data(key)
         request = transactional_map_delete_codec.encode_request(self.name, self.transaction.id, thread_id(), key_data)
-        return self._invoke(request)
+        return self._invoke(request, timeout=MAX_SIZE, count_in_flight=False)
 
     def key_set(self, predicate=None):
         """Transactional implementation of :func:`Map.key_set(predicate) <hazelcast.proxy.map.Map.key_set>`
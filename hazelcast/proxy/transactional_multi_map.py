@@ -1,7 +1,7 @@
 from hazelcast.protocol.codec import transactional_multi_map_get_codec, transactional_multi_map_put_codec, \
     transactional_multi_map_remove_codec, transactional_multi_map_remove_entry_codec, \
     transactional_multi_map_size_codec, transactional_multi_map_value_count_codec
-from hazelcast.proxy.base import TransactionalProxy
+from hazelcast.proxy.base import TransactionalProxy, MAX_SIZE
 from hazelcast.util import check_not_none, thread_id, ImmutableLazyDataList
 
 
@@ -26,7 +26,8 @@ class TransactionalMultiMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_multi_map_put_codec.encode_request(self.name, self.transaction.id,
                                                                    thread_id(), key_data, value_data)
-        return self._invoke(request, transactional_multi_map_put_codec.decode_response)
+        return self._invoke(request, transactional_multi_map_put_codec.decode_response, timeout=MAX_SIZE,
+                            count_in_flight=False)
 
     def get(self, key):
         """Transactional implementation of :func:`MultiMap.get(key) <hazelcast.proxy.multi_map.MultiMap.get>`
@@ -65,7 +66,8 @@ class TransactionalMultiMap(TransactionalProxy):
         value_data = self._to_data(value)
         request = transactional_multi_map_remove_entry_codec.encode_request(self.name, self.transaction.id,
                                                                             thread_id(), key_data, value_data)
-        return self._invoke(request, transactional_multi_map_remove_entry_codec.decode_response)
+        return self._invoke(request, transactional_multi_map_remove_entry_codec.decode_response, timeout=MAX_SIZE,
+                            count_in_flight=False)
 
     def remove_all(self, key):
         """Transactional implementation of :func:`MultiMap.remove_all(key)
@@ -85,7 +87,7 @@ class TransactionalMultiMap(TransactionalProxy):
         key_data = self._to_data(key)
         request = transactional_multi_map_remove_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                       key_data)
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def value_count(self, key):
         """Transactional implementation of :func:`MultiMap.value_count(key)
@@ -1,6 +1,6 @@
 from hazelcast.protocol.codec import transactional_queue_offer_codec, transactional_queue_peek_codec, \
     transactional_queue_poll_codec, transactional_queue_size_codec, transactional_queue_take_codec
-from hazelcast.proxy.base import TransactionalProxy
+from hazelcast.proxy.base import TransactionalProxy, MAX_SIZE
 from hazelcast.util import check_not_none, to_millis, thread_id
 
 
@@ -21,7 +21,8 @@ class TransactionalQueue(TransactionalProxy):
         item_data = self._to_data(item)
         request = transactional_queue_offer_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                  item_data, to_millis(timeout))
-        return self._invoke(request, transactional_queue_offer_codec.decode_response)
+        return self._invoke(request, transactional_queue_offer_codec.decode_response, timeout=MAX_SIZE,
+                            count_in_flight=False)
 
     def take(self):
         """Transactional implementation of :func:`Queue.take() <hazelcast.proxy.queue.Queue.take>`
@@ -33,7 +34,7 @@ class TransactionalQueue(TransactionalProxy):
             return self._to_object(transactional_queue_take_codec.decode_response(message))
 
         request = transactional_queue_take_codec.encode_request(self.name, self.transaction.id, thread_id())
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def poll(self, timeout=0):
         """Transactional implementation of :func:`Queue.poll(timeout) <hazelcast.proxy.queue.Queue.poll>`
@@ -50,7 +51,7 @@ class TransactionalQueue(TransactionalProxy):
 
         request = transactional_queue_poll_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                 to_millis(timeout))
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def peek(self, timeout=0):
         """Transactional implementation of :func:`Queue.peek(timeout) <hazelcast.proxy.queue.Queue.peek>`
@@ -67,7 +68,7 @@ class TransactionalQueue(TransactionalProxy):
 
         request = transactional_queue_peek_codec.encode_request(self.name, self.transaction.id, thread_id(),
                                                                 to_millis(timeout))
-        return self._invoke(request, handler)
+        return self._invoke(request, handler, timeout=MAX_SIZE, count_in_flight=False)
 
     def size(self):
         """Transactional implementation of :func:`Queue.size() <hazelcast.proxy.queue.Queue.size>`
@@ -1,7 +1,7 @@
 import asyncore
 import errno
-import io
 import logging
+import math
 import os
 import select
 import socket
@@ -11,14 +11,13 @@ import time
 
 from collections import deque
 from functools import total_ordering
-from heapq import heappush, heappop
 
 from hazelcast import six
-from hazelcast.config import SSLProtocol
+from hazelcast.config import SSLProtocol, ReactorLoop
 from hazelcast.connection import Connection
 from hazelcast.core import Address
 from hazelcast.errors import HazelcastError
-from hazelcast.future import Future
+from hazelcast.future import Future, _is_loop_thread
 
 try:
     import ssl
@@ -30,6 +29,18 @@ try:
 except ImportError:
     fcntl = None
 
+try:
+    import selectors
+except ImportError:
+    # Python2
+    selectors = None
+
+try:
+    import asyncio
+except ImportError:
+    # Python2
+    asyncio = None
+
 try:
     from _thread import get_ident
 except ImportError:
@@ -146,18 +157,116 @@ class _SocketedWaker(_AbstractWaker):
         self._writer.close()
 
 
+_TIMER_TICK_DURATION = 0.01
+_TIMER_WHEEL_SIZE = 512
+# Bounds the tick of the timers that never expire, like the ones with the infinite delay
+_TIMER_MAX_TICK = 2 ** 53
+
+
+class _TimerWheel(object):
+    """Hashed timer wheel.
+
+    Time is divided into ticks, and each timer is put into the bucket of
+    the first tick that starts after its end time. Buckets are reused
+    after a full revolution of the wheel, so each timer also keeps the
+    number of revolutions to wait before it expires. Adding and removing
+    a timer are constant time operations.
+
+    Accessed only from the reactor thread.
+    """
+
+    def __init__(self, now, tick_duration=_TIMER_TICK_DURATION, size=_TIMER_WHEEL_SIZE):
+        self._start = now
+        self._tick_duration = tick_duration
+        self._size = size
+        self._buckets = [dict() for _ in range(size)]  # id of the timer to timer
+        self._tick = 0  # The next tick to process
+        self._count = 0
+
+    def add(self, timer):
+        tick = min((timer.end - self._start) / self._tick_duration, _TIMER_MAX_TICK)
+        tick = max(int(math.ceil(tick)), self._tick)
+        timer.rounds = (tick - self._tick) // self._size
+        bucket = self._buckets[tick % self._size]
+        bucket[id(timer)] = timer
+        timer.bucket = bucket
+        self._count += 1
+
+    def remove(self, timer):
+        bucket = timer.bucket
+        if bucket is None:
+            return
+
+        del bucket[id(timer)]
+        timer.bucket = None
+        self._count -= 1
+
+    def expire(self, now):
+        """Returns the timers that expired until now, and removes them from the wheel."""
+        expired = []
+        last_tick = int((now - self._start) / self._tick_duration)
+        if self._count == 0:
+            self._tick = max(self._tick, last_tick + 1)
+            return expired
+
+        if last_tick - self._tick >= self._size:
+            # More than a revolution is missed. Instead of
+            # visiting the buckets repeatedly, place the
+            # timers again.
+            self._tick = last_tick + 1
+            for timer in self.clear():
+                if timer.end <= now:
+                    expired.append(timer)
+                else:
+                    self.add(timer)
+            return expired
+
+        buckets = self._buckets
+        size = self._size
+        while self._tick <= last_tick:
+            bucket = buckets[self._tick % size]
+            if bucket:
+                for timer in list(six.itervalues(bucket)):
+                    if timer.rounds > 0:
+                        timer.rounds -= 1
+                    else:
+                        self.remove(timer)
+                        expired.append(timer)
+            self._tick += 1
+        return expired
+
+    def clear(self):
+        """Removes all the timers and returns them."""
+        timers = []
+        for bucket in self._buckets:
+            for timer in six.itervalues(bucket):
+                timer.bucket = None
+                timers.append(timer)
+            bucket.clear()
+        self._count = 0
+        return timers
+
+    def __len__(self):
+        return self._count
+
+
 class _AbstractLoop(object):
     def __init__(self, map):
         self._map = map
-        self._timers = []  # Accessed only from the reactor thread
+        self._timer_wheel = _TimerWheel(time.time())  # Accessed only from the reactor thread
         self._new_timers = deque()  # Popped only from the reactor thread
+        self._canceled_timers = deque()  # Popped only from the reactor thread
         self._is_live = False
         self._thread = None
         self._ident = -1
 
-    def start(self):
+    @property
+    def map(self):
+        return self._map
+
+    def start(self, name="hazelcast-reactor"):
         self._is_live = True
-        self._thread = threading.Thread(target=self._loop, name="hazelcast-reactor")
+        self._thread = threading.Thread(target=self._loop, name=name)
         self._thread.daemon = True
         self._thread.start()
         self._ident = self._thread.ident
@@ -181,48 +290,56 @@ class _AbstractLoop(object):
         self._cleanup_all_timers()
 
     def add_timer(self, delay, callback):
-        timer = Timer(delay + time.time(), callback)
-        self._new_timers.append((timer.end, timer))
+        timer = Timer(delay + time.time(), callback, self._cancel_timer)
+        self._new_timers.append(timer)
         return timer
 
-    def _check_timers(self):
-        timers = self._timers
+    def _cancel_timer(self, timer):
+        if self._ident == get_ident():
+            self._timer_wheel.remove(timer)
+        else:
+            self._canceled_timers.append(timer)
 
-        if self._new_timers:
-            new_timers = self._new_timers
-            while new_timers:
-                # There is no need to check for exception here,
-                # reactor thread is the only one popping from
-                # the deque. So, if the we pass the size check
-                # above, there should be at least one element
-                heappush(timers, new_timers.popleft())
-
-        if timers:
-            now = time.time()
-            while timers:
-                timer = timers[0][1]
-                if timer.check_timer(now):
-                    heappop(timers)
-                else:
-                    # Timer in the root of the min heap is not expired.
-                    # Therefore, there should be no expired
-                    # timers in the heap.
-                    return
+    def _check_timers(self):
+        wheel = self._timer_wheel
+        now = time.time()
 
-    def _cleanup_all_timers(self):
-        timers = self._timers
         new_timers = self._new_timers
+        # Timers added by the callbacks below are handled
+        # on the next call, like the ones added by the I/O.
+        for _ in range(len(new_timers)):
+            # Reactor thread is the only one popping from
+            # the deque, so it has at least that many elements
+            timer = new_timers.popleft()
+            if timer.canceled:
+                continue
 
-        while timers:
-            _, timer = timers.pop()
-            timer.timer_ended_cb()
+            if timer.end <= now:
+                timer.timer_ended_cb()
+            else:
+                wheel.add(timer)
+
+        canceled_timers = self._canceled_timers
+        while canceled_timers:
+            wheel.remove(canceled_timers.popleft())
+
+        for timer in wheel.expire(now):
+            # Might be canceled by the callback of another expired timer
+            timer.check_timer(now)
+
+    def _cleanup_all_timers(self):
+        for timer in self._timer_wheel.clear():
+            if not timer.canceled:
+                timer.timer_ended_cb()
 
         # Although it is not the case with the current code base,
         # the timers ended above may add new timers. So, the order
         # is important.
+        new_timers = self._new_timers
         while new_timers:
-            _, timer = new_timers.popleft()
-            timer.timer_ended_cb()
+            timer = new_timers.popleft()
+            if not timer.canceled:
+                timer.timer_ended_cb()
 
     def check_loop(self):
         raise NotImplementedError("check_loop")
@@ -233,6 +350,15 @@ class _AbstractLoop(object):
     def wake_loop(self):
         raise NotImplementedError("wake_loop")
 
+    def start_writing(self, dispatcher):
+        # The asyncore loops check the writable() method of
+        # all the dispatchers on each iteration, so waking
+        # up the loop is enough.
+        self.wake_loop()
+
+    def stop_writing(self, dispatcher):
+        pass
+
     def shutdown(self):
         raise NotImplementedError("shutdown")
 
@@ -314,25 +440,126 @@ class _BasicLoop(_AbstractLoop):
         self._map.clear()
 
 
-class AsyncoreReactor(object):
+class _SelectorMap(dict):
+    """Socket map that reports the dispatchers asyncore adds to
+    or removes from it to the selector loop."""
+
     def __init__(self):
-        self.map = {}
-        loop = None
+        dict.__init__(self)
+        self.loop = None
+
+    def __setitem__(self, fd, dispatcher):
+        dict.__setitem__(self, fd, dispatcher)
+        self.loop.register(fd, dispatcher)
+
+    def __delitem__(self, fd):
+        dict.__delitem__(self, fd)
+        self.loop.unregister(fd)
+
+
+class _SelectorLoop(_WakeableLoop):
+    """Loop that keeps the dispatchers registered to a selector.
+
+    Unlike asyncore.loop, it does not check the readable() and writable()
+    methods of all the dispatchers on every iteration. Dispatchers are
+    registered for read events once, and for write events only between
+    start_writing and stop_writing calls. Registrations are changed only
+    from the reactor thread. Changes requested from other threads are
+    queued and the loop is woken up.
+    """
+
+    def __init__(self, map):
+        self._selector = selectors.DefaultSelector()
+        self._changes = deque()  # Popped only from the reactor thread
+        map.loop = self
+        _WakeableLoop.__init__(self, map)
+
+    def run_loop(self):
+        changes = self._changes
+        while changes:
+            fn, args = changes.popleft()
+            fn(*args)
+
+        map = self._map
+        for key, events in self._selector.select(0.01):
+            dispatcher = key.data
+            if events & selectors.EVENT_READ:
+                asyncore.read(dispatcher)
+            if events & selectors.EVENT_WRITE and map.get(key.fd) is dispatcher:
+                # Write only if the dispatcher is not closed while reading
+                asyncore.write(dispatcher)
+
+    def register(self, fd, dispatcher):
+        self._change(self._register, fd, dispatcher)
+
+    def unregister(self, fd):
+        self._change(self._unregister, fd)
+
+    def start_writing(self, dispatcher):
+        self._change(self._modify, dispatcher, selectors.EVENT_READ | selectors.EVENT_WRITE)
+
+    def stop_writing(self, dispatcher):
+        self._change(self._modify, dispatcher, selectors.EVENT_READ)
+
+    def shutdown(self):
+        _WakeableLoop.shutdown(self)
+        self._selector.close()
+
+    def _change(self, fn, *args):
+        if self._ident == get_ident() or not self._is_live:
+            fn(*args)
+        else:
+            self._changes.append((fn, args))
+            self.wake_loop()
+
+    def _register(self, fd, dispatcher):
+        # Connections are added to the map before they are connected, and
+        # an unconnected socket is reported as ready. Like asyncore.loop,
+        # skip them until they become readable or have something to write.
+        if dispatcher.readable() or dispatcher.writable():
+            self._selector.register(fd, selectors.EVENT_READ, dispatcher)
+
+    def _unregister(self, fd):
         try:
-            loop = _WakeableLoop(self.map)
-            loop.check_loop()
-        except:
-            _logger.exception("Failed to initialize the wakeable loop. "
-                              "Using the basic loop instead. "
-                              "When used in the blocking mode, client"
-                              "may have sub-optimal performance.")
-            if loop:
-                loop.shutdown()
-            loop = _BasicLoop(self.map)
-        self._loop = loop
+            self._selector.unregister(fd)
+        except (KeyError, ValueError):
+            # Already unregistered or the selector is closed
+            pass
+
+    def _modify(self, dispatcher, events):
+        fd = dispatcher._fileno
+        try:
+            self._selector.modify(fd, events, dispatcher)
+        except KeyError:
+            # Not registered yet, or closed
+            if self._map.get(fd) is dispatcher:
+                self._selector.register(fd, events, dispatcher)
+        except ValueError:
+            # Closed
+            pass
+
+
+class AsyncoreReactor(object):
+    """Reactor that runs the network I/O and timers on its own threads.
+
+    Timers run on a single loop. Unless more than one I/O thread is
+    requested, connections share that loop. Otherwise, each connection is
+    pinned to one of the I/O loops, so that reading and decoding a large
+    response from one member does not delay the responses of the others.
+    """
+
+    def __init__(self, loop_type=ReactorLoop.ASYNCORE, io_thread_count=1):
+        self._loop = self._create_loop(loop_type)
+        if io_thread_count > 1:
+            self._io_loops = [self._create_loop(loop_type) for _ in range(io_thread_count)]
+        else:
+            self._io_loops = [self._loop]
 
     def start(self):
         self._loop.start()
+        if self._io_loops[0] is not self._loop:
+            for i, loop in enumerate(self._io_loops):
+                loop.start("hazelcast-io-%s" % i)
 
     def add_timer(self, delay, callback):
         return self._loop.add_timer(delay, callback)
@@ -342,28 +569,128 @@ class AsyncoreReactor(object):
 
     def shutdown(self):
         self._loop.shutdown()
+        if self._io_loops[0] is not self._loop:
+            for loop in self._io_loops:
+                loop.shutdown()
 
     def connection_factory(self, connection_manager, connection_id, address, network_config, message_callback):
-        return AsyncoreConnection(self, connection_manager, connection_id, address, network_config, message_callback)
+        loop = self._io_loops[connection_id % len(self._io_loops)]
+        return AsyncoreConnection(loop, connection_manager, connection_id, address, network_config, message_callback)
+
+    @staticmethod
+    def _create_loop(loop_type):
+        loop = None
+        if loop_type == ReactorLoop.SELECTORS:
+            loop = AsyncoreReactor._create_selector_loop()
+
+        if not loop:
+            map = {}
+            try:
+                loop = _WakeableLoop(map)
+                loop.check_loop()
+            except:
+                _logger.exception("Failed to initialize the wakeable loop. "
+                                  "Using the basic loop instead. "
+                                  "When used in the blocking mode, client"
+                                  "may have sub-optimal performance.")
+                if loop:
+                    loop.shutdown()
+                loop = _BasicLoop(map)
+        return loop
+
+    @staticmethod
+    def _create_selector_loop():
+        if not selectors:
+            _logger.warning("The selectors module is not available. Using the asyncore loop instead.")
+            return None
+
+        loop = None
+        try:
+            loop = _SelectorLoop(_SelectorMap())
+            loop.check_loop()
+            return loop
+        except:
+            _logger.exception("Failed to initialize the selector loop. Using the asyncore loop instead.")
+            if loop:
+                loop.shutdown()
+            return None
+
+
+def _create_ssl_context(config):
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+
+    protocol = config.ssl_protocol
+
+    # Use only the configured protocol
+    try:
+        if protocol != SSLProtocol.SSLv2:
+            ssl_context.options |= ssl.OP_NO_SSLv2
+        if protocol != SSLProtocol.SSLv3:
+            ssl_context.options |= ssl.OP_NO_SSLv3
+        if protocol != SSLProtocol.TLSv1:
+            ssl_context.options |= ssl.OP_NO_TLSv1
+        if protocol != SSLProtocol.TLSv1_1:
+            ssl_context.options |= ssl.OP_NO_TLSv1_1
+        if protocol != SSLProtocol.TLSv1_2:
+            ssl_context.options |= ssl.OP_NO_TLSv1_2
+        if protocol != SSLProtocol.TLSv1_3:
+            ssl_context.options |= ssl.OP_NO_TLSv1_3
+    except AttributeError:
+        pass
+
+    ssl_context.verify_mode = ssl.CERT_REQUIRED
+
+    if config.ssl_cafile:
+        ssl_context.load_verify_locations(config.ssl_cafile)
+    else:
+        ssl_context.load_default_certs()
+
+    if config.ssl_certfile:
+        ssl_context.load_cert_chain(config.ssl_certfile, config.ssl_keyfile, config.ssl_password)
+
+    if config.ssl_ciphers:
+        ssl_context.set_ciphers(config.ssl_ciphers)
+
+    return ssl_context
 
 
 _BUFFER_SIZE = 128000
 
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+_SSLSocket = ssl.SSLSocket if ssl else ()
+
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+
+if _IOV_MAX <= 0:
+    # The limit is indeterminate, use the minimum POSIX allows
+    _IOV_MAX = 16
+
+_WOULD_BLOCK = frozenset((errno.EAGAIN, errno.EWOULDBLOCK))
+
+_DISCONNECTED = frozenset((errno.ECONNRESET, errno.ENOTCONN, errno.ESHUTDOWN,
+                           errno.ECONNABORTED, errno.EPIPE, errno.EBADF))
+
 
 class AsyncoreConnection(Connection, asyncore.dispatcher):
     sent_protocol_bytes = False
     receive_buffer_size = _BUFFER_SIZE
     send_buffer_size = _BUFFER_SIZE
 
-    def __init__(self, reactor, connection_manager, connection_id, address,
+    def __init__(self, loop, connection_manager, connection_id, address,
                  config, message_callback):
-        asyncore.dispatcher.__init__(self, map=reactor.map)
+        asyncore.dispatcher.__init__(self, map=loop.map)
         Connection.__init__(self, connection_manager, connection_id, message_callback)
+        self._track_queued_write_bytes = config.max_queued_write_bytes > 0
 
-        self._reactor = reactor
+        self._loop = loop
         self.connected_address = address
         self._write_queue = deque()
-        self._write_buf = io.BytesIO()
+        self._write_offset = 0  # Bytes of the first buffer in the queue that are already sent
+        self._flush_pending = False
         self.create_socket(socket.AF_INET, socket.SOCK_STREAM)
 
         timeout = config.connection_timeout
@@ -389,48 +716,18 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         self.connect((address.host, address.port))
 
         if ssl and config.ssl_enabled:
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-
-            protocol = config.ssl_protocol
-
-            # Use only the configured protocol
-            try:
-                if protocol != SSLProtocol.SSLv2:
-                    ssl_context.options |= ssl.OP_NO_SSLv2
-                if protocol != SSLProtocol.SSLv3:
-                    ssl_context.options |= ssl.OP_NO_SSLv3
-                if protocol != SSLProtocol.TLSv1:
-                    ssl_context.options |= ssl.OP_NO_TLSv1
-                if protocol != SSLProtocol.TLSv1_1:
-                    ssl_context.options |= ssl.OP_NO_TLSv1_1
-                if protocol != SSLProtocol.TLSv1_2:
-                    ssl_context.options |= ssl.OP_NO_TLSv1_2
-                if protocol != SSLProtocol.TLSv1_3:
-                    ssl_context.options |= ssl.OP_NO_TLSv1_3
-            except AttributeError:
-                pass
-
-            ssl_context.verify_mode = ssl.CERT_REQUIRED
-
-            if config.ssl_cafile:
-                ssl_context.load_verify_locations(config.ssl_cafile)
-            else:
-                ssl_context.load_default_certs()
-
-            if config.ssl_certfile:
-                ssl_context.load_cert_chain(config.ssl_certfile, config.ssl_keyfile, config.ssl_password)
-
-            if config.ssl_ciphers:
-                ssl_context.set_ciphers(config.ssl_ciphers)
-
+            ssl_context = _create_ssl_context(config)
             self.socket = ssl_context.wrap_socket(self.socket)
 
+        # SSL sockets do not support scatter/gather I/O
+        self._use_sendmsg = _HAS_SENDMSG and not isinstance(self.socket, _SSLSocket)
+
         # the socket should be non-blocking from now on
         self.socket.settimeout(0)
 
         self.local_address = Address(*self.socket.getsockname())
 
-        self._write_queue.append(b"CP2")
+        self._write(b"CP2")
 
     def handle_connect(self):
         self.start_time = time.time()
@@ -440,10 +737,11 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         reader = self._reader
         receive_buffer_size = self.receive_buffer_size
         while True:
-            data = self.recv(receive_buffer_size)
-            reader.read(data)
+            buf = reader.get_buffer(receive_buffer_size)
+            n = self._recv_into(buf)
+            reader.buffer_updated(n)
             self.last_read_time = time.time()
-            if len(data) < receive_buffer_size:
+            if n < len(buf):
                 break
 
         if reader.length:
@@ -455,33 +753,84 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         write_batch = []
         total_length = 0
 
-        while write_queue:
-            message_bytes = write_queue.popleft()
-            write_batch.append(message_bytes)
-            total_length += len(message_bytes)
+        offset = self._write_offset
+        for buf in write_queue:
+            if offset:
+                buf = memoryview(buf)[offset:]
+                offset = 0
+            write_batch.append(buf)
+            total_length += len(buf)
 
-            if total_length >= send_buffer_size:
+            if total_length >= send_buffer_size or len(write_batch) == _IOV_MAX:
                 break
 
         # We enter this only if len(write_queue) > 0.
         # So, len(write_batch) cannot be 0.
-        if len(write_batch) == 1:
-            bytes_ = write_batch[0]
-        else:
-            buf = self._write_buf
-            buf.seek(0)
-            for message_bytes in write_batch:
-                buf.write(message_bytes)
-
-            bytes_ = buf.getvalue()
-            buf.truncate(0)
-
-        sent = self.send(bytes_)
+        sent = self._send(write_batch)
         self.last_write_time = time.time()
         self.sent_protocol_bytes = True
 
-        if sent < len(bytes_):
-            write_queue.appendleft(bytes_[sent:])
+        # Drop the buffers that are fully sent and remember
+        # where to continue from for the partially sent one
+        if sent:
+            self._on_write_flushed(sent)
+
+        offset = self._write_offset + sent
+        while write_queue:
+            length = len(write_queue[0])
+            if offset < length:
+                break
+            write_queue.popleft()
+            offset -= length
+        self._write_offset = offset
+
+        if not write_queue:
+            self._flush_pending = False
+            self._loop.stop_writing(self)
+            # Messages might have been added after the queue is seen
+            # empty, but before the flag is cleared. Their writers have
+            # skipped the wake up, so this flush must remain pending.
+            if write_queue:
+                self._flush_pending = True
+                self._loop.start_writing(self)
+
+    def _send(self, buffers):
+        # Same as asyncore.dispatcher#send, but sends multiple
+        # buffers with a single call where it is possible
+        try:
+            if len(buffers) == 1:
+                return self.socket.send(buffers[0])
+            if self._use_sendmsg:
+                return self.socket.sendmsg(buffers)
+
+            data = bytearray()
+            for buf in buffers:
+                data += buf
+            return self.socket.send(data)
+        except socket.error as e:
+            if e.args[0] in _WOULD_BLOCK:
+                return 0
+            if e.args[0] in _DISCONNECTED:
+                self.handle_close()
+                return 0
+            raise
+
+    def _recv_into(self, buf):
+        # Same as asyncore.dispatcher#recv, but receives directly
+        # into the given buffer instead of allocating a new one
+        try:
+            n = self.socket.recv_into(buf)
+        except socket.error as e:
+            if e.args[0] in _WOULD_BLOCK:
+                return 0
+            if e.args[0] in _DISCONNECTED:
+                self.handle_close()
+                return 0
+            raise
+
+        if n == 0:
+            self.handle_close()
+        return n
 
     def handle_close(self):
         _logger.warning("Connection closed by server")
@@ -500,15 +849,328 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
         return self.live and self.sent_protocol_bytes
 
     def _write(self, buf):
+        self._on_write_queued(len(buf))
         self._write_queue.append(buf)
-        self._reactor.wake_loop()
+        if not self._flush_pending:
+            # The reactor will write everything in the queue until it is
+            # empty, so there is no need to notify it for each message.
+            self._flush_pending = True
+            self._loop.start_writing(self)
 
     def writable(self):
         return len(self._write_queue) > 0
 
     def _inner_close(self):
         asyncore.dispatcher.close(self)
-        self._write_buf.close()
+
+    def __repr__(self):
+        return "Connection(id=%s, live=%s, remote_address=%s)" % (self._id, self.live, self.remote_address)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class AsyncioReactor(object):
+    """Reactor that runs the client protocol on an asyncio event loop.
+
+    No reactor thread is started. Connection I/O and timers run on the
+    given event loop, which must be run by the caller. Since the futures
+    are completed on the event loop thread, awaiting them from the
+    coroutines running on the same loop requires no thread hops.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self._connections = set()  # accessed only from the loop thread
+        self._timers = {}  # id of the timer to (timer, handle), accessed only from the loop thread
+        self._is_live = False
+
+    def start(self):
+        self._is_live = True
+        self.run_in_loop(self._mark_reactor_thread)
+
+    def add_timer(self, delay, callback):
+        timer = Timer(delay + time.time(), callback, self._cancel_timer)
+        self.run_in_loop(self._schedule_timer, timer, delay)
+        return timer
+
+    def wake_loop(self):
+        # The asyncio event loop is woken up by call_soon_threadsafe
+        pass
+
+    def shutdown(self):
+        if not self._is_live:
+            return
+
+        self._is_live = False
+        loop = self.loop
+        if self.in_loop_thread() or not loop.is_running():
+            # Nothing else can touch the loop state
+            self._close_connections_and_timers()
+            return
+
+        # The teardown runs on the loop thread, after the timers that are
+        # scheduled before the shutdown. Wait for it, unless the loop stops
+        # before running it, in which case the teardown is done here.
+        done = threading.Event()
+        loop.call_soon_threadsafe(self._close_connections_and_timers, done)
+        while not done.wait(0.1):
+            if not loop.is_running():
+                self._close_connections_and_timers()
+                return
+
+    def connection_factory(self, connection_manager, connection_id, address, network_config, message_callback):
+        return AsyncioConnection(self, connection_manager, connection_id, address, network_config, message_callback)
+
+    def in_loop_thread(self):
+        """Returns ``True`` if called from the thread running the event loop."""
+        return _is_loop_thread(self.loop)
+
+    def run_in_loop(self, fn, *args):
+        """Runs the given function on the event loop thread.
+
+        The function is run immediately if this is called from the event
+        loop thread. Otherwise, it is scheduled to run on the event loop.
+        """
+        if self.in_loop_thread():
+            fn(*args)
+        else:
+            self.loop.call_soon_threadsafe(fn, *args)
+
+    def _close_connections_and_timers(self, done=None):
+        for connection in list(self._connections):
+            connection.close(None, HazelcastError("Client is shutting down"))
+
+        self._connections.clear()
+
+        # Pending timers are ended on shutdown, similar to the asyncore reactor.
+        # Timers added by the ended timers are also ended.
+        timers = self._timers
+        while timers:
+            _, (timer, handle) = timers.popitem()
+            handle.cancel()
+            timer.timer_ended_cb()
+
+        if done:
+            done.set()
+
+    def _schedule_timer(self, timer, delay):
+        if timer.canceled:
+            return
+
+        if not self._is_live:
+            # Added after or during the shutdown
+            timer.timer_ended_cb()
+            return
+
+        handle = self.loop.call_later(delay, self._run_timer, timer)
+        self._timers[id(timer)] = (timer, handle)
+
+    def _run_timer(self, timer):
+        if self._timers.pop(id(timer), None) is None:
+            # Already ended by the shutdown
+            return
+
+        timer.check_timer(timer.end)
+
+    def _cancel_timer(self, timer):
+        self.run_in_loop(self._remove_timer, timer)
+
+    def _remove_timer(self, timer):
+        entry = self._timers.pop(id(timer), None)
+        if entry:
+            entry[1].cancel()
+
+    def _add_connection(self, connection):
+        self._connections.add(connection)
+
+    def _remove_connection(self, connection):
+        self._connections.discard(connection)
+
+    def _mark_reactor_thread(self):
+        # Blocking on incomplete futures from the loop thread would dead-lock
+        Future._threading_locals.is_reactor_thread = True
+        Future._threading_locals.is_asyncio_loop_thread = True
+        Future._threading_locals.asyncio_loop = self.loop
+
+
+class AsyncioConnection(Connection):
+    """Connection that implements the asyncio protocol interface.
+
+    All the socket I/O is done by the asyncio transport on the event loop
+    of the :class:`AsyncioReactor`.
+    """
+
+    receive_buffer_size = _BUFFER_SIZE
+    send_buffer_size = _BUFFER_SIZE
+
+    def __init__(self, reactor, connection_manager, connection_id, address,
+                 config, message_callback):
+        Connection.__init__(self, connection_manager, connection_id, message_callback)
+        self._track_queued_write_bytes = config.max_queued_write_bytes > 0
+
+        self._reactor = reactor
+        self._loop = reactor.loop
+        self._config = config
+        self._transport = None
+        self._connect_task = None
+        self._pending_writes = []  # messages written before the connection is established
+        # Bytes handed to the transport and bytes known to be flushed
+        # by it, accessed only from the loop thread
+        self._transport_bytes = 0
+        self._flushed_bytes = 0
+        self.connected_address = address
+
+        for _, option_name, value in config.socket_options:
+            if option_name is socket.SO_RCVBUF:
+                self.receive_buffer_size = value
+            elif option_name is socket.SO_SNDBUF:
+                self.send_buffer_size = value
+
+        reactor.run_in_loop(self._connect)
+
+    @property
+    def queued_write_bytes(self):
+        transport = self._transport
+        if transport is None or not self._track_queued_write_bytes:
+            return self._queued_write_bytes
+
+        # Flushed bytes are only updated on writes and resumes,
+        # so take the bytes flushed since then into account.
+        unflushed = self._transport_bytes - self._flushed_bytes
+        return self._queued_write_bytes - unflushed + transport.get_write_buffer_size()
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _BUFFER_SIZE)
+            for level, option_name, value in self._config.socket_options:
+                sock.setsockopt(level, option_name, value)
+
+        sockname = transport.get_extra_info("sockname")
+        if sockname:
+            self.local_address = Address(sockname[0], sockname[1])
+
+        self.start_time = time.time()
+        _logger.debug("Connected to %s", self.connected_address)
+
+        max_queued_write_bytes = self._config.max_queued_write_bytes
+        if max_queued_write_bytes > 0:
+            # The transport pauses the protocol when its buffer exceeds
+            # the high water mark, which is then resumed once the buffer
+            # is drained. The flushed bytes are updated on resume.
+            transport.set_write_buffer_limits(high=max_queued_write_bytes - 1)
+
+        transport.write(b"CP2")
+        for buf in self._pending_writes:
+            self._write_to_transport(buf)
+
+        del self._pending_writes[:]
+        self.last_write_time = time.time()
+        self._update_flushed_bytes()
+
+    def data_received(self, data):
+        reader = self._reader
+        reader.read(data)
+        self.last_read_time = time.time()
+        if reader.length:
+            reader.process()
+
+    def eof_received(self):
+        # Returning a falsy value makes the transport close itself
+        return False
+
+    def connection_lost(self, exc):
+        if not self.live:
+            # Closed by the client
+            return
+
+        if exc is None:
+            _logger.warning("Connection closed by server")
+            self.close(None, IOError("Connection closed by server"))
+        else:
+            self.close(None, IOError(exc))
+
+    def pause_writing(self):
+        pass
+
+    def resume_writing(self):
+        self._update_flushed_bytes()
+
+    def _connect(self):
+        if not self.live:
+            return
+
+        self._reactor._add_connection(self)
+        address = self.connected_address
+        config = self._config
+        ssl_context = None
+        server_hostname = None
+        if ssl and config.ssl_enabled:
+            ssl_context = _create_ssl_context(config)
+            server_hostname = address.host
+
+        coro = self._loop.create_connection(lambda: self, address.host, address.port,
+                                            ssl=ssl_context, server_hostname=server_hostname)
+        timeout = config.connection_timeout
+        if timeout:
+            coro = asyncio.wait_for(coro, timeout)
+
+        self._connect_task = asyncio.Task(coro, loop=self._loop)
+        self._connect_task.add_done_callback(self._on_connect)
+
+    def _on_connect(self, task):
+        self._connect_task = None
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error:
+            self.close(None, IOError(error))
+
+    def _write(self, buf):
+        self._on_write_queued(len(buf))
+        self._reactor.run_in_loop(self._write_in_loop, buf)
+
+    def _write_in_loop(self, buf):
+        transport = self._transport
+        if transport is None:
+            if self.live:
+                self._pending_writes.append(buf)
+            return
+
+        if not self.live:
+            return
+
+        self._write_to_transport(buf)
+        self.last_write_time = time.time()
+        self._update_flushed_bytes()
+
+    def _write_to_transport(self, buf):
+        self._transport.write(buf)
+        self._transport_bytes += len(buf)
+
+    def _update_flushed_bytes(self):
+        flushed = self._transport_bytes - self._transport.get_write_buffer_size()
+        if flushed > self._flushed_bytes:
+            self._on_write_flushed(flushed - self._flushed_bytes)
+            self._flushed_bytes = flushed
+
+    def _inner_close(self):
+        self._reactor.run_in_loop(self._close_in_loop)
+
+    def _close_in_loop(self):
+        self._reactor._remove_connection(self)
+        del self._pending_writes[:]
+        if self._connect_task:
+            self._connect_task.cancel()
+
+        if self._transport:
+            self._transport.close()
 
     def __repr__(self):
         return "Connection(id=%s, live=%s, remote_address=%s)" % (self._id, self.live, self.remote_address)
@@ -519,12 +1181,15 @@ class AsyncoreConnection(Connection, asyncore.dispatcher):
 
 @total_ordering
 class Timer(object):
-    __slots__ = ("end", "timer_ended_cb", "canceled")
+    __slots__ = ("end", "timer_ended_cb", "canceled", "bucket", "rounds", "_cancel_cb")
 
-    def __init__(self, end, timer_ended_cb):
+    def __init__(self, end, timer_ended_cb, cancel_cb=None):
         self.end = end
         self.timer_ended_cb = timer_ended_cb
         self.canceled = False
+        self.bucket = None  # Set by the timer wheel
+        self.rounds = 0  # Set by the timer wheel
+        self._cancel_cb = cancel_cb
 
     def __eq__(self, other):
         return self.end == other.end
@@ -536,7 +1201,12 @@ class Timer(object):
         return self.end < other.end
 
     def cancel(self):
+        if self.canceled:
+            return
+
         self.canceled = True
+        if self._cancel_cb:
+            self._cancel_cb(self)
 
     def check_timer(self, now):
         if self.canceled:
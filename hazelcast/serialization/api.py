@@ -550,6 +550,47 @@ class StreamSerializer(object):
         raise NotImplementedError()
 
 
+class CompressionCodec(object):
+    """A base class for the codecs that compress serialized values.
+
+    See the ``value_compression`` option of the client.
+    """
+
+    def compress(self, buf):
+        """Compresses the serialized value.
+
+        Args:
+            buf (bytearray): The serialized value.
+
+        Returns:
+            bytes: The compressed value.
+        """
+        raise NotImplementedError("compress method must be implemented")
+
+    def decompress(self, buf):
+        """Decompresses a value compressed by this codec.
+
+        Args:
+            buf (bytearray): The compressed value.
+
+        Returns:
+            bytes: The serialized value.
+        """
+        raise NotImplementedError("decompress method must be implemented")
+
+    def get_id(self):
+        """Returns the id of the codec.
+
+        The id is written along with the compressed values, so that they can be
+        decompressed with the same codec. It must be positive and unique among
+        the codecs used by the clients that share the values.
+
+        Returns:
+            int: The id of the codec.
+        """
+        raise NotImplementedError("get_id must be implemented")
+
+
 class PortableReader(object):
     """Provides a mean of reading portable fields from binary in form of Python primitives and arrays of these
     primitives, nested portable fields and array of portable fields.
@@ -6,9 +6,10 @@ from hazelcast.serialization.api import *
 from hazelcast.serialization.data import *
 from hazelcast.errors import HazelcastInstanceNotActiveError, HazelcastSerializationError
 from hazelcast.serialization.input import _ObjectDataInput
-from hazelcast.serialization.output import _ObjectDataOutput
+from hazelcast.serialization.output import _ObjectDataOutput, _ObjectDataOutputPool
 from hazelcast.serialization.serializer import *
 from hazelcast import six
+from hazelcast.six.moves import cPickle
 
 
 _int_type_to_type_id = {
@@ -50,6 +51,11 @@ class BaseSerializationService(object):
         self._global_partition_strategy = global_partition_strategy
         self._output_buffer_size = output_buffer_size
         self._is_big_endian = is_big_endian
+        self._output_pool = _ObjectDataOutputPool(output_buffer_size, self, is_big_endian)
+        self._fast_writers = {}  # dict of id(serializer):function(obj, partitioning_hash) returning the Data buffer
+        self._fmt_int = BE_INT if is_big_endian else LE_INT
+        self._fmt_short = BE_INT16 if is_big_endian else LE_INT16
+        self._fmt_long = BE_LONG if is_big_endian else LE_LONG
         self._active = True
 
     def to_data(self, obj, partitioning_strategy=None):
@@ -68,20 +74,16 @@ class BaseSerializationService(object):
         if isinstance(obj, Data):
             return obj
 
-        out = self._create_data_output()
         try:
             serializer = self._registry.serializer_for(obj)
             partitioning_hash = self._calculate_partitioning_hash(obj, partitioning_strategy)
 
-            out.write_int_big_endian(partitioning_hash)
-            out.write_int_big_endian(serializer.get_type_id())
-            serializer.write(out, obj)
-            return Data(out.to_byte_array())
+            fast_writer = self._fast_writers.get(id(serializer), None)
+            if fast_writer is not None:
+                return Data(fast_writer(obj, partitioning_hash))
+            return Data(self._write_with_output(serializer, obj, partitioning_hash))
         except:
             handle_exception(sys.exc_info()[1], sys.exc_info()[2])
-        finally:
-            pass
-            # return out to pool
 
     def to_object(self, data):
         """Deserialize input data
@@ -146,6 +148,95 @@ class BaseSerializationService(object):
             partitioning_hash = 0 if partitioning_key is None else partitioning_key.get_partition_hash()
         return partitioning_hash
 
+    def _write_with_output(self, serializer, obj, partitioning_hash):
+        pool = self._output_pool
+        out = pool.take()
+        try:
+            out.write_int_big_endian(partitioning_hash)
+            out.write_int_big_endian(serializer.get_type_id())
+            serializer.write(out, obj)
+            return pool.to_byte_array(out)
+        finally:
+            pool.give(out)
+
+    def _register_fast_writers(self):
+        """Registers the writers that serialize the hottest types directly into
+        the Data buffer, without going through an output.
+
+        Each writer must produce the same bytes as the ``write`` method of the
+        serializer it is registered for.
+        """
+        registry = self._registry
+
+        def fixed_size_writer(fmt, type_id):
+            size = DATA_OFFSET + fmt.size
+
+            def write(obj, partitioning_hash):
+                buf = bytearray(size)
+                BE_INT.pack_into(buf, PARTITION_HASH_OFFSET, partitioning_hash)
+                BE_INT.pack_into(buf, TYPE_OFFSET, type_id)
+                fmt.pack_into(buf, DATA_OFFSET, obj)
+                return buf
+
+            return write
+
+        fast_writers = {
+            CONSTANT_TYPE_BYTE: fixed_size_writer(BE_UINT8, CONSTANT_TYPE_BYTE),
+            CONSTANT_TYPE_SHORT: fixed_size_writer(self._fmt_short, CONSTANT_TYPE_SHORT),
+            CONSTANT_TYPE_INTEGER: fixed_size_writer(self._fmt_int, CONSTANT_TYPE_INTEGER),
+            CONSTANT_TYPE_LONG: fixed_size_writer(self._fmt_long, CONSTANT_TYPE_LONG),
+            CONSTANT_TYPE_STRING: lambda obj, partitioning_hash:
+                self._write_sized_data(CONSTANT_TYPE_STRING, obj.encode("utf-8"), partitioning_hash),
+            CONSTANT_TYPE_BYTE_ARRAY: lambda obj, partitioning_hash:
+                self._write_sized_data(CONSTANT_TYPE_BYTE_ARRAY, obj, partitioning_hash),
+            PYTHON_TYPE_PICKLE: self._write_pickle_data,
+            PYTHON_TYPE_PICKLE_BINARY: self._write_binary_pickle_data,
+        }
+        for type_id, writer in six.iteritems(fast_writers):
+            self._fast_writers[id(registry.serializer_by_type_id(type_id))] = writer
+
+    def _write_sized_data(self, type_id, payload, partitioning_hash):
+        length = len(payload)
+        buf = bytearray(DATA_OFFSET + INT_SIZE_IN_BYTES + length)
+        BE_INT.pack_into(buf, PARTITION_HASH_OFFSET, partitioning_hash)
+        BE_INT.pack_into(buf, TYPE_OFFSET, type_id)
+        self._fmt_int.pack_into(buf, DATA_OFFSET, length)
+        buf[DATA_OFFSET + INT_SIZE_IN_BYTES:] = payload
+        return buf
+
+    def _write_pickle_data(self, obj, partitioning_hash):
+        pickled = cPickle.dumps(obj, 0)
+        # The pickle is written as a UTF-8 string, so it must be decodable as one
+        pickled.decode("utf-8")
+        return self._write_sized_data(PYTHON_TYPE_PICKLE, pickled, partitioning_hash)
+
+    def _write_binary_pickle_data(self, obj, partitioning_hash):
+        serializer = self._registry.serializer_by_type_id(PYTHON_TYPE_PICKLE_BINARY)
+        pickled, buffers = serializer.dumps(obj)
+        fmt_int = self._fmt_int
+        size = DATA_OFFSET + 2 * INT_SIZE_IN_BYTES + len(pickled)
+        for b in buffers:
+            size += INT_SIZE_IN_BYTES + len(b)
+
+        buf = bytearray(size)
+        BE_INT.pack_into(buf, PARTITION_HASH_OFFSET, partitioning_hash)
+        BE_INT.pack_into(buf, TYPE_OFFSET, PYTHON_TYPE_PICKLE_BINARY)
+
+        def write_sized(pos, payload):
+            length = len(payload)
+            fmt_int.pack_into(buf, pos, length)
+            pos += INT_SIZE_IN_BYTES
+            buf[pos:pos + length] = payload
+            return pos + length
+
+        position = write_sized(DATA_OFFSET, pickled)
+        fmt_int.pack_into(buf, position, len(buffers))
+        position += INT_SIZE_IN_BYTES
+        # Buffers pickled out-of-band are copied once, straight into the Data buffer
+        for b in buffers:
+            position = write_sized(position, b)
+        return buf
+
     def _create_data_output(self):
         return _ObjectDataOutput(self._output_buffer_size, self, self._is_big_endian)
 
@@ -171,6 +262,8 @@ class SerializerRegistry(object):
         self._id_dic = {}  # dict of type_id:serializer
         self._type_dict = {}  # dict of class:serializer
 
+        self._serializer_cache = {}  # dict of class:resolved serializer
+
         self._registration_lock = RLock()
         self.int_type = int_type
         self._int_type_id = _int_type_to_type_id.get(int_type, None)
@@ -196,6 +289,7 @@ class SerializerRegistry(object):
 
         Serializers will be  searched in this order;
 
+        - Serializers resolved before for the type of the object
         - NULL serializer
         - Default serializers, like primitives, arrays, string and some default types
         - Custom registered types by user
@@ -208,12 +302,15 @@ class SerializerRegistry(object):
         Returns:
             The serializer
         """
+        obj_type = type(obj)
+        serializer = self._serializer_cache.get(obj_type, None)
+        if serializer is not None:
+            return serializer
+
         # 1-NULL serializer
         if obj is None:
             return self._null_serializer
 
-        obj_type = type(obj)
-
         # 2-Default serializers, DataSerializable, Portable, primitives, arrays, String, UUID
         # and some helper types(BigInteger etc)
         serializer = self.lookup_default_serializer(obj_type, obj)
@@ -232,6 +329,10 @@ class SerializerRegistry(object):
 
         if serializer is None:
             raise HazelcastSerializationError("There is no suitable serializer for:" + str(obj_type))
+
+        if self._int_type_id is not None or obj_type not in six.integer_types:
+            # With the VAR int type, the serializer of an integer depends on its value
+            self._serializer_cache[obj_type] = serializer
         return serializer
 
     def lookup_default_serializer(self, obj_type, obj):
@@ -286,12 +387,14 @@ class SerializerRegistry(object):
 
     def register_constant_serializer(self, serializer, object_type=None):
         stream_serializer = serializer
+        self._serializer_cache.clear()
         self._constant_type_ids[index_for_default_type(stream_serializer.get_type_id())] = stream_serializer
         if object_type is not None:
             self._constant_type_dict[object_type] = stream_serializer
 
     def safe_register_serializer(self, stream_serializer, obj_type=None):
         with self._registration_lock:
+            self._serializer_cache.clear()
             if obj_type is not None:
                 if obj_type in self._constant_type_dict:
                     raise ValueError("[%s] serializer cannot be overridden!" % obj_type)
@@ -323,5 +426,6 @@ class SerializerRegistry(object):
             serializer.destroy()
         self._type_dict.clear()
         self._id_dic.clear()
+        self._serializer_cache.clear()
         self._global_serializer = None
         self._constant_type_dict.clear()
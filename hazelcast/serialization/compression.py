@@ -0,0 +1,136 @@
+import threading
+import time
+import zlib
+
+from hazelcast import six
+from hazelcast.serialization.api import CompressionCodec
+from hazelcast.serialization.bits import INT_SIZE_IN_BYTES, BE_INT
+from hazelcast.serialization.data import Data, DATA_OFFSET, PARTITION_HASH_OFFSET, TYPE_OFFSET
+from hazelcast.serialization.serialization_const import PYTHON_TYPE_COMPRESSED
+
+ZLIB_CODEC_ID = 1
+
+# Header of the compressed values: codec id and the length of the compressed bytes
+_COMPRESSED_HEADER_SIZE = DATA_OFFSET + 2 * INT_SIZE_IN_BYTES
+
+# CPU time of the current thread, where it is available
+_thread_time = getattr(time, "thread_time", time.time)
+
+
+class ZlibCodec(CompressionCodec):
+    """Compresses values with ``zlib``.
+
+    Args:
+        level (int): Compression level, from ``0`` to ``9``, or ``-1`` for
+            the default level of ``zlib``.
+    """
+
+    def __init__(self, level=-1):
+        self._level = level
+
+    def compress(self, buf):
+        return zlib.compress(_to_zlib_input(buf), self._level)
+
+    def decompress(self, buf):
+        return zlib.decompress(_to_zlib_input(buf))
+
+    def get_id(self):
+        return ZLIB_CODEC_ID
+
+
+if six.PY2:
+    def _to_zlib_input(buf):
+        # zlib of Python 2 accepts neither bytearrays nor memoryviews
+        if isinstance(buf, memoryview):
+            return buf.tobytes()
+        return bytes(buf)
+else:
+    def _to_zlib_input(buf):
+        return buf
+
+
+class ValueCompressor(object):
+    """Serializes the values of a data structure, and compresses the ones
+    larger than the threshold.
+
+    Compressed values are tagged with a dedicated type id and decompressed
+    transparently while they are deserialized. Values that do not get smaller
+    are kept as they are.
+    """
+
+    def __init__(self, serialization_service, codec, threshold):
+        self._service = serialization_service
+        self._codec = codec
+        self._codec_id = codec.get_id()
+        self._threshold = threshold
+        self._lock = threading.Lock()
+        self._compressed_count = 0
+        self._uncompressed_count = 0
+        self._original_bytes = 0
+        self._compressed_bytes = 0
+        self._compression_time = 0.0
+
+    def to_data(self, obj):
+        """Serializes the object and compresses it, if it is large enough.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            hazelcast.serialization.data.Data: The serialized, possibly compressed, object.
+        """
+        data = self._service.to_data(obj)
+        if data is None or data.total_size() < self._threshold:
+            return data
+
+        buf = data.to_bytes()
+        start = _thread_time()
+        compressed = self._codec.compress(buf)
+        elapsed = _thread_time() - start
+
+        compressed_length = len(compressed)
+        is_compressed = _COMPRESSED_HEADER_SIZE + compressed_length < len(buf)
+        with self._lock:
+            self._compression_time += elapsed
+            if is_compressed:
+                self._compressed_count += 1
+                self._original_bytes += len(buf)
+                self._compressed_bytes += _COMPRESSED_HEADER_SIZE + compressed_length
+            else:
+                self._uncompressed_count += 1
+
+        if not is_compressed:
+            return data
+
+        fmt_int = self._service._fmt_int
+        compressed_buf = bytearray(_COMPRESSED_HEADER_SIZE + compressed_length)
+        compressed_buf[PARTITION_HASH_OFFSET:TYPE_OFFSET] = buf[PARTITION_HASH_OFFSET:TYPE_OFFSET]
+        BE_INT.pack_into(compressed_buf, TYPE_OFFSET, PYTHON_TYPE_COMPRESSED)
+        fmt_int.pack_into(compressed_buf, DATA_OFFSET, self._codec_id)
+        fmt_int.pack_into(compressed_buf, DATA_OFFSET + INT_SIZE_IN_BYTES, compressed_length)
+        compressed_buf[_COMPRESSED_HEADER_SIZE:] = compressed
+        return Data(compressed_buf)
+
+    def get_statistics(self):
+        """Returns the statistics of the compressor.
+
+        Returns:
+            dict: Dictionary that stores the following statistics:
+
+            - **compressed_count**: Number of values that are compressed.
+            - **uncompressed_count**: Number of values above the threshold that
+              are sent uncompressed, because they would not get smaller.
+            - **original_bytes**: Total size of the compressed values before the compression.
+            - **compressed_bytes**: Total size of the compressed values.
+            - **bytes_saved**: Difference between the two sizes above.
+            - **compression_time**: Time spent compressing the values, in seconds.
+        """
+        with self._lock:
+            return {
+                "compressed_count": self._compressed_count,
+                "uncompressed_count": self._uncompressed_count,
+                "original_bytes": self._original_bytes,
+                "compressed_bytes": self._compressed_bytes,
+                "bytes_saved": self._original_bytes - self._compressed_bytes,
+                "compression_time": self._compression_time,
+            }
@@ -14,16 +14,19 @@ class Data(object):
     """Data is basic unit of serialization.
 
     It stores binary form of an object serialized by serialization service.
+    Data received from the members is backed by a memoryview of the frame it
+    was received in, so it is not copied until it is deserialized.
     """
 
     def __init__(self, buf):
         self._buffer = buf
+        self._hash = None  # murmur hash of the buffer, computed on demand
 
     def to_bytes(self):
         """Returns byte array representation of internal binary format.
         
         Returns:
-            bytearray: The byte array representation of internal binary format.
+            bytearray or bytes or memoryview: The byte array representation of internal binary format.
         """
         return self._buffer
 
@@ -83,19 +86,23 @@ class Data(object):
         Returns:
             int: The murmur hash of the internal data.
         """
-        return murmur_hash3_x86_32(self._buffer)
+        if self._hash is None:
+            # The buffer of a Data is never modified, so the hash is computed once.
+            # When this method is called on Data objects
+            # received from the members, buffer is type
+            # of bytes instead of bytearray. Since bytes
+            # is an alias of str in Python2, we cannot
+            # use murmur hash directly on it. The
+            # conversion is necessary only on Python2
+            if isinstance(self._buffer, bytearray) or six.PY3:
+                self._hash = murmur_hash3_x86_32(self._buffer)
+            else:
+                self._hash = murmur_hash3_x86_32(bytearray(self._buffer))
+        return self._hash
 
     def __hash__(self):
         # Data objects are used in NearCache as keys.
-        # When this method is called on Data objects
-        # received from the members, buffer is type
-        # of bytes instead of bytearray. Since bytes
-        # is an alias of str in Python2, we cannot
-        # use murmur hash directly on it. The
-        # conversion is necessary only on Python2
-        if isinstance(self._buffer, bytearray) or six.PY3:
-            return murmur_hash3_x86_32(self._buffer)
-        return murmur_hash3_x86_32(bytearray(self._buffer))
+        return self.hash_code()
 
     def __eq__(self, other):
         return isinstance(other, Data) and self.total_size() == other.total_size() \
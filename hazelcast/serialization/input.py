@@ -1,3 +1,5 @@
+import struct
+
 from hazelcast.serialization.api import *
 from hazelcast.serialization.bits import *
 from hazelcast import six
@@ -7,6 +9,10 @@ from hazelcast.six.moves import range
 class _ObjectDataInput(ObjectDataInput):
     def __init__(self, buff, offset=0, serialization_service=None, is_big_endian=True):
         self._buffer = buff
+        # On Python 3, slices of strings and byte arrays are taken from a view of
+        # the buffer, so they are copied only once, into the object being read.
+        # Python 2 cannot decode views, so slices are taken from the buffer itself.
+        self._view = memoryview(buff) if six.PY3 else buff
         self._service = serialization_service
         self._is_big_endian = is_big_endian
         self._pos = offset
@@ -20,6 +26,7 @@ class _ObjectDataInput(ObjectDataInput):
         self._FMT_LONG = BE_LONG if self._is_big_endian else LE_LONG
         self._FMT_FLOAT = BE_FLOAT if self._is_big_endian else LE_FLOAT
         self._FMT_DOUBLE = BE_DOUBLE if self._is_big_endian else LE_DOUBLE
+        self._BYTE_ORDER = ">" if self._is_big_endian else "<"
 
     def read_into(self, buff, offset=None, length=None):
         _off = offset if offset is not None else 0
@@ -88,41 +95,43 @@ class _ObjectDataInput(ObjectDataInput):
         length = self.read_int()
         if length == NULL_ARRAY_LENGTH:
             return None
-        result = bytearray(length)
-        if length > 0:
-            self.read_into(result, 0, length)
-        return result.decode("utf-8")
+        data = self._read_slice(length)
+        if six.PY2:
+            # unicode() accepts neither bytearrays nor memoryviews
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return data.decode("utf-8")
+        return str(data, "utf-8")
 
     def read_byte_array(self):
         length = self.read_int()
         if length == NULL_ARRAY_LENGTH:
             return None
-        result = bytearray(length)
-        if length > 0:
-            self.read_into(result, 0, length)
-
-        return result
+        return bytearray(self._read_slice(length))
 
     def read_boolean_array(self):
-        return self._read_array_fnc(self.read_boolean)
+        return self._read_primitive_array("?", BOOLEAN_SIZE_IN_BYTES)
 
     def read_char_array(self):
-        return self._read_array_fnc(self.read_char)
+        char_ords = self._read_primitive_array("H", CHAR_SIZE_IN_BYTES)
+        if char_ords is None:
+            return None
+        return [six.unichr(char_ord) for char_ord in char_ords]
 
     def read_int_array(self):
-        return self._read_array_fnc(self.read_int)
+        return self._read_primitive_array("i", INT_SIZE_IN_BYTES)
 
     def read_long_array(self):
-        return self._read_array_fnc(self.read_long)
+        return self._read_primitive_array("q", LONG_SIZE_IN_BYTES)
 
     def read_double_array(self):
-        return self._read_array_fnc(self.read_double)
+        return self._read_primitive_array("d", DOUBLE_SIZE_IN_BYTES)
 
     def read_float_array(self):
-        return self._read_array_fnc(self.read_float)
+        return self._read_primitive_array("f", FLOAT_SIZE_IN_BYTES)
 
     def read_short_array(self):
-        return self._read_array_fnc(self.read_short)
+        return self._read_primitive_array("h", SHORT_SIZE_IN_BYTES)
 
     def read_utf_array(self):
         return self._read_array_fnc(self.read_utf)
@@ -163,6 +172,25 @@ class _ObjectDataInput(ObjectDataInput):
             val = fmt.unpack_from(self._buffer, position)
         return val[0]
 
+    def _read_slice(self, length):
+        self._check_available(self._pos, length)
+        start = self._pos
+        self._pos += length
+        return self._view[start:self._pos]
+
+    def _read_primitive_array(self, fmt, item_size):
+        # Unpacks all the items with a single struct call, instead of one call per item
+        length = self.read_int()
+        if length == NULL_ARRAY_LENGTH:
+            return None
+        if length > 0:
+            size = length * item_size
+            self._check_available(self._pos, size)
+            values = struct.unpack_from("%s%d%s" % (self._BYTE_ORDER, length, fmt), self._buffer, self._pos)
+            self._pos += size
+            return list(values)
+        return []
+
     def _read_array_fnc(self, read_item_fnc):
         length = self.read_int()
         if length == NULL_ARRAY_LENGTH:
@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+
+from hazelcast import six
+
+# Keys of these types are immutable and serialized the same way each time.
+# bool is left out on purpose, as True == 1 would share the entry of 1.
+_CACHEABLE_TYPES = frozenset((six.text_type, six.binary_type) + six.integer_types)
+
+
+def _is_cacheable(key):
+    key_type = type(key)
+    if key_type in _CACHEABLE_TYPES:
+        return True
+    if key_type is tuple:
+        for item in key:
+            if not _is_cacheable(item):
+                return False
+        return True
+    return False
+
+
+class KeyDataCache(object):
+    """Bounded cache from immutable keys to their serialized forms.
+
+    Only ``str``, ``bytes``, ``int`` keys and tuples of them are cached. Other
+    keys are serialized on each call. When the cache is full, the entry that
+    was added first is evicted.
+
+    The cached ``Data`` objects keep their hashes once computed, so the
+    partition id and near cache lookups of a cached key do not hash it again.
+    """
+
+    def __init__(self, to_data, max_size):
+        self._to_data = to_data
+        self._max_size = max_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def to_data(self, key):
+        """Returns the serialized form of the key.
+
+        Args:
+            key: The key to serialize.
+
+        Returns:
+            hazelcast.serialization.data.Data: The serialized key.
+        """
+        if not _is_cacheable(key):
+            return self._to_data(key)
+
+        data = self._cache.get(key, None)
+        if data is not None:
+            self._hits += 1
+            return data
+
+        data = self._to_data(key)
+        with self._lock:
+            self._misses += 1
+            if key not in self._cache:
+                if len(self._cache) >= self._max_size:
+                    self._cache.popitem(last=False)
+                    self._evictions += 1
+                self._cache[key] = data
+        return data
+
+    def clear(self):
+        """Removes all the cached keys."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_statistics(self):
+        """Returns the statistics of the cache.
+
+        Hits are counted without a lock, so they may be slightly off when the
+        cache is used by multiple threads.
+
+        Returns:
+            dict: Dictionary that stores the following statistics:
+
+            - **hits**: Number of keys found in the cache.
+            - **misses**: Number of cacheable keys that were serialized.
+            - **evictions**: Number of keys evicted from the cache.
+            - **size**: Number of keys in the cache.
+            - **max_size**: Maximum number of keys in the cache.
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._cache),
+            "max_size": self._max_size,
+        }
@@ -1,6 +1,14 @@
+import struct
+from collections import deque
+
 from hazelcast.serialization.api import *
 from hazelcast.serialization.bits import *
-from hazelcast.six.moves import range
+
+# Outputs whose buffers grew beyond this size are trimmed before they are put back to the pool
+_MAX_POOLED_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of idle outputs kept in the pool
+_MAX_POOL_SIZE = 16
 
 
 class _ObjectDataOutput(ObjectDataOutput):
@@ -17,6 +25,7 @@ class _ObjectDataOutput(ObjectDataOutput):
         self._FMT_LONG = BE_LONG if self._is_big_endian else LE_LONG
         self._FMT_FLOAT = BE_FLOAT if self._is_big_endian else LE_FLOAT
         self._FMT_DOUBLE = BE_DOUBLE if self._is_big_endian else LE_DOUBLE
+        self._BYTE_ORDER = ">" if self._is_big_endian else "<"
 
     def _write(self, val):
         self._ensure_available(BYTE_SIZE_IN_BYTES)
@@ -104,25 +113,28 @@ class _ObjectDataOutput(ObjectDataOutput):
             self.write_from(val)
 
     def write_boolean_array(self, val):
-        self._write_array_fnc(val, self.write_boolean)
+        self._write_primitive_array(val, "?", BOOLEAN_SIZE_IN_BYTES)
 
     def write_char_array(self, val):
-        self._write_array_fnc(val, self.write_char)
+        _len = len(val) if val is not None else NULL_ARRAY_LENGTH
+        self.write_int(_len)
+        if _len > 0:
+            self.write_from("".join(val).encode(self._CHAR_ENCODING))
 
     def write_int_array(self, val):
-        self._write_array_fnc(val, self.write_int)
+        self._write_primitive_array(val, "i", INT_SIZE_IN_BYTES)
 
     def write_long_array(self, val):
-        self._write_array_fnc(val, self.write_long)
+        self._write_primitive_array(val, "q", LONG_SIZE_IN_BYTES)
 
     def write_double_array(self, val):
-        self._write_array_fnc(val, self.write_double)
+        self._write_primitive_array(val, "d", DOUBLE_SIZE_IN_BYTES)
 
     def write_float_array(self, val):
-        self._write_array_fnc(val, self.write_float)
+        self._write_primitive_array(val, "f", FLOAT_SIZE_IN_BYTES)
 
     def write_short_array(self, val):
-        self._write_array_fnc(val, self.write_short)
+        self._write_primitive_array(val, "h", SHORT_SIZE_IN_BYTES)
 
     def write_utf_array(self, val):
         self._write_array_fnc(val, self.write_utf)
@@ -148,10 +160,20 @@ class _ObjectDataOutput(ObjectDataOutput):
         self._pos = position
 
     def write_zero_bytes(self, count):
-        for i in range(0, count):
-            self._write(0)
+        if count <= 0:
+            return
+        self._ensure_available(count)
+        # The buffer may be reused from the pool, so the zeros are written explicitly
+        self._buffer[self._pos:self._pos + count] = bytearray(count)
+        self._pos += count
 
     # HELPERS
+    def _write_packed(self, packer, *values):
+        size = packer.size
+        self._ensure_available(size)
+        packer.pack_into(self._buffer, self._pos, *values)
+        self._pos += size
+
     def _write_array_fnc(self, val, item_write_fnc):
         _len = len(val) if val is not None else NULL_ARRAY_LENGTH
         self.write_int(_len)
@@ -159,13 +181,22 @@ class _ObjectDataOutput(ObjectDataOutput):
             for item in val:
                 item_write_fnc(item)
 
+    def _write_primitive_array(self, val, fmt, item_size):
+        # Packs all the items with a single struct call, instead of one call per item
+        _len = len(val) if val is not None else NULL_ARRAY_LENGTH
+        self.write_int(_len)
+        if _len > 0:
+            size = _len * item_size
+            self._ensure_available(size)
+            struct.pack_into("%s%d%s" % (self._BYTE_ORDER, _len, fmt), self._buffer, self._pos, *val)
+            self._pos += size
+
     def _ensure_available(self, length):
         if self._available() < length:
             buffer_length = len(self._buffer)
             new_length = max(buffer_length << 1, buffer_length + length)
-            new_buffer = bytearray(new_length)
-            new_buffer[:self._pos] = self._buffer[:self._pos]
-            self._buffer = new_buffer
+            # Grows the buffer in place, without copying the written bytes to a temporary slice
+            self._buffer.extend(bytearray(new_length - buffer_length))
 
     def _available(self):
         return len(self._buffer) - self._pos
@@ -177,6 +208,75 @@ class _ObjectDataOutput(ObjectDataOutput):
         return buf[:pos_] + "[" + buf[pos_] + "]" + buf[pos_ + 1:]
 
 
+class _ObjectDataOutputPool(object):
+    """Pool of outputs that are reused across serializations.
+
+    The outputs keep the buffers they have grown to, so that the buffer sizes
+    adapt to the sizes of the objects serialized, up to ``max_buffer_size``.
+    Larger buffers are handed over to the serialized data and replaced with a
+    buffer of the initial size.
+
+    It is safe to use the pool from multiple threads, as ``deque`` appends and
+    pops are atomic.
+    """
+
+    def __init__(self, init_size, serialization_service, is_big_endian,
+                 max_buffer_size=_MAX_POOLED_BUFFER_SIZE, max_pool_size=_MAX_POOL_SIZE):
+        self._init_size = init_size
+        self._service = serialization_service
+        self._is_big_endian = is_big_endian
+        self._max_buffer_size = max(init_size, max_buffer_size)
+        self._max_pool_size = max_pool_size
+        self._outputs = deque()
+
+    def take(self):
+        """Returns an idle output from the pool or creates a new one.
+
+        Returns:
+            _ObjectDataOutput: The output, positioned at the start of its buffer.
+        """
+        try:
+            return self._outputs.pop()
+        except IndexError:
+            return _ObjectDataOutput(self._init_size, self._service, self._is_big_endian)
+
+    def to_byte_array(self, out):
+        """Returns the bytes written to the output in an exact size byte array.
+
+        Buffers that grew beyond the maximum pooled size are trimmed to the
+        written size in place and handed over, instead of being copied.
+
+        Args:
+            out (_ObjectDataOutput): Output taken from this pool.
+
+        Returns:
+            bytearray: The written bytes.
+        """
+        buf = out._buffer
+        if len(buf) <= self._max_buffer_size:
+            return buf[:out._pos]
+
+        del buf[out._pos:]
+        out._buffer = bytearray(self._init_size)
+        return buf
+
+    def give(self, out):
+        """Resets the output and puts it back to the pool.
+
+        Args:
+            out (_ObjectDataOutput): Output taken from this pool.
+        """
+        out._pos = 0
+        if len(out._buffer) > self._max_buffer_size:
+            out._buffer = bytearray(self._init_size)
+
+        if len(self._outputs) < self._max_pool_size:
+            self._outputs.append(out)
+
+    def __len__(self):
+        return len(self._outputs)
+
+
 class EmptyObjectDataOutput(ObjectDataOutput):
     def write_utf_array(self, val):
         pass
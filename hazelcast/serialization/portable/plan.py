@@ -0,0 +1,70 @@
+import struct
+
+from hazelcast import six
+from hazelcast.serialization import bits
+from hazelcast.serialization.portable.classdef import FieldType
+
+# Struct formats of the fields whose values have a fixed size. Char fields are written
+# as encoded text and are not included.
+_FIXED_SIZE_FORMATS = {
+    FieldType.BYTE: "B",
+    FieldType.BOOLEAN: "?",
+    FieldType.SHORT: "h",
+    FieldType.INT: "i",
+    FieldType.LONG: "q",
+    FieldType.FLOAT: "f",
+    FieldType.DOUBLE: "d",
+}
+
+
+class FieldPlan(object):
+    """Precomputed layout of a single field of a Portable.
+
+    Attributes:
+        field_def (hazelcast.serialization.portable.classdef.FieldDefinition): Definition of the field.
+        field_type (int): Type of the field.
+        index_offset (int): Offset of the field's entry in the position table of the Portable.
+        header (bytes): Encoded field header, that is the name length, the name and the type.
+        header_size (int): Size of the field header that precedes the value in the stream.
+        packer (struct.Struct): Packs the field header and the value in a single call. ``None``
+            for the fields whose values do not have a fixed size.
+    """
+
+    __slots__ = ("field_def", "field_type", "index_offset", "header", "header_size", "packer")
+
+    def __init__(self, field_def, byte_order):
+        field_name = field_def.field_name
+        encoded_name = field_name.encode("utf-8")
+        self.field_def = field_def
+        self.field_type = field_def.field_type
+        self.index_offset = field_def.index * bits.INT_SIZE_IN_BYTES
+        self.header = struct.pack("%sh%dsb" % (byte_order, len(encoded_name)),
+                                  len(field_name), encoded_name, field_def.field_type)
+        # The name length is written as the number of characters of the name
+        self.header_size = bits.SHORT_SIZE_IN_BYTES + len(field_name) + bits.BYTE_SIZE_IN_BYTES
+
+        value_format = _FIXED_SIZE_FORMATS.get(self.field_type, None)
+        if value_format is None:
+            self.packer = None
+        else:
+            self.packer = struct.Struct("%s%ds%s" % (byte_order, len(self.header), value_format))
+
+
+class PortablePlan(object):
+    """Read and write plan of a Portable, compiled from its class definition.
+
+    The field lookups, the positions of the field entries and the encoding of the
+    field headers are done once per class definition, instead of once per field
+    every time a Portable is serialized or deserialized.
+
+    Attributes:
+        class_def (hazelcast.serialization.portable.classdef.ClassDefinition): The compiled class definition.
+        fields (dict[str, FieldPlan]): Plans of the fields, by field name.
+    """
+
+    __slots__ = ("class_def", "fields")
+
+    def __init__(self, class_def, is_big_endian):
+        byte_order = ">" if is_big_endian else "<"
+        self.class_def = class_def
+        self.fields = dict((name, FieldPlan(fd, byte_order)) for name, fd in six.iteritems(class_def.field_defs))
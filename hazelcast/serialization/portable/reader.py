@@ -2,14 +2,18 @@ from hazelcast.errors import HazelcastSerializationError
 from hazelcast.serialization import bits
 from hazelcast.serialization.api import PortableReader
 from hazelcast.serialization.portable.classdef import FieldType
+from hazelcast.serialization.portable.plan import PortablePlan
 from hazelcast.six.moves import range
 
 
 class DefaultPortableReader(PortableReader):
-    def __init__(self, portable_serializer, data_input, class_def):
+    def __init__(self, portable_serializer, data_input, class_def, plan=None):
         self._portable_serializer = portable_serializer
         self._in = data_input
         self._class_def = class_def
+        if plan is None:
+            plan = PortablePlan(class_def, data_input.is_big_endian())
+        self._fields = plan.fields
         try:
             # final position after portable is read
             self._final_pos = data_input.read_int()
@@ -228,12 +232,13 @@ class DefaultPortableReader(PortableReader):
     def _read_position(self, field_name, field_type):
         if self._raw:
             raise HazelcastSerializationError("Cannot read Portable fields after get_raw_data_input() is called!")
-        fd = self._class_def.get_field(field_name)
-        if fd is None:
+        field = self._fields.get(field_name, None)
+        if field is None:
             return self._read_nested_position(field_name, field_type)
-        if fd.field_type != field_type:
+        if field.field_type != field_type:
             raise HazelcastSerializationError("Not a '%s' field: %s" % (field_type, field_name))
-        return self._read_position_by_field_def(fd)
+        # The size of the field header is known from the class definition, so it is not read from the stream
+        return self._in.read_int(self._offset + field.index_offset) + field.header_size
 
     def _read_nested_position(self, field_name, field_type):
         field_names = field_name.split(".")
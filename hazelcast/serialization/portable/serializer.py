@@ -2,6 +2,7 @@ import hazelcast.util as util
 from hazelcast.errors import HazelcastSerializationError
 from hazelcast.serialization.api import StreamSerializer, Portable
 from hazelcast.serialization.portable.reader import DefaultPortableReader, MorphingPortableReader
+from hazelcast.serialization.portable.plan import PortablePlan
 from hazelcast.serialization.portable.writer import DefaultPortableWriter
 from hazelcast.serialization.serialization_const import CONSTANT_TYPE_PORTABLE
 
@@ -10,6 +11,7 @@ class PortableSerializer(StreamSerializer):
     def __init__(self, portable_context, portable_factories):
         self._portable_context = portable_context
         self._portable_factories = portable_factories
+        self._plans = {}  # (factory_id, class_id, version):PortablePlan
 
     def write(self, out, portable):
         if not isinstance(portable, Portable):
@@ -24,7 +26,7 @@ class PortableSerializer(StreamSerializer):
         cd = self._portable_context.lookup_or_register_class_definition(portable)
         out.write_int(cd.version)
 
-        writer = DefaultPortableWriter(self, out, cd)
+        writer = DefaultPortableWriter(self, out, cd, self._get_plan(cd, out.is_big_endian()))
         portable.write_portable(writer)
         writer.end()
 
@@ -72,12 +74,23 @@ class PortableSerializer(StreamSerializer):
             cd = self._portable_context.read_class_definition(inp, factory_id, class_id, effective_version)
             inp.set_position(begin)
 
+        plan = self._get_plan(cd, inp.is_big_endian())
         if portable_version == effective_version:
-            reader = DefaultPortableReader(self, inp, cd)
+            reader = DefaultPortableReader(self, inp, cd, plan)
         else:
-            reader = MorphingPortableReader(self, inp, cd)
+            reader = MorphingPortableReader(self, inp, cd, plan)
         return reader
 
+    def _get_plan(self, class_def, is_big_endian):
+        key = (class_def.factory_id, class_def.class_id, class_def.version)
+        plan = self._plans.get(key, None)
+        if plan is None or plan.class_def is not class_def:
+            # Class definitions read from the stream that are not registered are
+            # not shared, so their plans are compiled again.
+            plan = PortablePlan(class_def, is_big_endian)
+            self._plans[key] = plan
+        return plan
+
     def create_morphing_reader(self, inp):
         factory_id = inp.read_int()
         class_id = inp.read_int()
@@ -100,3 +113,4 @@ class PortableSerializer(StreamSerializer):
 
     def destroy(self):
         self._portable_factories.clear()
+        self._plans.clear()
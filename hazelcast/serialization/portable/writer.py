@@ -4,15 +4,19 @@ from hazelcast.serialization import INT_SIZE_IN_BYTES, NULL_ARRAY_LENGTH
 from hazelcast.serialization.api import PortableWriter
 from hazelcast.serialization.output import EmptyObjectDataOutput
 from hazelcast.serialization.portable.classdef import FieldType, ClassDefinitionBuilder
+from hazelcast.serialization.portable.plan import PortablePlan
 from hazelcast.six.moves import range
 
 
 class DefaultPortableWriter(PortableWriter):
-    def __init__(self, portable_serializer, out, class_definition):
+    def __init__(self, portable_serializer, out, class_definition, plan=None):
         self._raw = False
         self._portable_serializer = portable_serializer
         self._out = out
         self._class_def = class_definition
+        if plan is None:
+            plan = PortablePlan(class_definition, out.is_big_endian())
+        self._fields = plan.fields
         self._writen_fields = set()
         self._begin_pos = out.position()
 
@@ -26,36 +30,29 @@ class DefaultPortableWriter(PortableWriter):
         out.write_zero_bytes(field_indexes_length)
 
     def write_byte(self, field_name, value):
-        self._set_position(field_name, FieldType.BYTE)
-        self._out.write_byte(value)
+        self._write_fixed_size(field_name, FieldType.BYTE, value, self._out.write_byte)
 
     def write_boolean(self, field_name, value):
-        self._set_position(field_name, FieldType.BOOLEAN)
-        self._out.write_boolean(value)
+        self._write_fixed_size(field_name, FieldType.BOOLEAN, value, self._out.write_boolean)
 
     def write_char(self, field_name, value):
         self._set_position(field_name, FieldType.CHAR)
         self._out.write_char(value)
 
     def write_short(self, field_name, value):
-        self._set_position(field_name, FieldType.SHORT)
-        self._out.write_short(value)
+        self._write_fixed_size(field_name, FieldType.SHORT, value, self._out.write_short)
 
     def write_int(self, field_name, value):
-        self._set_position(field_name, FieldType.INT)
-        self._out.write_int(value)
+        self._write_fixed_size(field_name, FieldType.INT, value, self._out.write_int)
 
     def write_long(self, field_name, value):
-        self._set_position(field_name, FieldType.LONG)
-        self._out.write_long(value)
+        self._write_fixed_size(field_name, FieldType.LONG, value, self._out.write_long)
 
     def write_float(self, field_name, value):
-        self._set_position(field_name, FieldType.FLOAT)
-        self._out.write_float(value)
+        self._write_fixed_size(field_name, FieldType.FLOAT, value, self._out.write_float)
 
     def write_double(self, field_name, value):
-        self._set_position(field_name, FieldType.DOUBLE)
-        self._out.write_double(value)
+        self._write_fixed_size(field_name, FieldType.DOUBLE, value, self._out.write_double)
 
     def write_utf(self, field_name, value):
         self._set_position(field_name, FieldType.UTF)
@@ -141,24 +138,40 @@ class DefaultPortableWriter(PortableWriter):
         return self._out
 
     # internal
+    def _write_fixed_size(self, field_name, field_type, value, write_value):
+        field = self._check_field(field_name)
+        out = self._out
+        out.write_int(out.position(), self._offset + field.index_offset)
+        if field.field_type == field_type:
+            # Writes the field header and the value with a single struct call
+            out._write_packed(field.packer, field.header, value)
+        else:
+            self._write_field_header(field_name, field_type)
+            write_value(value)
+
     def _set_position(self, field_name, field_type):
+        field = self._check_field(field_name)
+        out = self._out
+        out.write_int(out.position(), self._offset + field.index_offset)
+        if field.field_type == field_type:
+            out.write_from(field.header)
+        else:
+            self._write_field_header(field_name, field_type)
+        return field.field_def
+
+    def _check_field(self, field_name):
         if self._raw:
             raise HazelcastSerializationError("Cannot write Portable fields after get_raw_data_output() is called!")
-        fd = self._class_def.get_field(field_name)
-        if fd is None:
+        field = self._fields.get(field_name, None)
+        if field is None:
             raise HazelcastSerializationError("Invalid field name:'%s' for ClassDefinition(id:%s , version:%s )"
                                               % (field_name, self._class_def.class_id, self._class_def.version))
-        if field_name not in self._writen_fields:
-            self._write_field_def(fd.index, field_name, field_type)
-            self._writen_fields.add(field_name)
-        else:
+        if field_name in self._writen_fields:
             raise HazelcastSerializationError("Field '%s' has already been written!" % field_name)
-        return fd
+        self._writen_fields.add(field_name)
+        return field
 
-    def _write_field_def(self, index, field_name, field_type):
-        pos_val = self._out.position()
-        position = self._offset + index * INT_SIZE_IN_BYTES
-        self._out.write_int(pos_val, position)
+    def _write_field_header(self, field_name, field_type):
         self._out.write_short(len(field_name))
         self._out.write_from(field_name.encode("utf-8"))
         self._out.write_byte(field_type)
@@ -31,6 +31,7 @@ CONSTANT_TYPE_UUID = -21
 JAVA_DEFAULT_TYPE_CLASS = -24
 JAVA_DEFAULT_TYPE_DATE = -25
 JAVA_DEFAULT_TYPE_BIG_INTEGER = -26
+JAVA_DEFAULT_TYPE_ARRAY = -28
 JAVA_DEFAULT_TYPE_ARRAY_LIST = -29
 JAVA_DEFAULT_TYPE_LINKED_LIST = -30
 JAVASCRIPT_JSON_SERIALIZATION_TYPE = -130
@@ -40,3 +41,6 @@ JAVASCRIPT_JSON_SERIALIZATION_TYPE = -130
 
 JAVA_DEFAULT_TYPE_SERIALIZABLE = -100
 PYTHON_TYPE_PICKLE = -120
+PYTHON_TYPE_PICKLE_BINARY = -121
+PYTHON_TYPE_NUMPY_ARRAY = -122
+PYTHON_TYPE_COMPRESSED = -123
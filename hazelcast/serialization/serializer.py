@@ -8,11 +8,17 @@ from hazelcast.core import HazelcastJsonValue
 from hazelcast.serialization.bits import *
 from hazelcast.serialization.api import StreamSerializer
 from hazelcast.serialization.base import HazelcastSerializationError
+from hazelcast.serialization.data import Data
 from hazelcast.serialization.serialization_const import *
 from hazelcast.six.moves import range, cPickle
 
 from hazelcast.util import to_signed
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 if not six.PY2:
     long = int
 
@@ -149,11 +155,16 @@ class UuidSerializer(BaseSerializer):
 
 
 class HazelcastJsonValueSerializer(BaseSerializer):
+    def __init__(self, codec=None):
+        self._codec = codec
+
+    # JSON strings are written in the same format as the byte arrays, so
+    # the values are kept in their encoded forms while being passed through.
     def read(self, inp):
-        return HazelcastJsonValue(inp.read_utf())
+        return HazelcastJsonValue(inp.read_byte_array(), self._codec)
 
     def write(self, out, obj):
-        out.write_utf(obj.to_string())
+        out.write_byte_array(obj.to_bytes())
 
     def get_type_id(self):
         return JAVASCRIPT_JSON_SERIALIZATION_TYPE
@@ -339,6 +350,19 @@ class LinkedListSerializer(BaseSerializer):
         return JAVA_DEFAULT_TYPE_LINKED_LIST
 
 
+class ArraySerializer(BaseSerializer):
+    def read(self, inp):
+        size = inp.read_int()
+        if size > NULL_ARRAY_LENGTH:
+            return [inp.read_object() for _ in range(0, size)]
+        return None
+
+    # "write(self, out, obj)" is never called so not implemented here
+
+    def get_type_id(self):
+        return JAVA_DEFAULT_TYPE_ARRAY
+
+
 class PythonObjectSerializer(BaseSerializer):
     def read(self, inp):
         str = inp.read_utf().encode()
@@ -351,6 +375,127 @@ class PythonObjectSerializer(BaseSerializer):
         return PYTHON_TYPE_PICKLE
 
 
+class BinaryPythonObjectSerializer(BaseSerializer):
+    """Pickles objects with a binary protocol and writes them as raw bytes.
+
+    With protocol 5 and above, the buffers that support out-of-band
+    pickling are written right after the pickle, straight from their
+    memory, instead of being copied into the pickle first.
+    """
+
+    def __init__(self, protocol=cPickle.HIGHEST_PROTOCOL):
+        self._protocol = protocol
+        self._out_of_band = protocol >= 5
+
+    def read(self, inp):
+        pickled = inp.read_byte_array()
+        buffer_count = inp.read_int()
+        if six.PY2:
+            pickled = bytes(pickled)
+
+        if buffer_count == 0:
+            return cPickle.loads(pickled)
+
+        buffers = [inp.read_byte_array() for _ in range(buffer_count)]
+        return cPickle.loads(pickled, buffers=buffers)
+
+    def write(self, out, obj):
+        pickled, buffers = self.dumps(obj)
+        out.write_byte_array(pickled)
+        out.write_int(len(buffers))
+        for buf in buffers:
+            out.write_byte_array(buf)
+
+    def dumps(self, obj):
+        """Pickles the object.
+
+        Args:
+            obj: The object to pickle.
+
+        Returns:
+            tuple[bytes, list[memoryview]]: The pickle and the raw memory of the
+            buffers pickled out-of-band.
+        """
+        if not self._out_of_band:
+            return cPickle.dumps(obj, self._protocol), []
+
+        buffers = []
+
+        def buffer_callback(pickle_buffer):
+            try:
+                buffers.append(pickle_buffer.raw())
+            except BufferError:
+                # Non-contiguous buffers are pickled in-band
+                return True
+
+        return cPickle.dumps(obj, self._protocol, buffer_callback=buffer_callback), buffers
+
+    def get_type_id(self):
+        return PYTHON_TYPE_PICKLE_BINARY
+
+
+class NumpyArraySerializer(BaseSerializer):
+    """Serializes ``numpy.ndarray`` objects as their dtype and shape, followed
+    by the raw bytes of the array.
+
+    Arrays whose dtype cannot be described by a type string, like the object
+    or structured ones, are pickled instead.
+    """
+
+    def read(self, inp):
+        if numpy is None:
+            raise HazelcastSerializationError("NumPy is required to deserialize NumPy arrays")
+
+        is_raw = inp.read_boolean()
+        if not is_raw:
+            return cPickle.loads(bytes(inp.read_byte_array()))
+
+        dtype = numpy.dtype(inp.read_utf())
+        shape = tuple(inp.read_int_array())
+        buf = inp.read_byte_array()
+        if len(buf) == 0:
+            return numpy.empty(shape, dtype)
+        return numpy.frombuffer(buf, dtype).reshape(shape)
+
+    def write(self, out, obj):
+        dtype = obj.dtype
+        is_raw = not (dtype.hasobject or dtype.fields is not None or dtype.subdtype is not None)
+        out.write_boolean(is_raw)
+        if not is_raw:
+            out.write_byte_array(cPickle.dumps(obj, cPickle.HIGHEST_PROTOCOL))
+            return
+
+        # The type string contains the byte order, so the arrays are read back as they are written
+        out.write_utf(dtype.str)
+        out.write_int_array(obj.shape)
+        out.write_byte_array(numpy.ascontiguousarray(obj).reshape(-1).view(numpy.uint8).data)
+
+    def get_type_id(self):
+        return PYTHON_TYPE_NUMPY_ARRAY
+
+
+class CompressedDataSerializer(BaseSerializer):
+    """Decompresses the values compressed by the value compressors and
+    deserializes them.
+    """
+
+    def __init__(self, codecs, to_object):
+        self._codecs = codecs  # dict of codec id:codec
+        self._to_object = to_object
+
+    def read(self, inp):
+        codec_id = inp.read_int()
+        codec = self._codecs.get(codec_id, None)
+        if codec is None:
+            raise HazelcastSerializationError("Missing compression codec for codec-id: %s" % codec_id)
+        return self._to_object(Data(codec.decompress(inp.read_byte_array())))
+
+    # "write(self, out, obj)" is never called so not implemented here
+
+    def get_type_id(self):
+        return PYTHON_TYPE_COMPRESSED
+
+
 class IdentifiedDataSerializer(BaseSerializer):
     def __init__(self, factories):
         self._factories = factories
@@ -1,6 +1,8 @@
 import uuid
 
+from hazelcast.aggregator import AGGREGATOR_FACTORY_ID, AGGREGATOR_FACTORY
 from hazelcast.serialization.base import BaseSerializationService
+from hazelcast.serialization.compression import ZlibCodec, ValueCompressor, ZLIB_CODEC_ID
 from hazelcast.serialization.portable.classdef import FieldType
 from hazelcast.serialization.portable.context import PortableContext
 from hazelcast.serialization.portable.serializer import PortableSerializer
@@ -24,12 +26,14 @@ class SerializationServiceV1(BaseSerializationService):
         super(SerializationServiceV1, self).__init__(version, global_partition_strategy, output_buffer_size,
                                                      config.is_big_endian,
                                                      config.default_int_type)
+        self._pickle_protocol = config.pickle_protocol
+        self._json_codec = config.json_codec
         self._portable_context = PortableContext(self, config.portable_version)
         self.register_class_definitions(config.class_definitions, config.check_class_definition_errors)
         self._registry._portable_serializer = PortableSerializer(self._portable_context, config.portable_factories)
 
         # merge configured factories with built in ones
-        factories = {}
+        factories = {AGGREGATOR_FACTORY_ID: AGGREGATOR_FACTORY}
         factories.update(config.data_serializable_factories)
         self._registry._data_serializer = IdentifiedDataSerializer(factories)
         self._register_constant_serializers()
@@ -38,11 +42,20 @@ class SerializationServiceV1(BaseSerializationService):
         for _type, custom_serializer in six.iteritems(config.custom_serializers):
             self._registry.safe_register_serializer(custom_serializer(), _type)
 
+        # Register NumPy array serializer, unless there is a custom one
+        numpy_array_serializer = NumpyArraySerializer()
+        self._registry.safe_register_serializer(numpy_array_serializer)
+        if numpy is not None and numpy.ndarray not in config.custom_serializers:
+            self._registry.safe_register_serializer(numpy_array_serializer, numpy.ndarray)
+
         # Register Global Serializer
         global_serializer = config.global_serializer
         if global_serializer:
             self._registry._global_serializer = global_serializer()
 
+        self._register_fast_writers()
+        self._register_value_compressors(config.value_compression)
+
     def _register_constant_serializers(self):
         self._registry.register_constant_serializer(self._registry._null_serializer, type(None))
         self._registry.register_constant_serializer(self._registry._data_serializer)
@@ -73,9 +86,42 @@ class SerializationServiceV1(BaseSerializationService):
         self._registry.register_constant_serializer(JavaClassSerializer())
         self._registry.register_constant_serializer(ArrayListSerializer(), list)
         self._registry.register_constant_serializer(LinkedListSerializer())
-        self._registry.register_constant_serializer(HazelcastJsonValueSerializer(), HazelcastJsonValue)
+        self._registry.register_constant_serializer(ArraySerializer())
+        self._registry.register_constant_serializer(HazelcastJsonValueSerializer(self._json_codec), HazelcastJsonValue)
 
         self._registry.safe_register_serializer(self._registry._python_serializer)
+        binary_python_serializer = BinaryPythonObjectSerializer(self._pickle_protocol)
+        self._registry.safe_register_serializer(binary_python_serializer)
+        if self._pickle_protocol > 0:
+            self._registry._python_serializer = binary_python_serializer
+
+    def get_value_compressor(self, name):
+        """Returns the compressor for the values of the data structure.
+
+        Args:
+            name (str): Name of the data structure.
+
+        Returns:
+            hazelcast.serialization.compression.ValueCompressor: The compressor,
+            or ``None`` if the compression is not configured for the data structure.
+        """
+        return self._value_compressors.get(name, None)
+
+    def _register_value_compressors(self, compression_configs):
+        # Values compressed with zlib can always be read, compression is only configured for writing
+        codecs = {ZLIB_CODEC_ID: ZlibCodec()}
+        self._value_compressors = {}
+        for name, compression_config in six.iteritems(compression_configs):
+            codec = compression_config.codec or ZlibCodec()
+            codec_id = codec.get_id()
+            current = codecs.get(codec_id, None)
+            if current is not None and current.__class__ != codec.__class__:
+                raise ValueError("Codec[%s] has been already registered for codec-id: %s"
+                                 % (current.__class__, codec_id))
+            codecs[codec_id] = codec
+            self._value_compressors[name] = ValueCompressor(self, codec, compression_config.threshold)
+
+        self._registry.safe_register_serializer(CompressedDataSerializer(codecs, self.to_object))
 
     def register_class_definitions(self, class_definitions, check_error):
         factories = dict()
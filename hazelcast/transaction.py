@@ -5,6 +5,7 @@ from hazelcast.errors import TransactionError, IllegalStateError
 from hazelcast.future import make_blocking
 from hazelcast.invocation import Invocation
 from hazelcast.protocol.codec import transaction_create_codec, transaction_commit_codec, transaction_rollback_codec
+from hazelcast.proxy.base import MAX_SIZE
 from hazelcast.proxy.transactional_list import TransactionalList
 from hazelcast.proxy.transactional_map import TransactionalMap
 from hazelcast.proxy.transactional_multi_map import TransactionalMultiMap
@@ -126,7 +127,8 @@ class Transaction(object):
         try:
             self._check_timeout()
             request = transaction_commit_codec.encode_request(self.id, self.thread_id)
-            invocation = Invocation(request, connection=self.connection)
+            invocation = Invocation(request, connection=self.connection, timeout=MAX_SIZE,
+                                    count_in_flight=False)
             invocation_service = self._context.invocation_service
             invocation_service.invoke(invocation)
             invocation.future.result()
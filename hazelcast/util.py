@@ -1,9 +1,10 @@
 import random
 import threading
 import time
-from collections import Sequence, Iterable
+from collections import Sequence
 
 from hazelcast import six
+from hazelcast.six.moves import range
 
 DEFAULT_ADDRESS = "127.0.0.1"
 DEFAULT_PORT = 5701
@@ -111,10 +112,20 @@ class AtomicInteger(object):
 
 
 class ImmutableLazyDataList(Sequence):
+    """List of the serialized items of a response, that are deserialized on access.
+
+    Deserialized items replace their serialized forms in the underlying list,
+    so an item is deserialized once, and its ``Data`` is released as soon as
+    it is deserialized.
+    """
+
     def __init__(self, list_data, to_object):
         super(ImmutableLazyDataList, self).__init__()
         self._list_data = list_data
-        self._list_obj = [None] * len(self._list_data)
+        # 1 at the indexes whose items are already deserialized
+        self._decoded = bytearray(len(list_data))
+        # Decided on the serialized items, as the deserialized values can be tuples too
+        self._is_entry_list = len(list_data) > 0 and isinstance(list_data[0], tuple)
         self.to_object = to_object
 
     def __contains__(self, value):
@@ -124,30 +135,96 @@ class ImmutableLazyDataList(Sequence):
         return self._list_data.__len__()
 
     def __getitem__(self, index):
-        val = self._list_obj[index]
-        if not val:
-            data = self._list_data[index]
-            if isinstance(data, tuple):
-                (key, value) = data
-                self._list_obj[index] = (self.to_object(key), self.to_object(value))
-            else:
-                self._list_obj[index] = self.to_object(data)
-        return self._list_obj[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._decoded[index]:
+            return self._list_data[index]
+        item = self._to_object(self._list_data[index])
+        self._list_data[index] = item
+        self._decoded[index] = 1
+        return item
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def drain(self):
+        """Returns an iterator that deserializes the items one at a time and
+        removes them from this list.
+
+        Neither the ``Data`` of an item nor the deserialized item is kept by
+        this list once the item is returned from the iterator. Hence, large
+        results can be processed with memory proportional to the unconsumed
+        items. The list is empty after this method is called.
+
+        Returns:
+            iterator: Iterator over the deserialized items.
+        """
+        items, decoded = self._list_data, self._decoded
+        self._list_data = []
+        self._decoded = bytearray()
+        return self._drain(items, decoded)
+
+    def to_list(self):
+        """Deserializes all the items and returns them in a new list.
+
+        Returns:
+            list: The deserialized items.
+        """
+        self._populate()
+        return list(self._list_data)
+
+    def to_columns(self):
+        """Deserializes all the items and returns them column by column.
+
+        For the lists of key-value tuples, returns the list of keys and the list of
+        values, which can be directly converted to NumPy arrays or data frame columns.
+        For the other lists, returns a tuple with a single list of the items.
+
+        Returns:
+            tuple[list]: The deserialized items, column by column.
+        """
+        self._populate()
+        if self._is_entry_list:
+            return tuple(list(column) for column in zip(*self._list_data))
+        return list(self._list_data),
 
     def __eq__(self, other):
-        if not isinstance(other, Iterable):
+        if not isinstance(other, (list, ImmutableLazyDataList)) or len(self) != len(other):
             return False
-        self._populate()
-        return self._list_obj == other
+        for index in range(len(self)):
+            if self[index] != other[index]:
+                return False
+        return True
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
     def _populate(self):
-        for index, data in enumerate(self._list_data):
-            if not self._list_obj[index]:
+        if all(self._decoded):
+            return
+        for index in range(len(self._list_data)):
+            if not self._decoded[index]:
                 self.__getitem__(index)
 
+    def _to_object(self, data):
+        if isinstance(data, tuple):
+            (key, value) = data
+            return self.to_object(key), self.to_object(value)
+        return self.to_object(data)
+
+    def _drain(self, items, decoded):
+        for index in range(len(items)):
+            item = items[index]
+            items[index] = None
+            if decoded[index]:
+                yield item
+            else:
+                yield self._to_object(item)
+
     def __repr__(self):
         self._populate()
-        return str(self._list_obj)
+        return str(self._list_data)
 
 
 # Serialization Utilities
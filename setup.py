@@ -14,8 +14,18 @@ stats_requirements = [
     'psutil',
 ]
 
+numpy_requirements = [
+    'numpy',
+]
+
+orjson_requirements = [
+    'orjson; python_version >= "3.6"',
+]
+
 extras = {
     'stats': stats_requirements,
+    'numpy': numpy_requirements,
+    'orjson': orjson_requirements,
 }
 
 setup(
@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from hazelcast.aggregator import count, distinct, double_avg, double_sum, fixed_point_sum, floating_point_sum, \
+    int_avg, int_sum, long_avg, long_sum, number_avg, max_, min_, AGGREGATOR_FACTORY_ID, _CanonicalizingHashSet
+from hazelcast.config import _Config
+from hazelcast.predicate import greater_or_equal, paging
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.input import _ObjectDataInput
+from hazelcast.serialization.data import DATA_OFFSET
+from tests.base import SingleMemberTestCase
+from tests.util import random_string
+from hazelcast.six.moves import range
+
+
+class AggregatorSerializationTest(TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(_Config())
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_aggregators_are_identified(self):
+        aggregators = [count, distinct, double_avg, double_sum, fixed_point_sum, floating_point_sum, int_avg,
+                       int_sum, long_avg, long_sum, max_, min_, number_avg]
+        class_ids = [4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]
+        for aggregator, class_id in zip(aggregators, class_ids):
+            data = self.service.to_data(aggregator("attribute"))
+            inp = _ObjectDataInput(data.to_bytes(), DATA_OFFSET, self.service)
+            self.assertTrue(inp.read_boolean())
+            self.assertEqual(AGGREGATOR_FACTORY_ID, inp.read_int())
+            self.assertEqual(class_id, inp.read_int())
+            self.assertEqual("attribute", inp.read_utf())
+
+    def test_aggregator_without_attribute_path(self):
+        data = self.service.to_data(count())
+        inp = _ObjectDataInput(data.to_bytes(), DATA_OFFSET + 9, self.service)
+        self.assertIsNone(inp.read_utf())
+        self.assertEqual(0, inp.read_long())
+
+    def test_distinct_values_are_read_as_set(self):
+        values = _CanonicalizingHashSet([1, "a", None])
+        result = self.service.to_object(self.service.to_data(values))
+        self.assertIsInstance(result, set)
+        self.assertEqual({1, "a", None}, result)
+
+    def test_str(self):
+        self.assertEqual("CountAggregator(attribute_path=None)", str(count()))
+        self.assertEqual("MaxAggregator(attribute_path=age)", str(max_("age")))
+
+
+class AggregatorTest(SingleMemberTestCase):
+    @classmethod
+    def configure_client(cls, config):
+        config["cluster_name"] = cls.cluster.id
+        return config
+
+    def setUp(self):
+        self.map = self.client.get_map(random_string()).blocking()
+        self.map.put_all({"key-%d" % i: i for i in range(50)})
+
+    def tearDown(self):
+        self.map.destroy()
+
+    def test_count(self):
+        self.assertEqual(50, self.map.aggregate(count()))
+
+    def test_count_with_predicate(self):
+        self.assertEqual(1, self.map.aggregate(count(), greater_or_equal("this", 49)))
+
+    def test_distinct(self):
+        self.map.put("key-50", 0)
+        self.assertEqual(set(range(50)), self.map.aggregate(distinct()))
+
+    def test_sums(self):
+        expected = sum(range(50))
+        self.assertEqual(expected, self.map.aggregate(int_sum()))
+        self.assertEqual(expected, self.map.aggregate(fixed_point_sum()))
+        self.assertEqual(expected, self.map.aggregate(floating_point_sum()))
+
+    def test_averages(self):
+        expected = sum(range(50)) / 50.0
+        self.assertEqual(expected, self.map.aggregate(int_avg()))
+        self.assertEqual(expected, self.map.aggregate(number_avg()))
+
+    def test_min_max(self):
+        self.assertEqual(0, self.map.aggregate(min_()))
+        self.assertEqual(49, self.map.aggregate(max_()))
+        self.assertEqual(10, self.map.aggregate(min_("this"), greater_or_equal("this", 10)))
+
+    def test_aggregate_with_paging_predicate(self):
+        with self.assertRaises(AssertionError):
+            self.map.aggregate(count(), paging(greater_or_equal("this", 10), 10))
@@ -7,8 +7,8 @@ from hazelcast.connection import _Reader
 from hazelcast.errors import _ErrorsCodec
 from hazelcast.protocol import ErrorHolder
 from hazelcast.protocol.builtin import CodecUtil, FixSizedTypesCodec, ByteArrayCodec, DataCodec, EntryListCodec, \
-    StringCodec, EntryListUUIDListIntegerCodec, EntryListUUIDLongCodec, ListMultiFrameCodec, ListIntegerCodec, \
-    ListLongCodec, ListUUIDCodec, MapCodec
+    StringCodec, EntryListUUIDListIntegerCodec, EntryListUUIDLongCodec, EntryListIntegerIntegerCodec, \
+    ListMultiFrameCodec, ListIntegerCodec, ListLongCodec, ListUUIDCodec, MapCodec
 from hazelcast.protocol.client_message import *
 from hazelcast.protocol.codec import client_authentication_codec
 from hazelcast.protocol.codec.custom.error_holder_codec import ErrorHolderCodec
@@ -164,6 +164,14 @@ class EncodeDecodeTest(unittest.TestCase):
         message.next_frame()  # initial frame
         self.assertEqual(entries, EntryListUUIDLongCodec.decode(message))
 
+    def test_integer_integer_entry_list(self):
+        self.mark_initial_frame_as_non_final()
+        entries = [(2147483647, -1), (0, 271), (-1, 42)]
+        EntryListIntegerIntegerCodec.encode(self.buf, entries, True)
+        message = self.write_and_decode()
+        message.next_frame()  # initial frame
+        self.assertEqual(entries, EntryListIntegerIntegerCodec.decode(message))
+
     def test_errors(self):
         self.mark_initial_frame_as_non_final()
         holder = ErrorHolder(-12345, "class", "message", [])
@@ -244,6 +252,98 @@ class EncodeDecodeTest(unittest.TestCase):
         self.assertIsNone(CodecUtil.decode_nullable(message, StringCodec.decode))
 
 
+class ReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.messages = []
+        self.reader = _Reader(_MessageCollector(self.messages), buffer_size=64)
+
+    def create_message(self, value):
+        buf = create_initial_buffer(50, 0, False)
+        StringCodec.encode(buf, value, True)
+        return buf
+
+    def receive(self, data, chunk_size):
+        # Like the reactor, asks for chunk_size bytes and receives what fits
+        offset = 0
+        while offset < len(data):
+            buf = self.reader.get_buffer(chunk_size)
+            chunk = data[offset:offset + len(buf)]
+            buf[:len(chunk)] = chunk
+            self.reader.buffer_updated(len(chunk))
+            offset += len(chunk)
+            self.reader.process()
+
+    def decode_values(self):
+        values = []
+        for message in self.messages:
+            message.next_frame()  # initial frame
+            values.append(StringCodec.decode(message))
+        return values
+
+    def test_messages_received_in_chunks(self):
+        values = [str(i) * i for i in range(1, 20)]
+        data = bytearray()
+        for value in values:
+            data.extend(self.create_message(value))
+
+        for chunk_size in (1, 7, 64, 1000):
+            del self.messages[:]
+            self.receive(data, chunk_size)
+            self.assertEqual(values, self.decode_values())
+            self.assertEqual(0, self.reader.length)
+
+    def test_frame_larger_than_buffer(self):
+        value = "x" * 1000
+        self.receive(self.create_message(value), 100)
+        self.assertEqual([value], self.decode_values())
+
+    def test_received_frames_are_not_overwritten(self):
+        values = ["a" * 30, "b" * 30, "c" * 30, "d" * 30]
+        for value in values:
+            # Read the frames after all of them are received
+            self.receive(self.create_message(value), 16)
+        self.assertEqual(values, self.decode_values())
+
+    @unittest.skipIf(six.PY2, "Frames are copied on Python 2")
+    def test_frames_are_views_of_the_buffer(self):
+        self.receive(self.create_message("value"), 64)
+        message = self.messages[0]
+        self.assertIsInstance(message.start_frame.buf, memoryview)
+        self.assertIsInstance(message.end_frame.buf, memoryview)
+
+    @unittest.skipIf(six.PY2, "Frames are copied on Python 2")
+    def test_free_tail_is_used_after_frames_are_handed_out(self):
+        self.reader = _Reader(_MessageCollector(self.messages), buffer_size=256)
+        message = self.create_message("a" * 20)
+        self.receive(message, 256)
+        self.assertIsInstance(self.messages[0].end_frame.buf, memoryview)
+        buf = self.reader._buf
+        self.assertEqual(256 - len(message), len(self.reader.get_buffer(256)))
+        self.assertIs(buf, self.reader._buf)
+
+    def test_small_frames_do_not_keep_the_buffer(self):
+        reader = _Reader(_MessageCollector(self.messages))
+        buf = reader._buf
+        message = self.create_message("value")
+        for _ in range(1000):
+            view = reader.get_buffer(128000)
+            view[:len(message)] = message
+            reader.buffer_updated(len(message))
+            reader.process()
+        self.assertEqual(["value"] * 1000, self.decode_values())
+        self.assertNotIsInstance(self.messages[0].end_frame.buf, memoryview)
+        # Reused in place, as no frame is handed out from it
+        self.assertIs(buf, reader._buf)
+
+
+class _MessageCollector(object):
+    def __init__(self, messages):
+        self._messages = messages
+
+    def on_message(self, message):
+        self._messages.append(message)
+
+
 class _MutableInteger(object):
     def __init__(self, initial_value):
         self.value = initial_value
@@ -296,7 +396,7 @@ class ClientMessageBuilderTest(unittest.TestCase):
         self.assertEqual(1, len(self.builder._fragmented_messages))
         fragmented_message = self.builder._fragmented_messages[fragmentation_id]
         self.assertIsNotNone(fragmented_message)
-        self.assertEqual("a", fragmented_message.end_frame.buf.decode("utf-8"))
+        self.assertEqual("a", bytes(fragmented_message.end_frame.buf).decode("utf-8"))
 
         self.reader.read(middle_buf)
         middle_message = self.reader._read_message()
@@ -305,7 +405,7 @@ class ClientMessageBuilderTest(unittest.TestCase):
         self.assertEqual(1, len(self.builder._fragmented_messages))
         fragmented_message = self.builder._fragmented_messages[fragmentation_id]
         self.assertIsNotNone(fragmented_message)
-        self.assertEqual("b", fragmented_message.end_frame.buf.decode("utf-8"))
+        self.assertEqual("b", bytes(fragmented_message.end_frame.buf).decode("utf-8"))
 
         self.reader.read(end_buf)
         end_message = self.reader._read_message()
@@ -1,10 +1,18 @@
+import functools
 import time
+import unittest
 
 from tests.base import HazelcastTestCase
 from hazelcast.client import HazelcastClient
 from hazelcast.lifecycle import LifecycleState
+from hazelcast.reactor import AsyncioReactor
 from tests.hzrc.ttypes import Lang
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class ClientTest(HazelcastTestCase):
     def test_client_only_listens(self):
@@ -103,3 +111,78 @@ class ClientLabelsTest(HazelcastTestCase):
         """ % str(client_uuid)
         return self.rc.executeOnController(self.cluster.id, script, Lang.JAVASCRIPT).result
 
+
+class ClientBackpressureStatsTest(HazelcastTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rc = cls.create_rc()
+        cls.cluster = cls.create_cluster(cls.rc)
+        cls.cluster.start_member()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.rc.terminateCluster(cls.cluster.id)
+        cls.rc.exit()
+
+    def tearDown(self):
+        self.shutdown_all_clients()
+
+    def test_counts_with_limits(self):
+        client = self.create_client({
+            "cluster_name": self.cluster.id,
+            "max_concurrent_invocations": 100,
+            "max_queued_write_bytes": 1 << 20,
+        })
+        m = client.get_map("backpressure-stats-map")
+        futures = [m.put(i, i) for i in range(50)]
+        self.assertLessEqual(client.get_in_flight_invocation_count(), 50)
+        for future in futures:
+            future.result()
+
+        self.assertEqual(0, client.get_in_flight_invocation_count())
+        self.assertEqual(0, client.get_queued_write_bytes())
+
+    def test_counts_without_limits(self):
+        client = self.create_client({
+            "cluster_name": self.cluster.id,
+        })
+        m = client.get_map("backpressure-stats-map")
+        m.put(1, 1).result()
+        self.assertEqual(0, client.get_in_flight_invocation_count())
+        self.assertEqual(0, client.get_queued_write_bytes())
+
+
+
+@unittest.skipIf(asyncio is None, "asyncio is not available")
+class AsyncioClientTest(HazelcastTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rc = cls.create_rc()
+        cls.cluster = cls.create_cluster(cls.rc)
+        cls.cluster.start_member()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.rc.terminateCluster(cls.cluster.id)
+        cls.rc.exit()
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_blocking(self, fn, *args, **kwargs):
+        # Blocking calls must not be made from the event loop thread
+        return self.loop.run_until_complete(self.loop.run_in_executor(None, functools.partial(fn, *args, **kwargs)))
+
+    def test_map_operations_are_awaitable(self):
+        client = self.run_blocking(HazelcastClient, cluster_name=self.cluster.id, event_loop=self.loop)
+        try:
+            self.assertIsInstance(client._reactor, AsyncioReactor)
+            m = self.run_blocking(client.get_map, "asyncio-map")
+            self.assertIsNone(self.loop.run_until_complete(m.put("key", "value")))
+            self.assertEqual("value", self.loop.run_until_complete(m.get("key")))
+            self.assertEqual(1, self.loop.run_until_complete(m.size()))
+        finally:
+            self.run_blocking(client.shutdown)
@@ -1,12 +1,20 @@
 import unittest
 
 from hazelcast.config import _Config, SSLProtocol, ReconnectMode, IntType, InMemoryFormat, EvictionPolicy,\
-    IndexConfig, IndexType, UniqueKeyTransformation, QueryConstants
+    IndexConfig, IndexType, UniqueKeyTransformation, QueryConstants, ReactorLoop, BackpressurePolicy
+from hazelcast.core import StandardJsonCodec
 from hazelcast.errors import InvalidConfigurationError
 from hazelcast.serialization.api import IdentifiedDataSerializable, Portable, StreamSerializer
+from hazelcast.serialization.compression import ZlibCodec
 from hazelcast.serialization.portable.classdef import ClassDefinition
+from hazelcast.six.moves import cPickle
 from hazelcast.util import RandomLB
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class ConfigTest(unittest.TestCase):
     def setUp(self):
@@ -442,6 +450,25 @@ class ConfigTest(unittest.TestCase):
         config.custom_serializers = serializers
         self.assertEqual(serializers, config.custom_serializers)
 
+    def test_pickle_protocol(self):
+        config = self.config
+        self.assertEqual(0, config.pickle_protocol)
+
+        with self.assertRaises(ValueError):
+            config.pickle_protocol = -1
+
+        with self.assertRaises(ValueError):
+            config.pickle_protocol = cPickle.HIGHEST_PROTOCOL + 1
+
+        with self.assertRaises(TypeError):
+            config.pickle_protocol = None
+
+        with self.assertRaises(TypeError):
+            config.pickle_protocol = True
+
+        config.pickle_protocol = 2
+        self.assertEqual(2, config.pickle_protocol)
+
     def test_near_caches_invalid_configs(self):
         config = self.config
         self.assertEqual({}, config.near_caches)
@@ -518,6 +545,76 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(20, nc_config.eviction_sampling_count)
         self.assertEqual(15, nc_config.eviction_sampling_pool_size)
 
+    def test_value_compression_invalid_configs(self):
+        config = self.config
+        self.assertEqual({}, config.value_compression)
+
+        invalid_configs = [
+            ({123: "123"}, TypeError),
+            ({"123": 123}, TypeError),
+            (None, TypeError),
+            ({"x": {"threshold": None}}, TypeError),
+            ({"x": {"threshold": -1}}, ValueError),
+            ({"x": {"codec": None}}, TypeError),
+            ({"x": {"codec": ZlibCodec}}, TypeError),
+            ({"x": {"invalid_option": -10}}, InvalidConfigurationError),
+        ]
+
+        for c, e in invalid_configs:
+            with self.assertRaises(e):
+                config.value_compression = c
+
+    def test_value_compression(self):
+        config = self.config
+        config.value_compression = {"a": {}}
+        self.assertEqual(16 * 1024, config.value_compression["a"].threshold)
+        self.assertIsNone(config.value_compression["a"].codec)
+
+        codec = ZlibCodec(9)
+        config.value_compression = {"a": {
+            "threshold": 100,
+            "codec": codec,
+        }}
+        compression_config = config.value_compression["a"]
+        self.assertEqual(100, compression_config.threshold)
+        self.assertIs(codec, compression_config.codec)
+
+    def test_key_caches_invalid_configs(self):
+        config = self.config
+        self.assertEqual({}, config.key_caches)
+
+        invalid_configs = [
+            ({123: "123"}, TypeError),
+            ({"123": 123}, TypeError),
+            (None, TypeError),
+            ({"x": {"max_size": None}}, TypeError),
+            ({"x": {"max_size": 0}}, ValueError),
+            ({"x": {"invalid_option": -10}}, InvalidConfigurationError),
+        ]
+
+        for c, e in invalid_configs:
+            with self.assertRaises(e):
+                config.key_caches = c
+
+    def test_key_caches(self):
+        config = self.config
+        config.key_caches = {"a": {}}
+        self.assertEqual(10000, config.key_caches["a"].max_size)
+
+        config.key_caches = {"a": {"max_size": 100}}
+        self.assertEqual(100, config.key_caches["a"].max_size)
+
+    def test_json_codec(self):
+        config = self.config
+        self.assertIsNone(config.json_codec)
+
+        with self.assertRaises(TypeError):
+            config.json_codec = None
+
+        codec = StandardJsonCodec()
+        config.json_codec = codec
+        self.assertIs(codec, config.json_codec)
+
     def test_load_balancer(self):
         config = self.config
         self.assertIsNone(config.load_balancer)
@@ -750,6 +847,93 @@ class ConfigTest(unittest.TestCase):
         config.fail_on_indeterminate_operation_state = True
         self.assertTrue(config.fail_on_indeterminate_operation_state)
 
+    @unittest.skipIf(asyncio is None, "asyncio is not available")
+    def test_event_loop(self):
+        config = self.config
+        self.assertIsNone(config.event_loop)
+
+        with self.assertRaises(TypeError):
+            config.event_loop = None
+
+        loop = asyncio.new_event_loop()
+        try:
+            config.event_loop = loop
+            self.assertIs(loop, config.event_loop)
+        finally:
+            loop.close()
+
+    def test_reactor_loop(self):
+        config = self.config
+        self.assertEqual(ReactorLoop.ASYNCORE, config.reactor_loop)
+
+        with self.assertRaises(TypeError):
+            config.reactor_loop = None
+
+        config.reactor_loop = ReactorLoop.SELECTORS
+        self.assertEqual(ReactorLoop.SELECTORS, config.reactor_loop)
+
+    def test_io_thread_count(self):
+        config = self.config
+        self.assertEqual(1, config.io_thread_count)
+
+        with self.assertRaises(ValueError):
+            config.io_thread_count = 0
+
+        with self.assertRaises(TypeError):
+            config.io_thread_count = None
+
+        config.io_thread_count = 4
+        self.assertEqual(4, config.io_thread_count)
+
+    def test_max_concurrent_invocations(self):
+        config = self.config
+        self.assertEqual(-1, config.max_concurrent_invocations)
+
+        with self.assertRaises(ValueError):
+            config.max_concurrent_invocations = 0
+
+        with self.assertRaises(TypeError):
+            config.max_concurrent_invocations = None
+
+        config.max_concurrent_invocations = 1000
+        self.assertEqual(1000, config.max_concurrent_invocations)
+
+    def test_max_queued_write_bytes(self):
+        config = self.config
+        self.assertEqual(-1, config.max_queued_write_bytes)
+
+        with self.assertRaises(ValueError):
+            config.max_queued_write_bytes = -2
+
+        with self.assertRaises(TypeError):
+            config.max_queued_write_bytes = 1.5
+
+        config.max_queued_write_bytes = 1 << 20
+        self.assertEqual(1 << 20, config.max_queued_write_bytes)
+
+    def test_backpressure_policy(self):
+        config = self.config
+        self.assertEqual(BackpressurePolicy.BLOCK, config.backpressure_policy)
+
+        with self.assertRaises(TypeError):
+            config.backpressure_policy = None
+
+        config.backpressure_policy = BackpressurePolicy.FAIL_FAST
+        self.assertEqual(BackpressurePolicy.FAIL_FAST, config.backpressure_policy)
+
+    def test_backpressure_timeout(self):
+        config = self.config
+        self.assertEqual(10.0, config.backpressure_timeout)
+
+        with self.assertRaises(ValueError):
+            config.backpressure_timeout = -1
+
+        with self.assertRaises(TypeError):
+            config.backpressure_timeout = None
+
+        config.backpressure_timeout = 0.5
+        self.assertEqual(0.5, config.backpressure_timeout)
+
 
 class IndexConfigTest(unittest.TestCase):
     def test_defaults(self):
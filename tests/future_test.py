@@ -7,6 +7,11 @@ from hazelcast.future import Future, ImmediateFuture, combine_futures, make_bloc
 from hazelcast import six
 from hazelcast.six.moves import range
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
 
 class FutureTest(unittest.TestCase):
     def test_set_result(self):
@@ -293,6 +298,41 @@ class FutureTest(unittest.TestCase):
         self.assertEqual(n.exception(), e)
 
 
+@unittest.skipIf(asyncio is None, "asyncio is not available")
+class AwaitableFutureTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_await_result_set_from_another_thread(self):
+        f = Future()
+        self.loop.call_soon(lambda: Thread(target=f.set_result, args=("done",)).start())
+        self.assertEqual("done", self.loop.run_until_complete(f))
+
+    def test_await_result_set_from_loop_thread(self):
+        f = Future()
+        self.loop.call_soon(f.set_result, "done")
+        self.assertEqual("done", self.loop.run_until_complete(f))
+
+    def test_await_none_result(self):
+        f = Future()
+        self.loop.call_soon(f.set_result, None)
+        self.assertIsNone(self.loop.run_until_complete(f))
+
+    def test_await_exception(self):
+        f = Future()
+        self.loop.call_soon(f.set_exception, RuntimeError("error"))
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(f)
+
+    def test_await_completed_futures(self):
+        self.assertEqual("done", self.loop.run_until_complete(ImmediateFuture("done")))
+        with self.assertRaises(RuntimeError):
+            self.loop.run_until_complete(ImmediateExceptionFuture(RuntimeError("error")))
+
+
 class ImmediateFutureTest(unittest.TestCase):
     f = None
 
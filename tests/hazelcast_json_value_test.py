@@ -1,11 +1,29 @@
 import json
+import unittest
 
-from hazelcast.core import HazelcastJsonValue
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.core import HazelcastJsonValue, JsonCodec, StandardJsonCodec, OrjsonCodec, orjson
 from hazelcast.predicate import greater, equal
+from hazelcast.serialization import SerializationServiceV1
 from tests.base import SingleMemberTestCase
 from unittest import TestCase
 
 
+class _CountingCodec(StandardJsonCodec):
+    def __init__(self):
+        self.dumps_count = 0
+        self.loads_count = 0
+
+    def dumps(self, obj):
+        self.dumps_count += 1
+        return super(_CountingCodec, self).dumps(obj)
+
+    def loads(self, buf):
+        self.loads_count += 1
+        return super(_CountingCodec, self).loads(buf)
+
+
 class HazelcastJsonValueTest(TestCase):
     @classmethod
     def setUpClass(cls):
@@ -37,6 +55,58 @@ class HazelcastJsonValueTest(TestCase):
         self.assertEqual(self.json_obj, json_value.loads())
 
 
+    def test_hazelcast_json_value_construction_with_bytes(self):
+        json_bytes = six.u('{"key": "\u00e7"}').encode("utf-8")
+        json_value = HazelcastJsonValue(bytearray(json_bytes))
+        self.assertEqual(six.u('{"key": "\u00e7"}'), json_value.to_string())
+        self.assertEqual({"key": six.u("\u00e7")}, json_value.loads())
+        self.assertEqual(HazelcastJsonValue(six.u('{"key": "\u00e7"}')), json_value)
+        self.assertEqual(HazelcastJsonValue(json_bytes), json_value)
+        self.assertNotEqual(HazelcastJsonValue(self.json_str), json_value)
+
+    def test_hazelcast_json_value_is_parsed_once(self):
+        codec = _CountingCodec()
+        json_value = HazelcastJsonValue(self.json_str, codec)
+        self.assertEqual(0, codec.loads_count)
+        self.assertIs(json_value.loads(), json_value.loads())
+        self.assertEqual(1, codec.loads_count)
+
+    def test_hazelcast_json_value_construction_with_codec(self):
+        codec = _CountingCodec()
+        json_value = HazelcastJsonValue(self.json_obj, codec)
+        self.assertEqual(1, codec.dumps_count)
+        self.assertEqual(json.dumps(self.json_obj), json_value.to_string())
+
+    def test_json_codec_must_be_implemented(self):
+        codec = JsonCodec()
+        with self.assertRaises(NotImplementedError):
+            codec.dumps(self.json_obj)
+        with self.assertRaises(NotImplementedError):
+            codec.loads(self.json_str)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_codec(self):
+        codec = OrjsonCodec()
+        json_value = HazelcastJsonValue(self.json_obj, codec)
+        self.assertEqual(self.json_obj, json.loads(json_value.to_string()))
+        self.assertEqual(self.json_obj, HazelcastJsonValue(self.json_str, codec).loads())
+
+    def test_serialization_passes_bytes_through(self):
+        codec = _CountingCodec()
+        config = _Config()
+        config.json_codec = codec
+        service = SerializationServiceV1(config)
+        data = service.to_data(HazelcastJsonValue(self.json_str))
+        # JSON strings are written in the same format as the strings
+        self.assertEqual(service.to_data(self.json_str).to_bytes()[8:], data.to_bytes()[8:])
+
+        json_value = service.to_object(data)
+        self.assertEqual(data, service.to_data(json_value))
+        self.assertEqual(0, codec.loads_count)
+        self.assertEqual(self.json_obj, json_value.loads())
+        self.assertEqual(1, codec.loads_count)
+
+
 class HazelcastJsonValueWithMapTest(SingleMemberTestCase):
     @classmethod
     def setUpClass(cls):
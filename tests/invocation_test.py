@@ -1,11 +1,14 @@
+import threading
 import time
 import unittest
 
-from mock import MagicMock
+from mock import MagicMock, ANY
 
 import hazelcast
-from hazelcast.config import _Config
-from hazelcast.errors import IndeterminateOperationStateError, OperationTimeoutError
+from hazelcast.config import _Config, BackpressurePolicy
+from hazelcast.errors import IndeterminateOperationStateError, OperationTimeoutError, TargetDisconnectedError, \
+    HazelcastOverloadError
+from hazelcast.future import Future
 from hazelcast.invocation import Invocation, InvocationService
 from hazelcast.protocol.client_message import OutboundMessage
 from hazelcast.serialization import LE_INT
@@ -22,7 +25,7 @@ class InvocationTest(unittest.TestCase):
 
     def test_smart_mode_and_enabled_backups(self):
         client, service = self._start_service()
-        self.assertIsNotNone(service._clean_resources_timer)
+        client._reactor.add_timer.assert_not_called()  # No periodic scans of the pending invocations
         listener_service = client._listener_service
         listener_service.register_listener.assert_called_once()
 
@@ -30,7 +33,7 @@ class InvocationTest(unittest.TestCase):
         config = _Config()
         config.backup_ack_to_client_enabled = False
         client, service = self._start_service(config)
-        self.assertIsNotNone(service._clean_resources_timer)
+        client._reactor.add_timer.assert_not_called()  # No periodic scans of the pending invocations
         listener_service = client._listener_service
         listener_service.register_listener.assert_not_called()
 
@@ -38,7 +41,7 @@ class InvocationTest(unittest.TestCase):
         config = _Config()
         config.smart_routing = False
         client, service = self._start_service(config)
-        self.assertIsNotNone(service._clean_resources_timer)
+        client._reactor.add_timer.assert_not_called()  # No periodic scans of the pending invocations
         listener_service = client._listener_service
         listener_service.register_listener.assert_not_called()
 
@@ -47,7 +50,7 @@ class InvocationTest(unittest.TestCase):
         config.smart_routing = False
         config.backup_ack_to_client_enabled = False
         client, service = self._start_service(config)
-        self.assertIsNotNone(service._clean_resources_timer)
+        client._reactor.add_timer.assert_not_called()  # No periodic scans of the pending invocations
         listener_service = client._listener_service
         listener_service.register_listener.assert_not_called()
 
@@ -57,7 +60,7 @@ class InvocationTest(unittest.TestCase):
         response.get_number_of_backup_acks = MagicMock(return_value=0)
         invocation = MagicMock(backup_acks_received=0)
         service._notify(invocation, response)
-        invocation.set_response.assert_called_once_with(response)
+        invocation.resolve.assert_called_once_with(response)
 
     def test_notify_with_expected_backups(self):
         _, service = self._start_service()
@@ -65,7 +68,7 @@ class InvocationTest(unittest.TestCase):
         response.get_number_of_backup_acks = MagicMock(return_value=1)
         invocation = MagicMock(backup_acks_received=0)
         service._notify(invocation, response)
-        invocation.set_response.assert_not_called()
+        invocation.resolve.assert_not_called()
         self.assertTrue(invocation.pending_response_received_time > 0)
         self.assertEqual(1, invocation.backup_acks_expected)
         self.assertEqual(response, invocation.pending_response)
@@ -76,20 +79,20 @@ class InvocationTest(unittest.TestCase):
         response.get_number_of_backup_acks = MagicMock(return_value=1)
         invocation = MagicMock(backup_acks_received=1)
         service._notify(invocation, response)
-        invocation.set_response.assert_called_once_with(response)
+        invocation.resolve.assert_called_once_with(response)
 
     def test_notify_backup_complete_with_no_pending_response(self):
         _, service = self._start_service()
         invocation = MagicMock(backup_acks_received=0)
         service._notify_backup_complete(invocation)
-        invocation.set_response.assert_not_called()
+        invocation.resolve.assert_not_called()
         self.assertEqual(1, invocation.backup_acks_received)
 
     def test_notify_backup_complete_with_pending_acks(self):
         _, service = self._start_service()
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=3, pending_response="x")
         service._notify_backup_complete(invocation)
-        invocation.set_response.assert_not_called()
+        invocation.resolve.assert_not_called()
         self.assertEqual(2, invocation.backup_acks_received)
 
     def test_notify_backup_complete_when_all_acks_are_received(self):
@@ -97,21 +100,21 @@ class InvocationTest(unittest.TestCase):
         message = "x"
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=2, pending_response=message)
         service._notify_backup_complete(invocation)
-        invocation.set_response.assert_called_once_with(message)
+        invocation.resolve.assert_called_once_with(message)
         self.assertEqual(2, invocation.backup_acks_received)
 
     def test_backup_handler_when_all_acks_are_received(self):
         _, service = self._start_service()
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=1, pending_response="x")
         service._detect_and_handle_backup_timeout(invocation, 0)
-        invocation.set_response.assert_not_called()
+        invocation.resolve.assert_not_called()
 
     def test_backup_handler_when_all_acks_are_not_received_and_not_reached_timeout(self):
         _, service = self._start_service()
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=2, pending_response="x",
                                pending_response_received_time=40)
         service._detect_and_handle_backup_timeout(invocation, 1)  # expiration_time = 40 + 5 > 1
-        invocation.set_response.assert_not_called()
+        invocation.resolve.assert_not_called()
 
     def test_backup_handler_when_all_acks_are_not_received_and_reached_timeout(self):
         _, service = self._start_service()
@@ -119,7 +122,7 @@ class InvocationTest(unittest.TestCase):
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=2, pending_response=message,
                                pending_response_received_time=40)
         service._detect_and_handle_backup_timeout(invocation, 46)  # expiration_time = 40 + 5 < 46
-        invocation.set_response.assert_called_once_with(message)
+        invocation.resolve.assert_called_once_with(message)
 
     def test_backup_handler_when_all_acks_are_not_received_and_reached_timeout_with_fail_on_indeterminate_state(self):
         _, service = self._start_service()
@@ -127,9 +130,301 @@ class InvocationTest(unittest.TestCase):
         invocation = MagicMock(backup_acks_received=1, backup_acks_expected=2, pending_response="x",
                                pending_response_received_time=40)
         service._detect_and_handle_backup_timeout(invocation, 46)  # expiration_time = 40 + 5 < 46
-        invocation.set_response.assert_not_called()
-        invocation.set_exception.assert_called_once()
-        self.assertIsInstance(invocation.set_exception.call_args[0][0], IndeterminateOperationStateError)
+        invocation.resolve.assert_not_called()
+        invocation.reject.assert_called_once()
+        self.assertIsInstance(invocation.reject.call_args[0][0], IndeterminateOperationStateError)
+
+    def test_deadline_is_scheduled(self):
+        client, service = self._start_service()
+        service._do_invoke = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        service.invoke(invocation)
+        client._reactor.add_timer.assert_called_with(120, ANY)
+        self.assertIs(client._reactor.add_timer.return_value, invocation.deadline_timer)
+
+    def test_deadline_is_scheduled_with_invocation_timeout(self):
+        client, service = self._start_service()
+        service._do_invoke = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), timeout=0.5)
+        start = time.time()
+        service.invoke(invocation)
+        client._reactor.add_timer.assert_called_with(0.5, ANY)
+        self.assertTrue(start + 0.5 <= invocation.timeout <= time.time() + 0.5)
+
+    def test_deadline_is_not_scheduled_with_infinite_timeout(self):
+        client, service = self._start_service()
+        service._do_invoke = MagicMock()
+        client._reactor.add_timer.reset_mock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), timeout=float("inf"))
+        service.invoke(invocation)
+        client._reactor.add_timer.assert_not_called()
+        self.assertIsNone(invocation.deadline_timer)
+
+    def test_notify_deadline(self):
+        _, service = self._start_service()
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        invocation.deadline_timer = MagicMock()
+        service._notify_deadline(invocation, 1)
+        with self.assertRaises(OperationTimeoutError):
+            invocation.future.result()
+
+        # The response received after the deadline is ignored
+        invocation.set_response(MagicMock())
+        self.assertIsInstance(invocation.future.exception(), OperationTimeoutError)
+
+    def test_notify_deadline_when_waiting_for_backups(self):
+        _, service = self._start_service()
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        invocation.pending_response = MagicMock()
+        service._notify_deadline(invocation, 1)
+        self.assertFalse(invocation.future.done())
+
+    def test_deadline_is_canceled_on_completion(self):
+        _, service = self._start_service()
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        invocation.deadline_timer = MagicMock()
+        service._complete(invocation, MagicMock())
+        invocation.deadline_timer.cancel.assert_called_once()
+        self.assertTrue(invocation.future.done())
+
+    def test_deadline_during_response_handling(self):
+        _, service = self._start_service()
+
+        def handler(message):
+            # The deadline fires on the timer thread while the response is handled
+            service._notify_deadline(invocation, 1)
+            return "result"
+
+        invocation = Invocation(OutboundMessage(bytearray(22), False), response_handler=handler)
+        callback = MagicMock()
+        invocation.future.add_done_callback(callback)
+        service._complete(invocation, MagicMock())
+        self.assertEqual("result", invocation.future.result())
+        callback.assert_called_once()
+
+    def test_response_after_error_is_ignored(self):
+        _, service = self._start_service()
+        handler = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), response_handler=handler)
+        invocation.deadline_timer = MagicMock()
+        service._complete_with_error(invocation, ValueError())
+        service._complete(invocation, MagicMock())
+        handler.assert_not_called()
+        invocation.deadline_timer.cancel.assert_called_once()
+        self.assertIsInstance(invocation.future.exception(), ValueError)
+
+    def test_claim_completion(self):
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        self.assertTrue(invocation.claim_completion())
+        self.assertFalse(invocation.claim_completion())
+        invocation.set_exception(ValueError())
+        self.assertFalse(invocation.future.done())
+
+    def test_retry_after_deadline(self):
+        _, service = self._start_service()
+        service._do_invoke = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        service._notify_deadline(invocation, 1)
+        service._retry(invocation)
+        service._do_invoke.assert_not_called()
+
+    def test_connection_close_notifies_sent_invocations(self):
+        _, service = self._start_service()
+        closed_connection = MagicMock(close_reason="reason")
+        other_connection = MagicMock()
+        closed_invocation = Invocation(OutboundMessage(bytearray(22), False), connection=closed_connection)
+        other_invocation = Invocation(OutboundMessage(bytearray(22), False), connection=other_connection)
+        service.invoke(closed_invocation)
+        service.invoke(other_invocation)
+
+        service.on_connection_close(closed_connection)
+        self.assertIsInstance(closed_invocation.future.exception(), TargetDisconnectedError)
+        self.assertFalse(other_invocation.future.done())
+        self.assertEqual([other_invocation], list(service._pending.values()))
+        self.assertNotIn(closed_connection, service._connection_invocations)
+
+    def test_completed_invocation_is_removed_from_connection_index(self):
+        _, service = self._start_service()
+        connection = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=connection)
+        service.invoke(invocation)
+        self.assertEqual(1, len(service._connection_invocations[connection]))
+
+        service._complete(invocation, MagicMock())
+        self.assertEqual(0, len(service._connection_invocations[connection]))
+        self.assertIsNone(invocation.sent_connection)
+
+    def test_invocation_is_not_indexed_when_send_fails(self):
+        _, service = self._start_service()
+        connection = MagicMock(live=False)
+        connection.send_message.return_value = False
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=connection)
+        service.invoke(invocation)
+        self.assertIsInstance(invocation.future.exception(), IOError)
+        self.assertNotIn(connection, service._connection_invocations)
+
+    def test_backup_timeout_is_scheduled(self):
+        client, service = self._start_service()
+        response = MagicMock()
+        response.get_number_of_backup_acks = MagicMock(return_value=1)
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        service._notify(invocation, response)
+        client._reactor.add_timer.assert_called_once_with(service._backup_timeout, ANY)
+        self.assertFalse(invocation.future.done())
+
+        # Run the backup timeout handler, as if the timeout has passed
+        invocation.pending_response_received_time -= service._backup_timeout
+        client._reactor.add_timer.call_args[0][1]()
+        self.assertTrue(invocation.future.done())
+
+    def test_backup_timer_is_canceled_when_all_acks_are_received(self):
+        _, service = self._start_service()
+        response = MagicMock()
+        response.get_number_of_backup_acks = MagicMock(return_value=1)
+        invocation = Invocation(OutboundMessage(bytearray(22), False))
+        service._notify(invocation, response)
+        service._notify_backup_complete(invocation)
+        self.assertTrue(invocation.future.done())
+        invocation.backup_timer.cancel.assert_called_once()
+
+    def test_in_flight_count(self):
+        _, service = self._start_service()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        service.invoke(invocation)
+        self.assertEqual(1, service.in_flight_count)
+
+        service._complete(invocation, MagicMock())
+        service._complete_with_error(invocation, ValueError())  # Completing again has no effect
+        self.assertEqual(0, service.in_flight_count)
+
+    def test_in_flight_slots_are_not_taken_without_limit(self):
+        _, service = self._start_service()
+        service._in_flight_condition = MagicMock()
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        service.invoke(invocation)
+        self.assertFalse(invocation.in_flight)
+        self.assertEqual(1, service.in_flight_count)
+        service._complete(invocation, MagicMock())
+        self.assertEqual(0, service.in_flight_count)
+        service._in_flight_condition.__enter__.assert_not_called()
+
+    def test_max_concurrent_invocations_with_fail_fast(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        config.backpressure_policy = BackpressurePolicy.FAIL_FAST
+        _, service = self._start_service(config)
+        first = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        second = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        service.invoke(first)
+        service.invoke(second)
+        self.assertFalse(first.future.done())
+        self.assertIsInstance(second.future.exception(), HazelcastOverloadError)
+        self.assertEqual(1, service.in_flight_count)
+
+        # Urgent invocations are not held back
+        urgent = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock(), urgent=True)
+        service.invoke(urgent)
+        self.assertFalse(urgent.future.done())
+        self.assertEqual(2, service.in_flight_count)
+
+    def test_max_concurrent_invocations_with_wait_with_timeout(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        config.backpressure_policy = BackpressurePolicy.WAIT_WITH_TIMEOUT
+        config.backpressure_timeout = 0.2
+        _, service = self._start_service(config)
+        service.invoke(Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock()))
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        start = time.time()
+        service.invoke(invocation)
+        self.assertGreaterEqual(time.time() - start, 0.2)
+        self.assertIsInstance(invocation.future.exception(), HazelcastOverloadError)
+
+    def test_max_concurrent_invocations_with_block(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        _, service = self._start_service(config)
+        first = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        service.invoke(first)
+
+        completer = threading.Timer(0.2, lambda: service._complete(first, MagicMock()))
+        completer.start()
+        try:
+            second = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+            service.invoke(second)
+            # Invoked only after the first one is completed
+            self.assertTrue(first.future.done())
+            self.assertFalse(second.future.done())
+            self.assertEqual(1, service.in_flight_count)
+        finally:
+            completer.join()
+
+    def test_max_queued_write_bytes_with_fail_fast(self):
+        config = _Config()
+        config.max_queued_write_bytes = 100
+        config.backpressure_policy = BackpressurePolicy.FAIL_FAST
+        _, service = self._start_service(config)
+        connection = MagicMock(queued_write_bytes=100)
+        connection.wait_for_write_capacity.return_value = False
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=connection)
+        service.invoke(invocation)
+        connection.wait_for_write_capacity.assert_called_once_with(100, 0)
+        connection.send_message.assert_not_called()
+        self.assertIsInstance(invocation.future.exception(), HazelcastOverloadError)
+        self.assertEqual(0, service.in_flight_count)
+
+    def test_max_queued_write_bytes_with_capacity(self):
+        config = _Config()
+        config.max_queued_write_bytes = 100
+        _, service = self._start_service(config)
+        connection = MagicMock(queued_write_bytes=99)
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=connection)
+        service.invoke(invocation)
+        connection.wait_for_write_capacity.assert_not_called()
+        connection.send_message.assert_called_once()
+
+    def test_max_concurrent_invocations_on_asyncio_loop_thread(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        _, service = self._start_service(config)
+        service.invoke(Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock()))
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        self._invoke_from_reactor_thread(service, invocation, True)
+        # Fails instead of blocking the event loop with the BLOCK policy
+        self.assertIsInstance(invocation.future.exception(), HazelcastOverloadError)
+        self.assertEqual(1, service.in_flight_count)
+
+    def test_max_queued_write_bytes_on_asyncio_loop_thread(self):
+        config = _Config()
+        config.max_queued_write_bytes = 100
+        _, service = self._start_service(config)
+        connection = MagicMock(queued_write_bytes=100)
+        connection.wait_for_write_capacity.return_value = False
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=connection)
+        self._invoke_from_reactor_thread(service, invocation, True)
+        connection.wait_for_write_capacity.assert_called_once_with(100, 0)
+        self.assertIsInstance(invocation.future.exception(), HazelcastOverloadError)
+
+    def test_backpressure_on_reactor_thread_is_skipped(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        _, service = self._start_service(config)
+        service.invoke(Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock()))
+        invocation = Invocation(OutboundMessage(bytearray(22), False), connection=MagicMock())
+        self._invoke_from_reactor_thread(service, invocation, False)
+        self.assertFalse(invocation.future.done())
+        self.assertEqual(2, service.in_flight_count)
+
+    @staticmethod
+    def _invoke_from_reactor_thread(service, invocation, is_asyncio_loop_thread):
+        def invoke():
+            Future._threading_locals.is_reactor_thread = True
+            Future._threading_locals.is_asyncio_loop_thread = is_asyncio_loop_thread
+            service.invoke(invocation)
+
+        thread = threading.Thread(target=invoke)
+        thread.start()
+        thread.join()
 
     def _start_service(self, config=_Config()):
         c = MagicMock(config=config)
@@ -179,7 +474,7 @@ class InvocationTimeoutTest(HazelcastTestCase):
         with self.assertRaises(OperationTimeoutError):
             invocation.future.result()
 
-    def test_invocation_not_timed_out_when_there_is_no_exception(self):
+    def test_invocation_timed_out_when_there_is_no_response(self):
         buf = bytearray(22)
         LE_INT.pack_into(buf, 0, 22)
         request = OutboundMessage(buf, True)
@@ -187,6 +482,18 @@ class InvocationTimeoutTest(HazelcastTestCase):
         invocation = Invocation(request)
         invocation_service.invoke(invocation)
 
+        with self.assertRaises(OperationTimeoutError):
+            invocation.future.result()
+        self.assertEqual(0, len(invocation_service._pending))
+
+    def test_invocation_with_infinite_timeout_not_timed_out_when_there_is_no_response(self):
+        buf = bytearray(22)
+        LE_INT.pack_into(buf, 0, 22)
+        request = OutboundMessage(buf, True)
+        invocation_service = self.client._invocation_service
+        invocation = Invocation(request, timeout=float("inf"))
+        invocation_service.invoke(invocation)
+
         time.sleep(2)
         self.assertFalse(invocation.future.done())
         self.assertEqual(1, len(invocation_service._pending))
@@ -4,6 +4,7 @@ from time import sleep
 from hazelcast.config import _Config
 from hazelcast.near_cache import *
 from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.data import Data
 from hazelcast.six.moves import range
 
 
@@ -32,6 +33,18 @@ class NearCacheTestCase(unittest.TestCase):
         near_cache[key_data] = "value"
         self.assertEqual("value", near_cache[key_data])
 
+    def test_put_data_backed_by_view(self):
+        near_cache = self.create_near_cache(self.service, InMemoryFormat.BINARY, 1000, 1000, EvictionPolicy.LRU, 1000)
+        key_data = self.service.to_data("key")
+        receive_buffer = bytearray(256)
+        value_bytes = self.service.to_data("value").to_bytes()
+        receive_buffer[10:10 + len(value_bytes)] = value_bytes
+        near_cache[key_data] = Data(memoryview(receive_buffer)[10:10 + len(value_bytes)])
+        # Overwriting the buffer must not change the cached value
+        receive_buffer[:] = bytearray(256)
+        self.assertEqual("value", self.service.to_object(near_cache[key_data]))
+        self.assertNotIsInstance(near_cache.get(key_data).value.to_bytes(), memoryview)
+
     def test_put_get(self):
         near_cache = self.create_near_cache(self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.LRU, 1000)
         for i in range(0, 10000):
@@ -131,6 +144,60 @@ class NearCacheTestCase(unittest.TestCase):
         self.assertEqual(expire, 0)
         self.assertGreaterEqual(evict, 1000)
 
+    def test_LFU_evicts_least_frequently_used(self):
+        near_cache = self.create_near_cache(self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.LFU, 3)
+        near_cache["key-0"] = "value-0"
+        near_cache["key-1"] = "value-1"
+        near_cache["key-2"] = "value-2"
+        for _ in range(3):
+            near_cache["key-0"]
+        near_cache["key-1"]
+        near_cache["key-3"] = "value-3"
+        self.assertNotIn("key-2", near_cache)
+        near_cache["key-4"] = "value-4"
+        self.assertNotIn("key-3", near_cache)
+        self.assertEqual("value-0", near_cache["key-0"])
+        self.assertEqual("value-1", near_cache["key-1"])
+        self.assertEqual(2, near_cache.get_statistics()["evictions"])
+
+    def test_RANDOM_eviction(self):
+        near_cache = self.create_near_cache(self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.RANDOM, 100)
+        for i in range(0, 1000):
+            key = "key-{}".format(i)
+            value = "value-{}".format(i)
+            near_cache[key] = value
+            self.assertEqual(value, near_cache[key])
+        self.assertEqual(100, len(near_cache))
+        self.assertEqual(900, near_cache.get_statistics()["evictions"])
+
+    def test_eviction_after_invalidation_and_clear(self):
+        for policy in (EvictionPolicy.LRU, EvictionPolicy.LFU, EvictionPolicy.RANDOM):
+            near_cache = self.create_near_cache(self.service, InMemoryFormat.OBJECT, 1000, 1000, policy, 10)
+            for i in range(0, 10):
+                near_cache["key-{}".format(i)] = "value"
+            for i in range(0, 10, 2):
+                near_cache._invalidate("key-{}".format(i))
+            for i in range(10, 20):
+                near_cache["key-{}".format(i)] = "value"
+            self.assertEqual(10, len(near_cache))
+            self.assertEqual(5, near_cache.get_statistics()["evictions"])
+
+            near_cache._clear()
+            for i in range(0, 10):
+                near_cache["key-{}".format(i)] = "value"
+            self.assertEqual(10, len(near_cache))
+            self.assertEqual(5, near_cache.get_statistics()["evictions"])
+
+    def test_update_does_not_leave_stale_eviction_candidates(self):
+        near_cache = self.create_near_cache(self.service, InMemoryFormat.OBJECT, 1000, 1000, EvictionPolicy.LRU, 2)
+        near_cache["key-0"] = "value-0"
+        near_cache["key-1"] = "value-1"
+        near_cache["key-0"] = "new-value-0"  # evicts key-0 as it is the least recently used
+        near_cache["key-2"] = "value-2"  # evicts key-1
+        self.assertEqual("new-value-0", near_cache["key-0"])
+        self.assertEqual("value-2", near_cache["key-2"])
+        self.assertEqual(2, len(near_cache))
+
     def create_near_cache(self, service, im_format, ttl, max_idle, policy, max_size, eviction_sampling_count=None,
                           eviction_sampling_pool_size=None):
         return NearCache("default", service, im_format, ttl, max_idle, True, policy, max_size, eviction_sampling_count,
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from hazelcast.config import _Config
+from hazelcast.predicate import greater_or_equal, paging
+from hazelcast.projection import single_attribute, multi_attribute, PROJECTION_FACTORY_ID
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.input import _ObjectDataInput
+from hazelcast.serialization.data import DATA_OFFSET
+from hazelcast.util import ImmutableLazyDataList
+from tests.base import SingleMemberTestCase
+from tests.util import random_string
+from hazelcast.six.moves import range
+
+
+class ProjectionSerializationTest(TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(_Config())
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def _read_header(self, projection, class_id):
+        data = self.service.to_data(projection)
+        inp = _ObjectDataInput(data.to_bytes(), DATA_OFFSET, self.service)
+        self.assertTrue(inp.read_boolean())
+        self.assertEqual(PROJECTION_FACTORY_ID, inp.read_int())
+        self.assertEqual(class_id, inp.read_int())
+        return inp
+
+    def test_single_attribute(self):
+        inp = self._read_header(single_attribute("name"), 0)
+        self.assertEqual("name", inp.read_utf())
+
+    def test_multi_attribute(self):
+        inp = self._read_header(multi_attribute("name", "age"), 1)
+        self.assertEqual(["name", "age"], inp.read_utf_array())
+
+    def test_invalid_attribute_paths(self):
+        with self.assertRaises(AssertionError):
+            single_attribute("")
+        with self.assertRaises(AssertionError):
+            single_attribute("children[any].age")
+        with self.assertRaises(AssertionError):
+            multi_attribute()
+        with self.assertRaises(AssertionError):
+            multi_attribute("name", "")
+
+    def test_str(self):
+        self.assertEqual("SingleAttributeProjection(attribute_path=age)", str(single_attribute("age")))
+        self.assertEqual("MultiAttributeProjection(attribute_paths=name, age)", str(multi_attribute("name", "age")))
+
+
+class ProjectionTest(SingleMemberTestCase):
+    @classmethod
+    def configure_client(cls, config):
+        config["cluster_name"] = cls.cluster.id
+        return config
+
+    def setUp(self):
+        self.map = self.client.get_map(random_string()).blocking()
+        self.map.put_all({"key-%d" % i: i for i in range(50)})
+
+    def tearDown(self):
+        self.map.destroy()
+
+    def test_single_attribute(self):
+        result = self.map.project(single_attribute("this"))
+        self.assertIsInstance(result, ImmutableLazyDataList)
+        self.assertEqual(list(range(50)), sorted(result))
+
+    def test_single_attribute_with_predicate(self):
+        result = self.map.project(single_attribute("__key"), greater_or_equal("this", 48))
+        self.assertEqual(["key-48", "key-49"], sorted(result))
+
+    def test_multi_attribute(self):
+        result = self.map.project(multi_attribute("__key", "this"), greater_or_equal("this", 48))
+        self.assertEqual([["key-48", 48], ["key-49", 49]], sorted(result))
+
+    def test_project_with_paging_predicate(self):
+        with self.assertRaises(AssertionError):
+            self.map.project(single_attribute("this"), paging(greater_or_equal("this", 10), 10))
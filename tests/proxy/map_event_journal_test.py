@@ -0,0 +1,231 @@
+import os
+import struct
+import threading
+from unittest import TestCase
+
+from hazelcast.config import _Config
+from hazelcast.errors import HazelcastSerializationError, StaleSequenceError
+from hazelcast.future import Future, ImmediateFuture
+from hazelcast.proxy.base import EntryEventType
+from hazelcast.proxy.event_journal import EventJournalReader, EventJournalInitialSubscriberState, \
+    EventJournalReadResult, _to_event_journal_map_event
+from hazelcast.proxy.map import Map
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.serialization.data import Data
+from tests.base import SingleMemberTestCase
+from tests.util import random_string, MockProxyContext
+from hazelcast.six.moves import range
+
+
+def _data_bytes(data):
+    if data is None:
+        return struct.pack(">i", -1)
+    buff = bytes(data.to_bytes())
+    return struct.pack(">i", len(buff)) + buff
+
+
+def _event_data(service, event_type, key, new_value, old_value, factory_id=-10):
+    buff = struct.pack(">ii?iii", 0, -2, True, factory_id, 1, event_type)
+    for value in (key, new_value, old_value):
+        buff += _data_bytes(service.to_data(value))
+    return Data(bytearray(buff))
+
+
+class _FakeMap(object):
+    def __init__(self, oldest_sequence=0, newest_sequence=-1):
+        self.state = EventJournalInitialSubscriberState(oldest_sequence, newest_sequence)
+        self.reads = {}
+
+    def subscribe_to_event_journal(self, partition_id):
+        return ImmediateFuture(self.state)
+
+    def read_from_event_journal(self, start_sequence, min_size, max_size, partition_id, predicate, projection):
+        future = Future()
+        self.reads.setdefault(partition_id, []).append((start_sequence, future))
+        return future
+
+    def complete(self, partition_id, items):
+        start_sequence, future = self.reads[partition_id][-1]
+        item_seqs = list(range(start_sequence, start_sequence + len(items)))
+        future.set_result(EventJournalReadResult(len(items), items, item_seqs, start_sequence + len(items)))
+
+
+class EventJournalMapEventTest(TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(_Config())
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_read_event(self):
+        data = _event_data(self.service, EntryEventType.UPDATED, "key", "new", "old")
+        event = _to_event_journal_map_event(self.service.to_object, True, data)
+        self.assertEqual(EntryEventType.UPDATED, event.event_type)
+        self.assertEqual("key", event.key)
+        self.assertEqual("new", event.new_value)
+        self.assertEqual("old", event.old_value)
+
+    def test_read_event_with_null_values(self):
+        data = _event_data(self.service, EntryEventType.ADDED, "key", "new", None)
+        event = _to_event_journal_map_event(self.service.to_object, True, data)
+        self.assertIsNone(event.old_value)
+        self.assertEqual("EventJournalMapEvent(key=key, new_value=new, old_value=None, event_type=ADDED)", str(event))
+
+    def test_read_other_item(self):
+        with self.assertRaises(HazelcastSerializationError):
+            _to_event_journal_map_event(self.service.to_object, True, self.service.to_data("item"))
+        data = _event_data(self.service, EntryEventType.ADDED, "key", "new", None, factory_id=66)
+        with self.assertRaises(HazelcastSerializationError):
+            _to_event_journal_map_event(self.service.to_object, True, data)
+
+
+class EventJournalReaderTest(TestCase):
+    def setUp(self):
+        self.map = _FakeMap(oldest_sequence=5, newest_sequence=9)
+
+    def _reader(self, start_sequences=None, start_from_oldest=True):
+        return EventJournalReader(self.map, 3, start_sequences or {}, start_from_oldest, 1, 10, None, None).start()
+
+    def test_start_positions(self):
+        reader = self._reader({1: 42})
+        self.assertEqual({0: 5, 1: 42, 2: 5}, reader.get_sequences())
+        self.assertEqual([5, 42, 5], [self.map.reads[i][0][0] for i in range(3)])
+
+        self._reader(start_from_oldest=False)
+        self.assertEqual(10, self.map.reads[0][1][0])
+
+    def test_read_batch(self):
+        reader = self._reader()
+        future = reader.read_batch()
+        self.assertFalse(future.done())
+        self.map.complete(1, ["a", "b"])
+        self.assertEqual(["a", "b"], future.result())
+        self.assertEqual(7, reader.get_sequences()[1])
+        # The next read of the partition is issued when its batch is taken
+        self.assertEqual(7, self.map.reads[1][1][0])
+
+    def test_completed_batches_are_buffered(self):
+        reader = self._reader()
+        self.map.complete(2, ["a"])
+        self.map.complete(0, ["b"])
+        self.assertEqual(1, len(self.map.reads[2]))
+        self.assertEqual(["a"], reader.read_batch().result())
+        self.assertEqual(["b"], reader.read_batch().result())
+        self.assertEqual(2, len(self.map.reads[2]))
+
+    def test_iterate(self):
+        reader = self._reader()
+        self.map.complete(0, ["a", "b"])
+        iterator = iter(reader)
+        self.assertEqual("a", next(iterator))
+        self.assertEqual(6, reader.get_sequences()[0])
+        self.assertEqual("b", next(iterator))
+        self.assertEqual(7, reader.get_sequences()[0])
+
+        threading.Timer(0.1, reader.close).start()
+        self.assertEqual([], list(iterator))
+
+    def test_read_error(self):
+        reader = self._reader()
+        self.map.reads[1][0][1].set_exception(StaleSequenceError("stale"))
+        with self.assertRaises(StaleSequenceError):
+            reader.read_batch().result()
+        self.assertEqual(1, len(self.map.reads[1]))
+
+    def test_close(self):
+        reader = self._reader()
+        future = reader.read_batch()
+        reader.close()
+        self.assertIsNone(future.result())
+        self.map.complete(0, ["a"])
+        self.assertIsNone(reader.read_batch().result())
+        self.assertEqual(1, len(self.map.reads[0]))
+
+
+class EventJournalReaderInFlightTest(TestCase):
+    def setUp(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        self.context = MockProxyContext(config)
+        self.map = Map("hz:impl:mapService", "map", self.context)
+
+    def tearDown(self):
+        self.context.invocation_service.shutdown()
+
+    def test_parked_reads_are_not_counted_in_flight(self):
+        invocation_service = self.context.invocation_service
+        started = []
+        thread = threading.Thread(target=lambda: started.append(self.map.event_journal_reader({0: 1, 1: 2, 2: 3})))
+        thread.daemon = True
+        thread.start()
+        # With the BLOCK policy, the second read would wait forever for room
+        thread.join(5)
+        self.assertEqual(1, len(started))
+        self.assertEqual(3, len(invocation_service._pending))
+        self.assertEqual(0, invocation_service.in_flight_count)
+
+        started[0].close()
+        future = self.map.size()
+        self.assertFalse(future.done())
+        self.assertEqual(1, invocation_service.in_flight_count)
+
+
+class MapEventJournalTest(SingleMemberTestCase):
+    @classmethod
+    def configure_cluster(cls):
+        path = os.path.abspath(__file__)
+        dir_path = os.path.dirname(path)
+        with open(os.path.join(dir_path, "hazelcast.xml")) as f:
+            return f.read()
+
+    @classmethod
+    def configure_client(cls, config):
+        config["cluster_name"] = cls.cluster.id
+        return config
+
+    def setUp(self):
+        self.map = self.client.get_map("EventJournalTest" + random_string())
+
+    def tearDown(self):
+        self.map.destroy()
+
+    def test_read_from_event_journal(self):
+        self.map.put("key", "value").result()
+        partition_id = self.client.partition_service.get_partition_id("key")
+        state = self.map.subscribe_to_event_journal(partition_id).result()
+        result = self.map.read_from_event_journal(state.oldest_sequence, 1, 10, partition_id).result()
+        self.assertEqual(1, result.read_count)
+        event = result.items[0]
+        self.assertEqual(EntryEventType.ADDED, event.event_type)
+        self.assertEqual("key", event.key)
+        self.assertEqual("value", event.new_value)
+        self.assertIsNone(event.old_value)
+
+    def test_reader(self):
+        reader = self.map.event_journal_reader(start_from_oldest=False)
+        self.addCleanup(reader.close)
+        self.map.put_all(dict((i, i) for i in range(100))).result()
+        self.map.remove(0).result()
+
+        events = {}
+        iterator = iter(reader)
+        while len(events) < 101:
+            event = next(iterator)
+            events[(event.key, event.event_type)] = event.new_value
+        self.assertEqual(dict(((i, EntryEventType.ADDED), i) for i in range(100)),
+                         dict((k, v) for k, v in events.items() if k[1] == EntryEventType.ADDED))
+        self.assertIn((0, EntryEventType.REMOVED), events)
+
+    def test_reader_resumes_from_sequences(self):
+        reader = self.map.event_journal_reader()
+        self.map.put_all(dict((i, i) for i in range(10))).result()
+        iterator = iter(reader)
+        first = [next(iterator).key for _ in range(5)]
+        sequences = reader.get_sequences()
+        reader.close()
+
+        reader = self.map.event_journal_reader(sequences)
+        self.addCleanup(reader.close)
+        iterator = iter(reader)
+        rest = [next(iterator).key for _ in range(5)]
+        self.assertEqual(set(range(10)), set(first + rest))
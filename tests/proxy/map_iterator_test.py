@@ -0,0 +1,154 @@
+from unittest import TestCase
+
+from hazelcast.config import _Config
+from hazelcast.connection import _Reader
+from hazelcast.protocol.builtin import StringCodec, EntryListIntegerIntegerCodec, ListMultiFrameCodec, \
+    EntryListCodec, DataCodec, FixSizedTypesCodec
+from hazelcast.protocol.client_message import create_initial_buffer, SIZE_OF_FRAME_LENGTH_AND_FLAGS, \
+    REQUEST_HEADER_SIZE
+from hazelcast.protocol.codec import map_fetch_keys_codec
+from hazelcast.proxy.map import Map
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.util import IterationType
+from tests.base import SingleMemberTestCase
+from tests.util import random_string
+from hazelcast.six.moves import range
+
+
+def _to_inbound(buf):
+    reader = _Reader(None)
+    reader.read(buf)
+    return reader._read_message()
+
+
+class _MemberStandIn(object):
+    """Answers the fetch requests of the map proxy from in-memory partitions,
+    the way the members page over a partition."""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.requests = []
+
+    def invoke(self, invocation):
+        message = _to_inbound(invocation.request.buf)
+        initial_frame = message.next_frame()
+        message_type = FixSizedTypesCodec.decode_int(initial_frame.buf, 0)
+        batch = FixSizedTypesCodec.decode_int(initial_frame.buf, REQUEST_HEADER_SIZE - SIZE_OF_FRAME_LENGTH_AND_FLAGS)
+        StringCodec.decode(message)
+        pointers = EntryListIntegerIntegerCodec.decode(message)
+        self.requests.append((invocation.partition_id, pointers, batch))
+
+        entries = self.partitions[invocation.partition_id]
+        end = min(pointers[-1][0], len(entries))
+        start = max(end - batch, 0)
+        page = entries[start:end]
+        pointers = [(start if start > 0 else -1, len(entries))]
+
+        # The response codecs skip the initial frame, so its size does not matter
+        buf = create_initial_buffer(REQUEST_HEADER_SIZE, message_type + 1)
+        EntryListIntegerIntegerCodec.encode(buf, pointers)
+        if message_type == map_fetch_keys_codec._REQUEST_MESSAGE_TYPE:
+            ListMultiFrameCodec.encode(buf, [key for key, _ in page], DataCodec.encode, True)
+        else:
+            EntryListCodec.encode(buf, page, DataCodec.encode, DataCodec.encode, True)
+        invocation.set_response(_to_inbound(buf))
+
+
+class _PartitionService(object):
+    def __init__(self, partition_count):
+        self.partition_count = partition_count
+
+    def get_partition_count(self):
+        return self.partition_count
+
+
+class _ListenerService(object):
+    def register_listener(self, *args):
+        pass
+
+    def deregister_listener(self, *args):
+        pass
+
+
+class _Context(object):
+    def __init__(self, invocation_service, partition_count):
+        self.config = _Config()
+        self.serialization_service = SerializationServiceV1(self.config)
+        self.invocation_service = invocation_service
+        self.partition_service = _PartitionService(partition_count)
+        self.listener_service = _ListenerService()
+        self.lock_reference_id_generator = None
+
+
+class MapIteratorTest(TestCase):
+    def setUp(self):
+        self.partitions = [[], [], [], []]
+        self.member = _MemberStandIn(self.partitions)
+        context = _Context(self.member, len(self.partitions))
+        to_data = context.serialization_service.to_data
+        for i in range(25):
+            self.partitions[i % 3].append((to_data("key-%d" % i), to_data(i)))
+        self.map = Map("hz:impl:mapService", "map", context)
+
+    def test_entries(self):
+        entries = list(self.map.iterator(fetch_size=4))
+        self.assertEqual(dict(("key-%d" % i, i) for i in range(25)), dict(entries))
+        self.assertEqual(25, len(entries))
+
+    def test_keys_and_values(self):
+        self.assertEqual(set("key-%d" % i for i in range(25)),
+                         set(self.map.iterator(fetch_size=4, iteration_type=IterationType.KEY)))
+        self.assertEqual(list(range(25)),
+                         sorted(self.map.iterator(fetch_size=4, iteration_type=IterationType.VALUE)))
+
+    def test_partitions_are_walked_in_pages(self):
+        list(self.map.iterator(fetch_size=4))
+        # 9, 8 and 8 entries in the first three partitions, the last one is empty
+        self.assertEqual([0, 0, 0, 1, 1, 2, 2, 3], [partition_id for partition_id, _, _ in self.member.requests])
+        self.assertEqual(set([4]), set(batch for _, _, batch in self.member.requests))
+        self.assertEqual([(2147483647, -1)], self.member.requests[0][1])
+        self.assertEqual([(5, 9)], self.member.requests[1][1])
+
+    def test_next_page_is_prefetched(self):
+        iterator = self.map.iterator(fetch_size=4)
+        self.assertEqual([], self.member.requests)
+        next(iterator)
+        self.assertEqual(2, len(self.member.requests))
+        for _ in range(3):
+            next(iterator)
+        self.assertEqual(2, len(self.member.requests))
+        next(iterator)
+        self.assertEqual(3, len(self.member.requests))
+
+    def test_empty_map(self):
+        del self.partitions[:]
+        self.partitions.extend([[], []])
+        self.map._partition_service.partition_count = 2
+        self.assertEqual([], list(self.map.iterator()))
+        self.assertEqual(2, len(self.member.requests))
+
+    def test_invalid_fetch_size(self):
+        with self.assertRaises(AssertionError):
+            self.map.iterator(fetch_size=0)
+
+
+class MapIteratorMemberTest(SingleMemberTestCase):
+    @classmethod
+    def configure_client(cls, config):
+        config["cluster_name"] = cls.cluster.id
+        return config
+
+    def setUp(self):
+        self.map = self.client.get_map(random_string()).blocking()
+
+    def tearDown(self):
+        self.map.destroy()
+
+    def test_iterator(self):
+        expected = dict(("key-%d" % i, i) for i in range(1000))
+        self.map.put_all(expected)
+        entries = list(self.map.iterator(fetch_size=10))
+        self.assertEqual(1000, len(entries))
+        self.assertEqual(expected, dict(entries))
+        self.assertEqual(set(expected), set(self.map.iterator(iteration_type=IterationType.KEY)))
+        self.assertEqual(sorted(expected.values()), sorted(self.map.iterator(iteration_type=IterationType.VALUE)))
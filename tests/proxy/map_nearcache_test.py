@@ -3,6 +3,7 @@ import os
 from tests.hzrc.ttypes import Lang
 
 from tests.base import SingleMemberTestCase
+from hazelcast.predicate import sql
 from tests.util import random_string
 from hazelcast.six.moves import range
 from hazelcast import six
@@ -96,6 +97,15 @@ class MapTest(SingleMemberTestCase):
 
         self.assertTrueEventually(assertion)
 
+    def test_remove_all_clears_near_cache(self):
+        self._fill_map_and_near_cache(10)
+        self.assertEqual(10, len(self.map._near_cache))
+        self.map.remove_all(sql("this >= 'value-5'"))
+        self.assertEqual(0, len(self.map._near_cache))
+        self.assertEqual(5, self.map.size())
+        self.assertIsNone(self.map.get("key-5"))
+        self.assertEqual("value-4", self.map.get("key-4"))
+
     def _fill_map_and_near_cache(self, count=10):
         fill_content = {"key-%d" % x: "value-%d" % x for x in range(0, count)}
         for k, v in six.iteritems(fill_content):
@@ -5,7 +5,7 @@ from hazelcast.config import IndexType
 from hazelcast.errors import HazelcastError
 from hazelcast.proxy.map import EntryEventType
 from hazelcast.serialization.api import IdentifiedDataSerializable
-from hazelcast.predicate import sql
+from hazelcast.predicate import sql, paging, true
 from tests.base import SingleMemberTestCase
 from tests.util import random_string, event_collector, fill_map
 from hazelcast import six
@@ -48,6 +48,12 @@ class MapTest(SingleMemberTestCase):
                 EntryProcessor.CLASS_ID: EntryProcessor
             }
         }
+        config["value_compression"] = {
+            "compressed-map": {"threshold": 100}
+        }
+        config["key_caches"] = {
+            "key-cached-map": {"max_size": 2}
+        }
         return config
 
     def setUp(self):
@@ -283,6 +289,50 @@ class MapTest(SingleMemberTestCase):
     def test_get_all_when_no_keys(self):
         self.assertEqual(self.map.get_all([]), {})
 
+    def test_operations_with_timeout(self):
+        self.assertIsNone(self.map.put("key", "value", timeout=10))
+        self.map.set("key", "new_value", timeout=10)
+        self.assertEqual("new_value", self.map.get("key", timeout=10))
+        self.assertTrue(self.map.contains_key("key", timeout=10))
+        self.assertEqual("new_value", self.map.remove("key", timeout=10))
+        self.map.delete("key", timeout=10)
+        self.assertFalse(self.map.contains_key("key", timeout=10))
+
+    def test_compressed_values(self):
+        compressed_map = self.client.get_map("compressed-map").blocking()
+        value = "value" * 1000
+        try:
+            compressed_map.put("key", value)
+            compressed_map.put_all({"key2": value})
+            self.assertEqual(value, compressed_map.get("key"))
+            self.assertEqual({"key": value, "key2": value}, compressed_map.get_all(["key", "key2"]))
+            self.assertTrue(compressed_map.contains_value(value))
+            self.assertTrue(compressed_map.replace_if_same("key", value, "small"))
+            self.assertEqual("small", compressed_map.get("key"))
+
+            stats = compressed_map.get_compression_statistics()
+            self.assertEqual(4, stats["compressed_count"])
+            self.assertGreater(stats["bytes_saved"], 0)
+            self.assertIsNone(self.map.get_compression_statistics())
+        finally:
+            compressed_map.destroy()
+
+    def test_key_cache(self):
+        key_cached_map = self.client.get_map("key-cached-map").blocking()
+        try:
+            key_cached_map.put("key", "value")
+            self.assertEqual("value", key_cached_map.get("key"))
+            key_cached_map.put(True, "bool")
+            self.assertEqual("bool", key_cached_map.get(True))
+            self.assertTrue(key_cached_map.contains_key("key"))
+
+            stats = key_cached_map.get_key_cache_statistics()
+            self.assertEqual(2, stats["hits"])
+            self.assertEqual(1, stats["misses"])
+            self.assertIsNone(self.map.get_key_cache_statistics())
+        finally:
+            key_cached_map.destroy()
+
     def test_get_entry_view(self):
         self.map.put("key", "value")
         self.map.get("key")
@@ -392,6 +442,17 @@ class MapTest(SingleMemberTestCase):
         self.assertEqual(0, self.map.size())
         self.assertFalse(self.map.contains_key("key"))
 
+    def test_remove_all(self):
+        fill_map(self.map)
+
+        self.map.remove_all(sql("this >= 'val5'"))
+        self.assertEqual(5, self.map.size())
+        self.assertEqual(["val%d" % i for i in range(5)], sorted(self.map.values()))
+
+    def test_remove_all_with_paging_predicate(self):
+        with self.assertRaises(AssertionError):
+            self.map.remove_all(paging(true(), 5))
+
     def test_remove_if_same_when_same(self):
         self.map.put("key", "value")
 
@@ -1,9 +1,13 @@
 import os
+import threading
+from unittest import TestCase
 
+from hazelcast.config import _Config
 from hazelcast.errors import IllegalStateError
 from hazelcast.proxy.base import ItemEventType
+from hazelcast.proxy.queue import Queue
 from tests.base import SingleMemberTestCase
-from tests.util import random_string, event_collector
+from tests.util import random_string, event_collector, MockProxyContext
 from hazelcast import six
 
 
@@ -223,3 +227,36 @@ class QueueTest(SingleMemberTestCase):
 
     def test_str(self):
         self.assertTrue(str(self.queue).startswith("Queue"))
+
+
+class QueueInFlightTest(TestCase):
+    def setUp(self):
+        config = _Config()
+        config.max_concurrent_invocations = 1
+        self.context = MockProxyContext(config)
+        self.queue = Queue("hz:impl:queueService", "queue", self.context)
+
+    def tearDown(self):
+        self.context.invocation_service.shutdown()
+
+    def test_waits_on_the_member_are_not_counted_in_flight(self):
+        invocation_service = self.context.invocation_service
+        futures = []
+
+        def wait_on_the_member():
+            futures.append(self.queue.take())
+            futures.append(self.queue.poll(60))
+            futures.append(self.queue.offer("item", 60))
+
+        thread = threading.Thread(target=wait_on_the_member)
+        thread.daemon = True
+        thread.start()
+        # With the BLOCK policy, the second wait would block forever for room
+        thread.join(5)
+        self.assertEqual(3, len(futures))
+        self.assertEqual(3, len(invocation_service._pending))
+        self.assertEqual(0, invocation_service.in_flight_count)
+
+        future = self.queue.size()
+        self.assertFalse(future.done())
+        self.assertEqual(1, invocation_service.in_flight_count)
@@ -2,18 +2,32 @@ import os
 import socket
 import threading
 import time
+import unittest
 from collections import OrderedDict
 
-from mock import MagicMock
+from mock import MagicMock, patch
 from parameterized import parameterized
 
 from hazelcast import six
-from hazelcast.config import _Config
+from hazelcast.config import _Config, ReactorLoop
+from hazelcast.core import Address
+from hazelcast.future import Future
+from hazelcast.protocol.codec import client_ping_codec
 from hazelcast.reactor import AsyncoreReactor, _WakeableLoop, _SocketedWaker, _PipedWaker, _BasicLoop, \
-    AsyncoreConnection
+    AsyncoreConnection, AsyncioReactor, _SelectorLoop, _SelectorMap, _TimerWheel, Timer
 from hazelcast.util import AtomicInteger
 from tests.base import HazelcastTestCase
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    import selectors
+except ImportError:
+    selectors = None
+
 
 class ReactorTest(HazelcastTestCase):
     def test_default_loop_is_wakeable(self):
@@ -30,12 +44,118 @@ class ReactorTest(HazelcastTestCase):
             reactor.shutdown()
         self.assertEqual(t_count, threading.active_count())
 
+    def test_reactor_lifetime_with_io_threads(self):
+        t_count = threading.active_count()
+        reactor = AsyncoreReactor(io_thread_count=3)
+        reactor.start()
+        try:
+            self.assertEqual(t_count + 4, threading.active_count())  # timer thread and I/O threads
+        finally:
+            reactor.shutdown()
+        self.assertEqual(t_count, threading.active_count())
+
+    def test_connections_are_pinned_to_io_loops(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(3)
+        reactor = AsyncoreReactor(io_thread_count=2)
+        reactor.start()
+        member_sockets = []
+        try:
+            address = Address(*server.getsockname())
+            messages = []
+            connections = []
+            for connection_id in range(3):
+                connection = reactor.connection_factory(MagicMock(), connection_id, address,
+                                                        _Config(), messages.append)
+                connections.append(connection)
+                member_sockets.append(server.accept()[0])
+
+            io_loops = reactor._io_loops
+            self.assertEqual(2, len(io_loops))
+            self.assertNotIn(reactor._loop, io_loops)
+            for connection, loop in zip(connections, [io_loops[0], io_loops[1], io_loops[0]]):
+                self.assertIs(loop, connection._loop)
+                self.assertIs(connection, loop.map[connection._fileno])
+
+            request = client_ping_codec.encode_request()
+            for member_socket in member_sockets:
+                member_socket.sendall(request.buf)
+
+            def assertion():
+                self.assertEqual(3, len(messages))
+
+            self.assertTrueEventually(assertion)
+        finally:
+            reactor.shutdown()
+            for member_socket in member_sockets:
+                member_socket.close()
+            server.close()
+
+
+def _selector_loop(_):
+    return _SelectorLoop(_SelectorMap())
+
 
 LOOP_CLASSES = [
     ("wakeable", _WakeableLoop,),
     ("basic", _BasicLoop,),
 ]
 
+if selectors:
+    LOOP_CLASSES.append(("selector", _selector_loop,))
+
+
+@unittest.skipIf(selectors is None, "selectors is not available")
+class SelectorLoopTest(HazelcastTestCase):
+    def setUp(self):
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.reactor = AsyncoreReactor(ReactorLoop.SELECTORS)
+        self.reactor.start()
+
+    def tearDown(self):
+        self.reactor.shutdown()
+        self.server.close()
+
+    def get_events(self, connection):
+        return self.reactor._loop._selector.get_key(connection._fileno).events
+
+    def test_selector_loop_is_used(self):
+        self.assertIsInstance(self.reactor._loop, _SelectorLoop)
+
+    def test_connection(self):
+        messages = []
+        connection = self.reactor.connection_factory(MagicMock(), 0, Address(*self.server.getsockname()),
+                                                     _Config(), messages.append)
+        member_socket, _ = self.server.accept()
+        try:
+            self.assertEqual(b"CP2", member_socket.recv(3))
+            request = client_ping_codec.encode_request()
+            connection.send_message(request)
+            received = bytearray()
+            while len(received) < len(request.buf):
+                received.extend(member_socket.recv(len(request.buf) - len(received)))
+            self.assertEqual(request.buf, received)
+
+            # Only registered for writes while there is something to write
+            self.assertTrueEventually(lambda: self.assertEqual(selectors.EVENT_READ, self.get_events(connection)))
+
+            member_socket.sendall(request.buf)
+
+            def assertion():
+                self.assertEqual(1, len(messages))
+                self.assertEqual(client_ping_codec._REQUEST_MESSAGE_TYPE, messages[0].get_message_type())
+
+            self.assertTrueEventually(assertion)
+
+            fd = connection._fileno
+            connection.close(None, None)
+            self.assertTrueEventually(lambda: self.assertRaises(KeyError, self.reactor._loop._selector.get_key, fd))
+        finally:
+            member_socket.close()
+
 
 class LoopTest(HazelcastTestCase):
     def test_wakeable_loop_default_waker(self):
@@ -138,6 +258,28 @@ class LoopTest(HazelcastTestCase):
 
         self.assertTrueEventually(assertion)
 
+    @parameterized.expand(LOOP_CLASSES)
+    def test_canceled_timer_is_removed(self, _, cls):
+        call_count = AtomicInteger()
+
+        def callback():
+            call_count.add(1)
+
+        loop = cls({})
+        loop.start()
+        try:
+            timer = loop.add_timer(0.2, callback)
+            self.assertTrueEventually(lambda: self.assertEqual(1, len(loop._timer_wheel)))
+            timer.cancel()
+            self.assertTrueEventually(lambda: self.assertEqual(0, len(loop._timer_wheel)))
+            time.sleep(0.5)
+            self.assertEqual(0, call_count.get())
+        finally:
+            loop.shutdown()
+
+        # Canceled timers are not ended on shutdown
+        self.assertEqual(0, call_count.get())
+
     @parameterized.expand(LOOP_CLASSES)
     def test_timer_that_shuts_down_loop(self, _, cls):
         # It may be the case that, we want to shutdown the client(hence, the loop) in timers
@@ -155,6 +297,68 @@ class LoopTest(HazelcastTestCase):
             loop.shutdown()  # Should be no op
 
 
+class TimerWheelTest(unittest.TestCase):
+    def setUp(self):
+        self.wheel = _TimerWheel(0, tick_duration=1, size=8)
+
+    def add(self, end):
+        timer = Timer(end, None)
+        self.wheel.add(timer)
+        return timer
+
+    def test_expire(self):
+        first = self.add(1.5)
+        second = self.add(3)
+        self.assertEqual([], self.wheel.expire(1.9))
+        self.assertEqual([first], self.wheel.expire(2))
+        self.assertEqual([second], self.wheel.expire(3))
+        self.assertEqual(0, len(self.wheel))
+
+    def test_expire_after_revolutions(self):
+        timer = self.add(20)
+        self.assertEqual(2, timer.rounds)
+        for now in range(20):
+            self.assertEqual([], self.wheel.expire(now))
+        self.assertEqual([timer], self.wheel.expire(20))
+
+    def test_expire_after_missed_revolutions(self):
+        due = self.add(5)
+        late = self.add(50)
+        self.assertEqual([due], self.wheel.expire(30))
+        self.assertEqual([], self.wheel.expire(49))
+        self.assertEqual([late], self.wheel.expire(50))
+
+    def test_add_already_expired(self):
+        self.wheel.expire(5)
+        timer = self.add(1)
+        self.assertEqual([timer], self.wheel.expire(6))
+
+    def test_add_after_idle_period(self):
+        self.wheel.expire(5)
+        timer = self.add(7)
+        self.assertEqual([], self.wheel.expire(6))
+        self.assertEqual([timer], self.wheel.expire(7))
+
+    def test_add_infinite(self):
+        timer = self.add(float("inf"))
+        self.assertEqual([], self.wheel.expire(100))
+        self.assertEqual([timer], self.wheel.clear())
+
+    def test_remove(self):
+        timer = self.add(2)
+        self.wheel.remove(timer)
+        self.assertEqual(0, len(self.wheel))
+        self.assertIsNone(timer.bucket)
+        self.wheel.remove(timer)  # No op
+        self.assertEqual([], self.wheel.expire(10))
+
+    def test_clear(self):
+        timers = [self.add(end) for end in (1, 5, 100)]
+        self.assertEqual(set(map(id, timers)), set(map(id, self.wheel.clear())))
+        self.assertEqual(0, len(self.wheel))
+        self.assertEqual([], self.wheel.expire(200))
+
+
 class SocketedWakerTest(HazelcastTestCase):
     def setUp(self):
         self.waker = _SocketedWaker({})
@@ -319,3 +523,297 @@ class AsyncoreConnectionTest(HazelcastTestCase):
             self.assertEqual(size, conn.send_buffer_size)
         finally:
             conn._inner_close()
+
+
+class AsyncoreConnectionWriteTest(HazelcastTestCase):
+    def setUp(self):
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.reactor = MagicMock(map=dict())
+        address = Address(*self.server.getsockname())
+        config = _Config()
+        config.max_queued_write_bytes = 1 << 20
+        self.connection = AsyncoreConnection(self.reactor, MagicMock(), 0, address, config, None)
+        self.member_socket, _ = self.server.accept()
+        self.member_socket.settimeout(5)
+
+    def tearDown(self):
+        self.connection._inner_close()
+        self.member_socket.close()
+        self.server.close()
+
+    def receive(self, n):
+        received = bytearray()
+        while len(received) < n:
+            received.extend(self.member_socket.recv(n - len(received)))
+        return bytes(received)
+
+    def flush(self):
+        while self.connection.writable():
+            self.connection.handle_write()
+
+    def test_write_batch(self):
+        messages = [bytearray(six.b(str(i)) * (i + 1)) for i in range(100)]
+        for message in messages:
+            self.connection._write(message)
+
+        self.flush()
+        expected = b"CP2" + b"".join(bytes(message) for message in messages)
+        self.assertEqual(expected, self.receive(len(expected)))
+
+    def test_partial_writes(self):
+        sent = bytearray()
+
+        def send(buffers):
+            # Sends at most 5 bytes on each call
+            data = b"".join(bytes(buf) for buf in buffers)[:5]
+            sent.extend(data)
+            return len(data)
+
+        self.connection._send = send
+        messages = [bytearray(six.b(str(i)) * (i + 1)) for i in range(20)]
+        for message in messages:
+            self.connection._write(message)
+
+        self.flush()
+        self.assertEqual(b"CP2" + b"".join(bytes(message) for message in messages), bytes(sent))
+        self.assertEqual(0, self.connection._write_offset)
+
+    def test_reactor_is_notified_once_per_flush(self):
+        # The protocol bytes are written in the constructor
+        self.reactor.start_writing.assert_called_once_with(self.connection)
+        for _ in range(10):
+            self.connection._write(bytearray(b"x"))
+        self.reactor.start_writing.assert_called_once_with(self.connection)
+
+        self.flush()
+        self.reactor.stop_writing.assert_called_once_with(self.connection)
+        self.connection._write(bytearray(b"y"))
+        self.assertEqual(2, self.reactor.start_writing.call_count)
+        self.flush()
+        self.assertEqual(2, self.reactor.stop_writing.call_count)
+        self.assertEqual(b"CP2" + b"x" * 10 + b"y", self.receive(14))
+
+    def test_queued_write_bytes(self):
+        self.connection._send = lambda buffers: min(5, sum(len(buf) for buf in buffers))
+        self.assertEqual(3, self.connection.queued_write_bytes)  # Protocol bytes
+        self.connection._write(bytearray(10))
+        self.assertEqual(13, self.connection.queued_write_bytes)
+
+        self.connection.handle_write()
+        self.assertEqual(8, self.connection.queued_write_bytes)
+        self.flush()
+        self.assertEqual(0, self.connection.queued_write_bytes)
+
+    def test_queued_write_bytes_are_not_tracked_without_limit(self):
+        address = Address(*self.server.getsockname())
+        connection = AsyncoreConnection(self.reactor, MagicMock(), 1, address, _Config(), None)
+        member_socket, _ = self.server.accept()
+        try:
+            connection._write_condition = MagicMock()
+            connection._write(bytearray(10))
+            self.assertEqual(0, connection.queued_write_bytes)
+            while connection.writable():
+                connection.handle_write()
+            connection._write_condition.__enter__.assert_not_called()
+        finally:
+            connection._inner_close()
+            member_socket.close()
+
+    def test_wait_for_write_capacity(self):
+        self.connection._write(bytearray(10))
+        self.assertTrue(self.connection.wait_for_write_capacity(20))
+        self.assertFalse(self.connection.wait_for_write_capacity(10, 0))
+        self.assertFalse(self.connection.wait_for_write_capacity(10, 0.1))
+
+        flusher = threading.Timer(0.1, self.flush)
+        flusher.start()
+        try:
+            self.assertTrue(self.connection.wait_for_write_capacity(10))
+        finally:
+            flusher.join()
+        self.assertEqual(0, self.connection.queued_write_bytes)
+
+    def test_wait_for_write_capacity_on_close(self):
+        self.connection._write(bytearray(10))
+        closer = threading.Timer(0.1, lambda: self.connection.close(None, None))
+        closer.start()
+        try:
+            self.assertTrue(self.connection.wait_for_write_capacity(10))
+        finally:
+            closer.join()
+        self.assertFalse(self.connection.live)
+
+
+@unittest.skipIf(asyncio is None, "asyncio is not available")
+class AsyncioReactorTest(HazelcastTestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever)
+        self.loop_thread.daemon = True
+        self.loop_thread.start()
+        self.reactor = AsyncioReactor(self.loop)
+        self.reactor.start()
+
+    def tearDown(self):
+        self.reactor.shutdown()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.loop.close()
+
+    def test_loop_thread_is_marked_as_reactor_thread(self):
+        future = Future()
+        errors = []
+
+        def blocking_call():
+            try:
+                future.result()
+            except RuntimeError as e:
+                errors.append(e)
+
+        self.reactor.run_in_loop(blocking_call)
+
+        def assertion():
+            self.assertEqual(1, len(errors))
+
+        self.assertTrueEventually(assertion)
+
+    def test_in_loop_thread(self):
+        in_loop_thread = []
+        self.reactor.run_in_loop(lambda: in_loop_thread.append(self.reactor.in_loop_thread()))
+
+        def assertion():
+            self.assertEqual([True], in_loop_thread)
+
+        self.assertTrueEventually(assertion)
+        self.assertFalse(self.reactor.in_loop_thread())
+
+    def test_in_loop_thread_without_get_running_loop(self):
+        # Python 3.4-3.6, where only the loop marked on the reactor thread is known
+        with patch("hazelcast.future._get_running_loop", None):
+            self.test_in_loop_thread()
+
+    def test_add_timer(self):
+        call_count = AtomicInteger()
+
+        def callback():
+            self.assertTrue(self.reactor.in_loop_thread())
+            call_count.add(1)
+
+        self.reactor.add_timer(0, callback)
+
+        def assertion():
+            self.assertEqual(1, call_count.get())
+
+        self.assertTrueEventually(assertion)
+
+    def test_canceled_timer(self):
+        call_count = AtomicInteger()
+
+        def callback():
+            call_count.add(1)
+
+        timer = self.reactor.add_timer(0.5, callback)
+        timer.cancel()
+        time.sleep(1)
+        self.assertEqual(0, call_count.get())
+
+    def test_timer_cleanup(self):
+        call_count = AtomicInteger()
+
+        def callback():
+            call_count.add(1)
+
+        self.reactor.add_timer(float('inf'), callback)  # never expired, must be cleaned up
+        time.sleep(0.5)
+        self.assertEqual(0, call_count.get())
+        self.reactor.shutdown()
+        self.assertEqual(1, call_count.get())
+
+    def test_shutdown_runs_on_loop_thread(self):
+        ended_in_loop_thread = []
+
+        def callback():
+            ended_in_loop_thread.append(self.reactor.in_loop_thread())
+
+        # Still waiting to be scheduled on the loop when the shutdown starts
+        self.reactor.add_timer(float('inf'), callback)
+        self.reactor.shutdown()
+        self.assertEqual([True], ended_in_loop_thread)
+
+        # Timers added after the shutdown are ended right away
+        self.reactor.add_timer(float('inf'), callback)
+
+        def assertion():
+            self.assertEqual([True, True], ended_in_loop_thread)
+
+        self.assertTrueEventually(assertion)
+
+    def test_shutdown_when_loop_is_not_running(self):
+        call_count = AtomicInteger()
+        self.reactor.add_timer(float('inf'), lambda: call_count.add(1))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.loop_thread.join()
+        self.reactor.shutdown()
+        self.assertEqual(1, call_count.get())
+        self.loop_thread = threading.Thread(target=self.loop.run_forever)
+        self.loop_thread.start()
+
+    def test_connection(self):
+        received = bytearray()
+        messages = []
+
+        class Member(asyncio.Protocol):
+            def connection_made(self, transport):
+                self.transport = transport
+
+            def data_received(self, data):
+                # Echo everything after the protocol bytes back
+                skip = max(0, 3 - len(received))
+                received.extend(data)
+                self.transport.write(data[skip:])
+
+        server = asyncio.run_coroutine_threadsafe(
+            self.loop.create_server(Member, "127.0.0.1", 0), self.loop).result()
+        port = server.sockets[0].getsockname()[1]
+        try:
+            connection_manager = MagicMock()
+            config = _Config()
+            config.max_queued_write_bytes = 1 << 20
+            connection = self.reactor.connection_factory(connection_manager, 0, Address("127.0.0.1", port),
+                                                         config, messages.append)
+            request = client_ping_codec.encode_request()
+            self.assertTrue(connection.send_message(request))
+
+            def assertion():
+                self.assertEqual(b"CP2" + bytes(request.buf), bytes(received))
+                self.assertEqual(1, len(messages))
+                self.assertEqual(client_ping_codec._REQUEST_MESSAGE_TYPE, messages[0].get_message_type())
+                self.assertIsNotNone(connection.local_address)
+                self.assertEqual(0, connection.queued_write_bytes)
+
+            self.assertTrueEventually(assertion)
+
+            connection.close(None, None)
+            self.assertFalse(connection.live)
+            connection_manager.on_connection_close.assert_called_once_with(connection, None)
+        finally:
+            self.loop.call_soon_threadsafe(server.close)
+
+    def test_connection_failure(self):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()  # nothing listens on this port
+
+        connection_manager = MagicMock()
+        connection = self.reactor.connection_factory(connection_manager, 0, Address("127.0.0.1", port),
+                                                     _Config(), None)
+
+        def assertion():
+            self.assertFalse(connection.live)
+            connection_manager.on_connection_close.assert_called_once()
+            self.assertIsInstance(connection_manager.on_connection_close.call_args[0][1], IOError)
+
+        self.assertTrueEventually(assertion)
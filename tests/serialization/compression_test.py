@@ -0,0 +1,120 @@
+import unittest
+import zlib
+
+from hazelcast.config import _Config
+from hazelcast.errors import HazelcastSerializationError
+from hazelcast.serialization.api import CompressionCodec
+from hazelcast.serialization.compression import ZlibCodec
+from hazelcast.serialization.serialization_const import PYTHON_TYPE_COMPRESSED
+from hazelcast.serialization.service import SerializationServiceV1
+
+
+class ReversingCodec(CompressionCodec):
+    def compress(self, buf):
+        return zlib.compress(bytes(buf))[::-1]
+
+    def decompress(self, buf):
+        return zlib.decompress(bytes(buf[::-1]))
+
+    def get_id(self):
+        return 42
+
+
+class ZlibCodecTest(unittest.TestCase):
+    def test_buffer_types(self):
+        codec = ZlibCodec()
+        raw = b"value" * 100
+        for buf in (raw, bytearray(raw), memoryview(bytearray(raw))):
+            compressed = codec.compress(buf)
+            self.assertEqual(raw, codec.decompress(compressed))
+            self.assertEqual(raw, codec.decompress(bytearray(compressed)))
+            self.assertEqual(raw, codec.decompress(memoryview(bytearray(compressed))))
+
+
+class ValueCompressionTest(unittest.TestCase):
+    def setUp(self):
+        config = _Config()
+        config.value_compression = {
+            "compressed": {"threshold": 100},
+            "custom": {"threshold": 0, "codec": ReversingCodec()},
+        }
+        self.service = SerializationServiceV1(config)
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_no_compressor_for_other_structures(self):
+        self.assertIsNone(self.service.get_value_compressor("other"))
+
+    def test_large_value_is_compressed(self):
+        compressor = self.service.get_value_compressor("compressed")
+        value = "value" * 1000
+        uncompressed = self.service.to_data(value)
+        data = compressor.to_data(value)
+
+        self.assertEqual(PYTHON_TYPE_COMPRESSED, data.get_type())
+        self.assertLess(data.total_size(), uncompressed.total_size())
+        self.assertEqual(value, self.service.to_object(data))
+        # Compression is deterministic, so the values can be compared in their binary form
+        self.assertEqual(data, compressor.to_data(value))
+
+    def test_small_value_is_not_compressed(self):
+        compressor = self.service.get_value_compressor("compressed")
+        data = compressor.to_data("value")
+
+        self.assertEqual(self.service.to_data("value"), data)
+        self.assertEqual(0, compressor.get_statistics()["compressed_count"])
+
+    def test_incompressible_value_is_not_compressed(self):
+        compressor = self.service.get_value_compressor("compressed")
+        value = bytearray(zlib.compress(b"".join(str(i).encode() for i in range(1000))))
+        data = compressor.to_data(value)
+
+        self.assertEqual(self.service.to_data(value), data)
+        self.assertEqual(1, compressor.get_statistics()["uncompressed_count"])
+
+    def test_none(self):
+        self.assertIsNone(self.service.get_value_compressor("custom").to_data(None))
+
+    def test_custom_codec(self):
+        compressor = self.service.get_value_compressor("custom")
+        value = ["value"] * 100
+        data = compressor.to_data(value)
+
+        self.assertEqual(PYTHON_TYPE_COMPRESSED, data.get_type())
+        self.assertEqual(value, self.service.to_object(data))
+
+    def test_unknown_codec(self):
+        data = self.service.get_value_compressor("custom").to_data("value" * 100)
+        service = SerializationServiceV1(_Config())
+        with self.assertRaises(HazelcastSerializationError):
+            service.to_object(data)
+
+    def test_zlib_values_can_be_read_without_configuration(self):
+        data = self.service.get_value_compressor("compressed").to_data("value" * 100)
+        service = SerializationServiceV1(_Config())
+        self.assertEqual("value" * 100, service.to_object(data))
+
+    def test_statistics(self):
+        compressor = self.service.get_value_compressor("compressed")
+        value = "value" * 1000
+        original_size = self.service.to_data(value).total_size()
+        compressed_size = compressor.to_data(value).total_size()
+        compressor.to_data("small")
+
+        stats = compressor.get_statistics()
+        self.assertEqual(1, stats["compressed_count"])
+        self.assertEqual(0, stats["uncompressed_count"])
+        self.assertEqual(original_size, stats["original_bytes"])
+        self.assertEqual(compressed_size, stats["compressed_bytes"])
+        self.assertEqual(original_size - compressed_size, stats["bytes_saved"])
+        self.assertGreaterEqual(stats["compression_time"], 0)
+
+    def test_conflicting_codec_ids(self):
+        class OtherCodec(ZlibCodec):
+            pass
+
+        config = _Config()
+        config.value_compression = {"a": {"codec": OtherCodec()}}
+        with self.assertRaises(ValueError):
+            SerializationServiceV1(config)
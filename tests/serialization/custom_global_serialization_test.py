@@ -137,3 +137,30 @@ class CustomSerializationTestCase(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             service._registry.safe_register_serializer(TheOtherCustomSerializer, CustomClass)
+
+    def test_resolved_serializer_is_cached_until_registration(self):
+        service = SerializationServiceV1(_Config())
+        registry = service._registry
+        obj = CustomClass("uid", "some name", "description text")
+
+        self.assertIs(registry._python_serializer, registry.serializer_for(obj))
+        self.assertIs(registry._python_serializer, registry._serializer_cache[CustomClass])
+
+        custom_serializer = CustomSerializer()
+        registry._type_dict.pop(CustomClass)
+        registry._id_dic.pop(custom_serializer.get_type_id(), None)
+        registry.safe_register_serializer(custom_serializer, CustomClass)
+
+        self.assertNotIn(CustomClass, registry._serializer_cache)
+        self.assertIs(custom_serializer, registry.serializer_for(obj))
+        self.assertEqual("CUSTOM", service.to_object(service.to_data(obj)).source)
+
+    def test_global_serializer_takes_precedence_over_fast_path(self):
+        config = _Config()
+        config.global_serializer = TestGlobalSerializer
+        service = SerializationServiceV1(config)
+
+        obj = {"key": "value"}
+        data = service.to_data(obj)
+        self.assertEqual(10000, data.get_type())
+        self.assertEqual(obj, service.to_object(data))
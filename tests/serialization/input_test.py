@@ -35,6 +35,41 @@ class InputTestCase(unittest.TestCase):
         self.assertEqual(0, initial_pos)
         self.assertEqual(self.INT_ARR, read_arr)
 
+    def test_little_endian_long_array(self):
+        buff = bytearray(binascii.unhexlify("020000000100000000000000ffffffffffffffff"))
+        _input = _ObjectDataInput(buff, 0, None, False)
+        self.assertEqual([1, -1], _input.read_long_array())
+        self.assertEqual(len(buff), _input._pos)
+
+    def test_char_array(self):
+        buff = bytearray(binascii.unhexlify("0000000300e7fffd0061"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        self.assertEqual([six.unichr(0x00e7), six.unichr(0xfffd), six.u("a")], _input.read_char_array())
+
+    def test_truncated_array(self):
+        buff = bytearray(binascii.unhexlify("000000040001000200030004"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        with self.assertRaises(EOFError):
+            _input.read_int_array()
+
+    def test_utf_from_bytearray(self):
+        buff = bytearray(binascii.unhexlify("00000004c3a76162ffffffff"))
+        _input = _ObjectDataInput(buff, 0, None, True)
+        value = _input.read_utf()
+        self.assertEqual(six.u("\u00e7ab"), value)
+        self.assertIsInstance(value, six.text_type)
+        self.assertIsNone(_input.read_utf())
+
+    def test_utf_and_byte_array_from_view(self):
+        buff = bytearray(binascii.unhexlify("00000004c3a7616200000002010200000003"))
+        _input = _ObjectDataInput(memoryview(buff), 0, None, True)
+        self.assertEqual(six.u("\u00e7ab"), _input.read_utf())
+        byte_array = _input.read_byte_array()
+        self.assertEqual(bytearray(b"\x01\x02"), byte_array)
+        self.assertIsInstance(byte_array, bytearray)
+        with self.assertRaises(EOFError):
+            _input.read_byte_array()
+
     def test_char_be(self):
         buff = bytearray(binascii.unhexlify("00e70000"))
         _input = _ObjectDataInput(buff, 0, None, True)
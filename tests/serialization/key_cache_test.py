@@ -0,0 +1,68 @@
+import unittest
+
+from hazelcast import six
+from hazelcast.config import _Config
+from hazelcast.serialization.key_cache import KeyDataCache
+from hazelcast.serialization.service import SerializationServiceV1
+
+
+class KeyDataCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(_Config())
+        self.cache = KeyDataCache(self.service.to_data, 3)
+
+    def tearDown(self):
+        self.service.destroy()
+
+    def test_cached_key(self):
+        data = self.cache.to_data("key")
+        self.assertIs(data, self.cache.to_data("key"))
+        self.assertEqual(self.service.to_data("key"), data)
+
+        stats = self.cache.get_statistics()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["size"])
+        self.assertEqual(3, stats["max_size"])
+
+    def test_cacheable_keys(self):
+        for key in ["key", b"key", 42, ("key", (1, b"key"))]:
+            self.assertIs(self.cache.to_data(key), self.cache.to_data(key))
+
+    def test_uncacheable_keys(self):
+        for key in [True, 1.5, ("key", 1.5), (1, True), frozenset([1])]:
+            self.assertEqual(self.service.to_data(key), self.cache.to_data(key))
+
+        stats = self.cache.get_statistics()
+        self.assertEqual(0, stats["misses"])
+        self.assertEqual(0, stats["size"])
+
+    def test_bool_does_not_share_the_entry_of_int(self):
+        self.cache.to_data(1)
+        self.assertEqual(self.service.to_data(True), self.cache.to_data(True))
+        self.assertNotEqual(self.cache.to_data(1), self.cache.to_data(True))
+
+    def test_oldest_key_is_evicted(self):
+        for i in range(4):
+            self.cache.to_data(i)
+
+        stats = self.cache.get_statistics()
+        self.assertEqual(1, stats["evictions"])
+        self.assertEqual(3, stats["size"])
+
+        self.cache.to_data(0)
+        self.assertEqual(5, self.cache.get_statistics()["misses"])
+
+    def test_clear(self):
+        self.cache.to_data("key")
+        self.cache.clear()
+        self.assertEqual(0, self.cache.get_statistics()["size"])
+
+    def test_hash_is_computed_once(self):
+        data = self.cache.to_data(six.u("key"))
+        expected = data.hash_code()
+        # Changing the buffer must not change the hash once it is computed
+        data._buffer = bytearray(data._buffer)
+        data._buffer[-1] ^= 0xFF
+        self.assertEqual(expected, hash(data))
+        self.assertEqual(expected, data.get_partition_hash())
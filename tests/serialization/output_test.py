@@ -2,7 +2,7 @@ import binascii
 import unittest
 from hazelcast import six
 
-from hazelcast.serialization.output import _ObjectDataOutput
+from hazelcast.serialization.output import _ObjectDataOutput, _ObjectDataOutputPool
 
 
 class OutputTestCase(unittest.TestCase):
@@ -23,11 +23,79 @@ class OutputTestCase(unittest.TestCase):
         self.assertEqual(bytearray(binascii.unhexlify("00000004")),  self._output._buffer[pos:pos + 4])
         self.assertEqual(bytearray(binascii.unhexlify("00000001000000020000000300000004")),  self._output._buffer[pos+4:pos + 20])
 
+    def test_little_endian_double_array(self):
+        output = _ObjectDataOutput(4, None, False)
+        output.write_double_array([1.0, -2.5])
+        self.assertEqual(bytearray(binascii.unhexlify("02000000000000000000f03f00000000000004c0")),
+                         output.to_byte_array())
+
+    def test_char_array(self):
+        self._output.write_char_array([six.unichr(0x00e7), six.u("a")])
+        self.assertEqual(bytearray(binascii.unhexlify("0000000200e70061")), self._output.to_byte_array())
+
     def test_char(self):
         pos = self._output._pos
         self._output.write_char(six.unichr(0x00e7))
         self.assertEqual(bytearray(binascii.unhexlify("00e70000000000000000")),  self._output._buffer[pos:pos + 10])
 
 
+    def test_zero_bytes_overwrite_reused_buffer(self):
+        output = _ObjectDataOutput(4, None, True)
+        output._buffer[:] = bytearray(b"\xff" * 4)
+        output.write_byte(1)
+        output.write_zero_bytes(5)
+        output.write_zero_bytes(-1)
+        self.assertEqual(bytearray(binascii.unhexlify("010000000000")), output.to_byte_array())
+
+
+class OutputPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.pool = _ObjectDataOutputPool(16, None, True, max_buffer_size=64, max_pool_size=2)
+
+    def test_output_is_reused(self):
+        out = self.pool.take()
+        out.write_int(1)
+        self.assertEqual(bytearray(binascii.unhexlify("00000001")), self.pool.to_byte_array(out))
+        self.pool.give(out)
+
+        self.assertIs(out, self.pool.take())
+        self.assertEqual(0, out.position())
+
+    def test_grown_buffer_is_kept_up_to_max_size(self):
+        out = self.pool.take()
+        out.write_from(bytearray(40))
+        buf = self.pool.to_byte_array(out)
+        self.pool.give(out)
+
+        self.assertEqual(40, len(buf))
+        self.assertIsNot(buf, out._buffer)
+        self.assertEqual(56, len(out._buffer))
+
+    def test_large_buffer_is_handed_over(self):
+        out = self.pool.take()
+        out.write_from(bytearray(100))
+        large_buffer = out._buffer
+        buf = self.pool.to_byte_array(out)
+        self.pool.give(out)
+
+        self.assertIs(large_buffer, buf)
+        self.assertEqual(100, len(buf))
+        self.assertEqual(16, len(out._buffer))
+
+    def test_large_buffer_is_trimmed_on_give(self):
+        out = self.pool.take()
+        out.write_from(bytearray(100))
+        self.pool.give(out)
+
+        self.assertEqual(16, len(out._buffer))
+
+    def test_max_pool_size(self):
+        outputs = [self.pool.take() for _ in range(3)]
+        for out in outputs:
+            self.pool.give(out)
+
+        self.assertEqual(2, len(self.pool))
+
+
 if __name__ == '__main__':
     unittest.main()
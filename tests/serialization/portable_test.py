@@ -473,3 +473,32 @@ class PortableSerializationTestCase(unittest.TestCase):
         portable2 = MyPortable2(1)
         data2 = ss.to_data(portable2)
         self.assertEqual(portable2, ss.to_object(data2))
+
+    def test_plans_are_compiled_once_per_class_definition(self):
+        config = _Config()
+        config.portable_factories = {
+            FACTORY_ID: the_factory
+        }
+        service = SerializationServiceV1(config)
+        plans = service._registry._portable_serializer._plans
+
+        obj = create_portable()
+        data = service.to_data(obj)
+        compiled_plans = dict(plans)
+        self.assertEqual(obj, service.to_object(service.to_data(obj)))
+        self.assertEqual(obj, service.to_object(data))
+
+        self.assertEqual(2, len(plans))
+        for key, plan in six.iteritems(compiled_plans):
+            self.assertIs(plan, plans[key])
+            self.assertEqual(key, (plan.class_def.factory_id, plan.class_def.class_id, plan.class_def.version))
+
+    def test_little_endian_portable(self):
+        config = _Config()
+        config.portable_factories = {
+            FACTORY_ID: the_factory
+        }
+        config.is_big_endian = False
+        service = SerializationServiceV1(config)
+        obj = create_portable()
+        self.assertEqual(obj, service.to_object(service.to_data(obj)))
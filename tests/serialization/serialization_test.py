@@ -1,10 +1,11 @@
 import unittest
 
+from hazelcast import six
 from hazelcast.config import _Config
-from hazelcast.core import Address
+from hazelcast.core import Address, HazelcastJsonValue
 from hazelcast.serialization.data import Data
 from hazelcast.serialization.service import SerializationServiceV1
-from hazelcast.six.moves import range
+from hazelcast.six.moves import range, cPickle
 
 
 class SerializationTestCase(unittest.TestCase):
@@ -81,3 +82,41 @@ class SerializationTestCase(unittest.TestCase):
         obj = 0
         obj2 = self.service.to_object(obj)
         self.assertEqual(obj, obj2)
+
+    def test_serialized_data_is_not_shared_between_calls(self):
+        small = self.service.to_data("a")
+        large = self.service.to_data(100000 * "b")
+        small_again = self.service.to_data("c")
+
+        self.assertEqual("a", self.service.to_object(small))
+        self.assertEqual(100000 * "b", self.service.to_object(large))
+        self.assertEqual("c", self.service.to_object(small_again))
+        self.assertEqual(small.total_size(), small_again.total_size())
+
+    def test_data_backed_by_view(self):
+        for obj in ["test", bytearray(b"byte array"), HazelcastJsonValue({"a": 1}), {"a": 1}]:
+            data = self.service.to_data(obj)
+            # Data received from the members is a view into a larger receive buffer
+            frame = bytearray(b"header") + data.to_bytes() + bytearray(b"trailer")
+            view = memoryview(frame)[6:6 + data.total_size()]
+            view_data = Data(view)
+            self.assertEqual(data, view_data)
+            self.assertEqual(hash(data), hash(view_data))
+            self.assertEqual(data.get_partition_hash(), view_data.get_partition_hash())
+            self.assertEqual(self.service.to_object(data), self.service.to_object(view_data))
+
+    def test_fast_paths_write_same_bytes_as_serializers(self):
+        for obj in [1, -1, 1 << 20, "", "test", six.u("\u00e7"), b"bytes", bytearray(b"byte array"), {"a": 1}]:
+            serializer = self.service._registry.serializer_for(obj)
+            expected = self.service._write_with_output(serializer, obj, 0)
+            self.assertEqual(expected, self.service.to_data(obj).to_bytes())
+
+    def test_binary_pickle_fast_path_writes_same_bytes_as_serializer(self):
+        for protocol in range(1, cPickle.HIGHEST_PROTOCOL + 1):
+            config = _Config()
+            config.pickle_protocol = protocol
+            service = SerializationServiceV1(config)
+            obj = {"a": 1, "b": bytearray(b"byte array"), "c": [b"bytes"]}
+            serializer = service._registry.serializer_for(obj)
+            expected = service._write_with_output(serializer, obj, 0)
+            self.assertEqual(expected, service.to_data(obj).to_bytes())
@@ -9,7 +9,15 @@ from hazelcast.config import IntType, _Config
 from hazelcast.errors import HazelcastSerializationError
 from hazelcast.serialization import BE_INT, MAX_BYTE, MAX_SHORT, MAX_INT, MAX_LONG
 from hazelcast.predicate import *
+from hazelcast.serialization.input import _ObjectDataInput
+from hazelcast.serialization.serialization_const import PYTHON_TYPE_PICKLE_BINARY, PYTHON_TYPE_NUMPY_ARRAY
 from hazelcast.serialization.service import SerializationServiceV1
+from hazelcast.six.moves import cPickle
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from tests.base import SingleMemberTestCase
 from tests.hzrc.ttypes import Lang
 from tests.util import random_string
@@ -83,6 +91,70 @@ class SerializersTest(unittest.TestCase):
     def test_python_object(self):
         self.validate(A(123))
 
+    def test_python_object_with_binary_pickle(self):
+        for protocol in range(1, cPickle.HIGHEST_PROTOCOL + 1):
+            config = _Config()
+            config.pickle_protocol = protocol
+            service = SerializationServiceV1(config)
+            obj = {"a": A(123), "b": bytearray(b"bytes"), "c": six.u("Iñtërnâtiônàlizætiøn")}
+
+            data = service.to_data(obj)
+            self.assertEqual(PYTHON_TYPE_PICKLE_BINARY, data.get_type())
+            self.assertEqual(obj, service.to_object(data))
+            # Objects pickled with any protocol can be read
+            self.assertEqual(obj, self.service.to_object(data))
+
+    @unittest.skipIf(cPickle.HIGHEST_PROTOCOL < 5, "Out-of-band buffers require pickle protocol 5")
+    def test_python_object_with_out_of_band_buffers(self):
+        config = _Config()
+        config.pickle_protocol = 5
+        service = SerializationServiceV1(config)
+        payload = bytearray(range(256)) * 1000
+        obj = (A(1), payload, cPickle.PickleBuffer(b"bytes"))
+
+        data = service.to_data(obj)
+        # The payload is written once, outside of the pickle
+        self.assertEqual(1, data.to_bytes().count(payload))
+        deserialized = service.to_object(data)
+        self.assertEqual(A(1), deserialized[0])
+        self.assertEqual(payload, deserialized[1])
+        self.assertEqual(b"bytes", bytes(deserialized[2]))
+
+    def test_primitive_arrays(self):
+        service = SerializationServiceV1(_Config())
+        for write, read, value in [("write_boolean_array", "read_boolean_array", [True, False, True]),
+                                   ("write_char_array", "read_char_array", [six.u("a"), six.unichr(0xfffd)]),
+                                   ("write_short_array", "read_short_array", [MAX_SHORT, -1, 0]),
+                                   ("write_int_array", "read_int_array", [MAX_INT, -1, 0]),
+                                   ("write_long_array", "read_long_array", [MAX_LONG, -1, 0]),
+                                   ("write_float_array", "read_float_array", [1.5, -2.0]),
+                                   ("write_double_array", "read_double_array", [1.5, -2.0] * 1000)]:
+            out = service._output_pool.take()
+            getattr(out, write)(value)
+            getattr(out, write)(None)
+            getattr(out, write)([])
+            inp = _ObjectDataInput(out.to_byte_array(), 0, service, True)
+            self.assertEqual(value, getattr(inp, read)())
+            self.assertIsNone(getattr(inp, read)())
+            self.assertEqual([], getattr(inp, read)())
+            service._output_pool.give(out)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_array(self):
+        for array in [numpy.arange(10000, dtype=numpy.float64),
+                      numpy.arange(12, dtype=">i4").reshape(3, 4).T,
+                      numpy.array(5.0),
+                      numpy.zeros((0, 3)),
+                      numpy.array([six.u("ab"), six.u("c")]),
+                      numpy.array([1, "x", None], dtype=object),
+                      numpy.zeros(3, dtype=[("a", "i4"), ("b", "f8")])]:
+            data = self.service.to_data(array)
+            self.assertEqual(PYTHON_TYPE_NUMPY_ARRAY, data.get_type())
+            deserialized = self.service.to_object(data)
+            self.assertEqual(array.dtype, deserialized.dtype)
+            self.assertEqual(array.shape, deserialized.shape)
+            self.assertTrue((array == deserialized).all())
+
     def test_predicates(self):
         self.validate_predicate(sql("test"))
         self.validate_predicate(and_(true(), true()))
@@ -431,3 +503,7 @@ class SerializersLiveTest(SingleMemberTestCase):
         response = self.rc.executeOnController(self.cluster.id, script, Lang.JAVASCRIPT)
         self.assertTrue(response.success)
         self.assertEqual(["a", "b", "c"], self.map.get("key"))
+
+    def test_object_array_from_server(self):
+        self.assertTrue(self.set_on_server("Java.to([\"a\", 1, null], \"java.lang.Object[]\")"))
+        self.assertEqual(["a", 1, None], self.map.get("key"))
@@ -2,7 +2,12 @@ import os
 import time
 
 from uuid import uuid4
+
+from mock import MagicMock
+
 from hazelcast.config import SSLProtocol
+from hazelcast.invocation import InvocationService
+from hazelcast.serialization import SerializationServiceV1
 
 
 def random_string():
@@ -86,3 +91,21 @@ def open_connection_to_address(client, uuid):
     m.put(key, 0)
     m.destroy()
 
+
+class MockProxyContext(object):
+    """Proxy context with a real invocation service over a mocked client.
+
+    Invocations are registered and counted but never sent anywhere.
+    """
+    def __init__(self, config):
+        client = MagicMock(config=config)
+        self.config = config
+        self.serialization_service = SerializationServiceV1(config)
+        self.invocation_service = InvocationService(client, client._reactor)
+        self.invocation_service.init(client._internal_partition_service, client._connection_manager,
+                                     client._listener_service)
+        self.invocation_service.start()
+        self.partition_service = MagicMock(get_partition_count=MagicMock(return_value=3),
+                                           get_partition_id=MagicMock(return_value=0))
+        self.listener_service = MagicMock()
+        self.lock_reference_id_generator = None
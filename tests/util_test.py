@@ -1,6 +1,8 @@
 from hazelcast.config import IndexConfig, IndexUtil, IndexType, QueryConstants, \
     UniqueKeyTransformation
-from hazelcast.util import calculate_version
+from hazelcast.config import _Config
+from hazelcast.serialization import SerializationServiceV1
+from hazelcast.util import calculate_version, ImmutableLazyDataList
 from unittest import TestCase
 
 
@@ -86,3 +88,77 @@ class IndexUtilTest(TestCase):
         normalized = IndexUtil.validate_and_normalize("map", config)
         self.assertEqual(bio["unique_key"], normalized.bitmap_index_options.unique_key)
         self.assertEqual(bio["unique_key_transformation"], normalized.bitmap_index_options.unique_key_transformation)
+
+
+class ImmutableLazyDataListTest(TestCase):
+    def setUp(self):
+        self.service = SerializationServiceV1(_Config())
+        self.to_object_count = 0
+
+    def to_object(self, data):
+        self.to_object_count += 1
+        return self.service.to_object(data)
+
+    def create_list(self, items):
+        return ImmutableLazyDataList([self.service.to_data(item) for item in items], self.to_object)
+
+    def create_entry_list(self, entries):
+        return ImmutableLazyDataList([(self.service.to_data(k), self.service.to_data(v)) for k, v in entries],
+                                     self.to_object)
+
+    def test_items_are_deserialized_once(self):
+        lazy_list = self.create_list([0, "", None, 3])
+        self.assertEqual([0, "", None, 3], [lazy_list[i] for i in range(4)])
+        self.assertEqual([0, "", None, 3], list(lazy_list))
+        self.assertEqual(4, self.to_object_count)
+        # The serialized forms are released once the items are deserialized
+        self.assertEqual([0, "", None, 3], lazy_list._list_data)
+
+    def test_slice_and_negative_index(self):
+        lazy_list = self.create_list([1, 2, 3, 4])
+        self.assertEqual(4, lazy_list[-1])
+        self.assertEqual([2, 4], lazy_list[1::2])
+        self.assertEqual(2, self.to_object_count)
+
+    def test_equality(self):
+        lazy_list = self.create_list([1, 2, 3])
+        self.assertNotEqual([1, 2], lazy_list)
+        self.assertEqual(0, self.to_object_count)
+        self.assertNotEqual([5, 2, 3], lazy_list)
+        self.assertEqual(1, self.to_object_count)
+        self.assertEqual([1, 2, 3], lazy_list)
+        self.assertEqual(self.create_list([1, 2, 3]), lazy_list)
+        self.assertNotEqual((1, 2, 3), lazy_list)
+        self.assertEqual("[1, 2, 3]", repr(lazy_list))
+
+    def test_drain(self):
+        lazy_list = self.create_list([1, 2, 3])
+        self.assertEqual(1, lazy_list[0])
+        items = lazy_list.drain()
+        self.assertEqual(0, len(lazy_list))
+        self.assertEqual([1, 2, 3], list(items))
+        self.assertEqual(3, self.to_object_count)
+
+    def test_drain_releases_consumed_items(self):
+        data_list = [self.service.to_data(i) for i in range(3)]
+        items = ImmutableLazyDataList(data_list, self.to_object).drain()
+        self.assertEqual(0, next(items))
+        self.assertEqual([None, data_list[1], data_list[2]], data_list)
+
+    def test_to_list(self):
+        lazy_list = self.create_list([1, 2])
+        result = lazy_list.to_list()
+        self.assertEqual([1, 2], result)
+        self.assertIsInstance(result, list)
+
+    def test_to_columns(self):
+        self.assertEqual((["a", "b"], [1, 2]), self.create_entry_list([("a", 1), ("b", 2)]).to_columns())
+        self.assertEqual(([1, 2],), self.create_list([1, 2]).to_columns())
+        self.assertEqual(([],), self.create_list([]).to_columns())
+
+    def test_to_columns_with_tuple_items(self):
+        lazy_list = self.create_list([(1, 2, 3), (4, 5)])
+        self.assertEqual(([(1, 2, 3), (4, 5)],), lazy_list.to_columns())
+        self.assertEqual(([(1, 2), (3, 4)],), self.create_list([(1, 2), (3, 4)]).to_columns())
+        entry_list = self.create_entry_list([("a", (1, 2)), ("b", (3, 4))])
+        self.assertEqual((["a", "b"], [(1, 2), (3, 4)]), entry_list.to_columns())